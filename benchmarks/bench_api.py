@@ -0,0 +1,199 @@
+# benchmarks/bench_api.py
+"""
+로컬 API 서버 처리량 벤치마크 (modules/api_server.py, 127.0.0.1)
+
+- 합성 데이터(benchmarks/dataset.py)로 서버를 별도 프로세스에서 띄우고(--port 0),
+  keep-alive 연결 여러 개로 요청을 동시에 보내 초당 요청 수(rps)와 지연 시간(p50/p99)을 측정
+- 읽기: 사용자 조회 / 부분 검색 / 전화번호 로그 조회, 쓰기: 이용 추가 (동시 요청은 서버가 모아서 저장)
+- 결과 형식은 bench_core.py와 같음 (benchmarks/compare.py로 커밋 간 비교)
+
+실행:
+    python benchmarks/bench_api.py
+    python benchmarks/bench_api.py --users 10000 100000 --clients 1 16 --out api.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import REPO_ROOT, Recorder, log, report_meta  # noqa: E402
+from dataset import write_dataset  # noqa: E402
+
+# 측정 항목별 전체 요청 수
+READ_REQUESTS = 5_000
+WRITE_REQUESTS = 200
+HISTORY_REQUESTS = 500
+# 서버 시작을 기다리는 최대 시간(초)
+START_TIMEOUT_S = 120
+
+
+# ---------------------------------------------------------
+# HTTP 클라이언트 (keep-alive 연결 1개)
+# ---------------------------------------------------------
+class Client:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, port: int) -> "Client":
+        return cls(*await asyncio.open_connection("127.0.0.1", port))
+
+    async def request(self, method: str, path: str, body: dict | None = None) -> tuple[int, bytes]:
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Length: {len(data)}\r\n\r\n".encode("latin-1")
+            + data
+        )
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, await self.reader.readexactly(length)
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def run_load(port: int, clients: int, requests: list[tuple[str, str, dict | None]]) -> tuple[float, list[float]]:
+    """requests를 clients개 연결로 나눠 동시에 보냄 → (전체 소요 시간, 요청별 지연 시간 목록)"""
+    conns = [await Client.connect(port) for _ in range(clients)]
+    latencies: list[float] = []
+
+    async def worker(conn: Client, share):
+        for method, path, body in share:
+            started = time.perf_counter()
+            status, payload = await conn.request(method, path, body)
+            latencies.append(time.perf_counter() - started)
+            if status >= 500:
+                raise RuntimeError(f"{method} {path} → {status} {payload[:200]!r}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(conn, requests[i::clients]) for i, conn in enumerate(conns)))
+    elapsed = time.perf_counter() - started
+    for conn in conns:
+        await conn.close()
+    return elapsed, latencies
+
+
+def percentile_ms(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] * 1000, 3)
+
+
+# ---------------------------------------------------------
+# 서버 프로세스
+# ---------------------------------------------------------
+def start_server(base_dir: Path) -> tuple[subprocess.Popen, int]:
+    env = {**os.environ, "CPM_DATA_DIR": str(base_dir), "PYTHONPATH": str(REPO_ROOT / "src")}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "modules.api_server", "--port", "0"],
+        cwd=REPO_ROOT / "src", env=env, stdout=subprocess.PIPE, text=True,
+    )
+    deadline = time.perf_counter() + START_TIMEOUT_S
+    while time.perf_counter() < deadline:
+        line = proc.stdout.readline()
+        if not line:
+            break
+        if line.startswith("listening on "):
+            return proc, int(line.rsplit(":", 1)[1])
+    proc.kill()
+    raise RuntimeError("API 서버 시작 실패")
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    # 대기 중인 쓰기까지 저장하고 끝나도록 Ctrl+C와 같은 신호 (Windows는 바로 종료)
+    if os.name == "posix":
+        proc.send_signal(signal.SIGINT)
+    else:
+        proc.terminate()
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+# ---------------------------------------------------------
+# 크기 하나 측정
+# ---------------------------------------------------------
+def run_size(n_users: int, n_history: int, client_counts: list[int], seed: int) -> list[dict]:
+    log(f"\n== users={n_users:,} history={n_history:,}")
+    rng = random.Random(seed)
+    base_dir = Path(tempfile.mkdtemp(prefix="cpm-bench-api-"))
+    rec = Recorder(n_users, n_history)
+    try:
+        phones = list(write_dataset(base_dir, n_users, n_history, seed))
+        started = time.perf_counter()
+        proc, port = start_server(base_dir)
+        rec.add("api", "server_start", time.perf_counter() - started)
+        try:
+            suites = {
+                "get_user": lambda: [("GET", f"/users/{rng.choice(phones)}", None) for _ in range(READ_REQUESTS)],
+                "search_4digits": lambda: [("GET", f"/users?q={rng.choice(phones)[-4:]}&limit=20", None)
+                                           for _ in range(READ_REQUESTS)],
+                "history_phone": lambda: [("GET", f"/history?phone={rng.choice(phones)}&limit=20", None)
+                                          for _ in range(HISTORY_REQUESTS)],
+                "post_usage": lambda: [("POST", "/usage", {"phone": rng.choice(phones), "activity_1": 1})
+                                       for _ in range(WRITE_REQUESTS)],
+            }
+            # 인덱스 준비 (첫 로그 조회는 인덱스 생성 시간 포함)
+            elapsed, _ = asyncio.run(run_load(port, 1, [("GET", f"/history?phone={phones[0]}&limit=1", None)]))
+            rec.add("api", "history_first_query", elapsed)
+
+            for clients in client_counts:
+                for name, make in suites.items():
+                    requests = make()
+                    elapsed, latencies = asyncio.run(run_load(port, clients, requests))
+                    rec.add("api", f"{name}_c{clients}", elapsed, len(requests), clients=clients,
+                            rps=round(len(requests) / elapsed, 1),
+                            p50_ms=percentile_ms(latencies, 50), p99_ms=percentile_ms(latencies, 99))
+        finally:
+            stop_server(proc)
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
+    return rec.results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 API 서버 처리량 벤치마크 (JSON 출력)")
+    parser.add_argument("--users", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--history", type=int, nargs="+", default=None,
+                        help="--users와 같은 개수 (생략 시 사용자 수의 10배)")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16], help="동시 연결 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=Path, help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    histories = args.history or [n * 10 for n in args.users]
+    if len(histories) != len(args.users):
+        parser.error("--history는 --users와 같은 개수로 지정해야 합니다")
+
+    results = []
+    for n_users, n_history in zip(args.users, histories):
+        results.extend(run_size(n_users, n_history, args.clients, args.seed))
+
+    report = {"meta": report_meta(args.seed, benchmark="api"), "results": results}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
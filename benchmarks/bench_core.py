@@ -0,0 +1,291 @@
+# benchmarks/bench_core.py
+"""
+핵심 경로 벤치마크 (저장소 / 계산 / 지급 / 검색 / 대시보드 표시 값 계산 / 로그 기록)
+
+- 합성 데이터(benchmarks/dataset.py)를 임시 폴더에 만들고 CPM_DATA_DIR로 앱 모듈이 그 폴더를 쓰게 함
+- Qt 창을 만들지 않음 (QtCore만 import)
+- 결과는 JSON으로 stdout에 출력 (진행 상황은 stderr), --out 지정 시 파일로도 저장
+
+실행:
+    python benchmarks/bench_core.py
+    python benchmarks/bench_core.py --users 1000 100000 1000000 --history 10000 1000000 10000000 --out results.json
+    python benchmarks/bench_core.py --only storage dashboard
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import queue
+import random
+import shutil
+import sys
+import tempfile
+import time
+from logging.handlers import QueueListener
+from pathlib import Path
+from types import SimpleNamespace
+
+# 앱 모듈은 import 시점에 데이터 경로를 정하므로 먼저 설정 (지정하지 않았으면 임시 폴더, 끝나면 삭제)
+_OWN_BASE_DIR = "CPM_DATA_DIR" not in os.environ
+_BASE_DIR = Path(os.environ.setdefault("CPM_DATA_DIR", tempfile.mkdtemp(prefix="cpm-bench-")))
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from common import Recorder, log, measure, report_meta  # noqa: E402
+from dataset import DEFAULT_SEED, write_dataset  # noqa: E402
+from logger import _PreparedQueueHandler, build_file_handler  # noqa: E402
+from modules import storage  # noqa: E402
+from modules.calculator import add_usage, split_eligible, COUNTS_FOR_REWARD  # noqa: E402
+from modules.controller import Controller  # noqa: E402
+from modules.history_index import HistoryIndex  # noqa: E402
+from modules.projection import UserProjection, get_user_projection  # noqa: E402
+from modules.reconcile import ReconcileResult, history_point_sums  # noqa: E402
+from modules.rewards import compute_reward_batch, commit_reward_batch  # noqa: E402
+from modules.search_index import PhoneSearchIndex  # noqa: E402
+from modules.snapshot import capture_snapshot_values, load_snapshot, source_signature, write_snapshot  # noqa: E402
+from modules.stats import HistoryStats  # noqa: E402
+from modules.user_query import UserIndexes, UserQuery  # noqa: E402
+
+SUITES = ("storage", "calculator", "rewards", "search", "dashboard", "logging")
+# 1건씩 반복하는 측정의 반복 횟수
+APPEND_OPS = 200
+USAGE_OPS = 10_000
+SEARCH_QUERIES = 200
+VISIBLE_ROWS = 50
+LOG_OPS = 20_000
+
+
+# ---------------------------------------------------------
+# suite별 측정
+# ---------------------------------------------------------
+def bench_storage(rec: Recorder, ctx: SimpleNamespace) -> None:
+    seconds, users = measure(storage.load_users)
+    rec.add("storage", "load_users", seconds)
+    ctx.users = users
+
+    seconds, _ = measure(lambda: storage.save_users(users))
+    rec.add("storage", "save_users", seconds)
+
+    phones = list(users)
+    rng = random.Random(DEFAULT_SEED)
+    entries = [{"type": "usage", "phone": rng.choice(phones), "activity_1": 1, "activity_2": 0} for _ in range(APPEND_OPS)]
+    seconds, _ = measure(lambda: [storage.save_history(dict(entry)) for entry in entries])
+    rec.add("storage", "save_history", seconds, ops=APPEND_OPS)
+
+    seconds, _ = measure(lambda: storage.save_history_many([dict(entry) for entry in entries]))
+    rec.add("storage", "save_history_many", seconds, ops=APPEND_OPS)
+
+    def first_page():
+        records = storage.iter_history_reverse()
+        return sum(1 for _ in zip(range(200), records))
+    seconds, _ = measure(first_page, repeat=3)
+    rec.add("storage", "history_first_page", seconds, ops=200)
+
+    data_dir = storage.DATA_DIR
+    for name, cls in (("history_index_build", HistoryIndex), ("stats_build", HistoryStats)):
+        follower = cls(storage.HISTORY_FILE, data_dir / f"bench.{name}.json")
+        seconds, added = measure(follower.rebuild)
+        rec.add("storage", name, seconds, ops=added)
+        (data_dir / f"bench.{name}.json").unlink(missing_ok=True)
+
+    # 이벤트 기록(로그 한 줄 + fsync) / 체크포인트 저장 / 시작 시 체크포인트 이후 이벤트 재생
+    checkpoint_path = data_dir / "bench.checkpoint.json"
+    projection = UserProjection(storage.HISTORY_FILE, checkpoint_path, checkpoint_every=10 ** 9)
+    projection.reset({phone: dict(data) for phone, data in users.items()})
+    seconds, _ = measure(projection.save)
+    rec.add("storage", "projection_checkpoint", seconds)
+
+    def append_events():
+        for entry in entries:
+            phone = entry["phone"]
+            single = {phone: dict(projection.users[phone])} if phone in projection.users else {}
+            add_usage(single, phone, 1, 0)
+            projection.append([dict(entry)], changed=single)
+    seconds, _ = measure(append_events)
+    rec.add("storage", "projection_append", seconds, ops=APPEND_OPS)
+
+    def load_with_replay():
+        replayed = UserProjection(storage.HISTORY_FILE, checkpoint_path, checkpoint_every=10 ** 9)
+        replayed.load()
+        return replayed
+    seconds, replayed = measure(load_with_replay)
+    rec.add("storage", "projection_load_replay", seconds, ops=replayed.replayed, users=len(replayed.users))
+    checkpoint_path.unlink(missing_ok=True)
+
+    # total_points 대조용 전화번호별 지급 합계 (로그 한 번 읽기, 작업자 수는 CPU 수)
+    history_end = storage.HISTORY_FILE.stat().st_size
+    scanned = ReconcileResult()
+    seconds, sums = measure(lambda: history_point_sums(storage.HISTORY_FILE, history_end, result=scanned))
+    rec.add("storage", "reconcile_sums", seconds, ops=scanned.history_lines, phones=len(sums), workers=scanned.workers)
+
+
+def bench_calculator(rec: Recorder, ctx: SimpleNamespace) -> None:
+    users = {phone: dict(data) for phone, data in ctx.users.items()}
+    phones = list(users)
+    rng = random.Random(DEFAULT_SEED)
+    targets = [rng.choice(phones) for _ in range(USAGE_OPS)]
+    seconds, _ = measure(lambda: [add_usage(users, phone, 1, 0) for phone in targets])
+    rec.add("calculator", "add_usage", seconds, ops=USAGE_OPS)
+
+    seconds, (eligible, _) = measure(lambda: split_eligible(ctx.users, phones, COUNTS_FOR_REWARD))
+    rec.add("calculator", "split_eligible", seconds, ops=len(phones))
+    ctx.eligible = eligible
+
+
+def bench_rewards(rec: Recorder, ctx: SimpleNamespace) -> None:
+    eligible = ctx.eligible if hasattr(ctx, "eligible") else \
+        split_eligible(ctx.users, list(ctx.users), COUNTS_FOR_REWARD)[0]
+    seconds, result = measure(lambda: compute_reward_batch(ctx.users, eligible))
+    rec.add("rewards", "compute_reward_batch", seconds, ops=max(1, len(eligible)))
+
+    batch_entry = {"type": "reward_batch", "selected": len(eligible), "eligible": len(eligible), "excluded": 0}
+    # 다른 suite가 로그를 직접 추가했으므로 지금 로그 끝을 기준으로 다시 시작 (측정 제외)
+    get_user_projection().reset(ctx.users)
+    seconds, users = measure(lambda: commit_reward_batch(result, batch_entry))
+    rec.add("rewards", "commit_reward_batch", seconds, ops=max(1, len(eligible)))
+    ctx.users = users
+
+
+def bench_search(rec: Recorder, ctx: SimpleNamespace) -> None:
+    phones = list(ctx.users)
+    seconds, index = measure(lambda: PhoneSearchIndex(phones))
+    rec.add("search", "index_build", seconds, ops=len(phones))
+    ctx.search_index = index
+
+    rng = random.Random(DEFAULT_SEED)
+    queries = [rng.choice(phones)[-4:] for _ in range(SEARCH_QUERIES)]
+    seconds, hits = measure(lambda: sum(len(index.search(q)) for q in queries), repeat=3)
+    rec.add("search", "query_last4", seconds, ops=SEARCH_QUERIES, hits=hits)
+
+    seconds, hits = measure(lambda: sum(1 for q in queries[:20] for p in phones if q in p))
+    rec.add("search", "linear_scan_last4", seconds, ops=20, hits=hits)
+
+
+def bench_dashboard(rec: Recorder, ctx: SimpleNamespace) -> None:
+    users = ctx.users
+    seconds, indexes = measure(lambda: UserIndexes(users))
+    rec.add("dashboard", "user_indexes_build", seconds, ops=len(users))
+
+    index = ctx.search_index if hasattr(ctx, "search_index") else PhoneSearchIndex(users)
+    query = UserQuery(needs_reward=True, sort_key="total_points", descending=True)
+    seconds, phones = measure(lambda: indexes.query(query, users, None, index.ordered), repeat=3)
+    rec.add("dashboard", "query_filter_sort", seconds, rows=len(phones))
+
+    # Controller._build_display_row는 users/selected_phones만 사용 → View 없이 호출
+    controller = SimpleNamespace(users=users, selected_phones=set())
+    build_row = Controller._build_display_row
+    visible = list(users)[:VISIBLE_ROWS]
+    seconds, _ = measure(lambda: [build_row(controller, phone) for phone in visible], repeat=5)
+    rec.add("dashboard", "visible_rows", seconds, ops=len(visible))
+
+    # 화면에 보이는 행과 무관하게 전체를 계산하던 방식 (_prepare_display_data 대응)
+    seconds, _ = measure(lambda: [build_row(controller, phone) for phone in users])
+    rec.add("dashboard", "full_projection", seconds, ops=len(users))
+
+    seconds, values = measure(lambda: capture_snapshot_values(users))
+    rec.add("dashboard", "snapshot_capture", seconds, ops=len(users))
+    seconds, _ = measure(lambda: write_snapshot(values, source_signature()))
+    rec.add("dashboard", "snapshot_write", seconds, ops=len(users))
+    seconds, snapshot = measure(load_snapshot)
+    rec.add("dashboard", "snapshot_load", seconds, ops=len(snapshot) if snapshot else 0)
+
+
+def bench_logging(rec: Recorder, ctx: SimpleNamespace) -> None:
+    # 호출한 스레드가 logger.info에 쓰는 시간: 파일에 바로 쓰기(이전 방식) vs 큐에 넣기(setup_logging)
+    phones = list(ctx.users)[:100] or ["01000000000"]
+    log_path = storage.DATA_DIR / "bench.app.log"
+    bench_logger = logging.getLogger("bench.logging")
+    bench_logger.propagate = False
+    bench_logger.setLevel(logging.INFO)
+
+    def emit():
+        for i in range(LOG_OPS):
+            bench_logger.info("Usage added: %s a1=%d a2=%d", phones[i % len(phones)], 1, 0)
+
+    for name, json_format in (("sync_text", False), ("sync_json", True)):
+        handler = build_file_handler(log_path, json_format=json_format)
+        bench_logger.addHandler(handler)
+        seconds, _ = measure(emit)
+        bench_logger.removeHandler(handler)
+        handler.close()
+        rec.add("logging", name, seconds, ops=LOG_OPS)
+
+    for name, json_format in (("queued_text", False), ("queued_json", True)):
+        log_queue = queue.SimpleQueue()
+        handler = build_file_handler(log_path, json_format=json_format)
+        listener = QueueListener(log_queue, handler)
+        listener.start()
+        queue_handler = _PreparedQueueHandler(log_queue)
+        bench_logger.addHandler(queue_handler)
+        seconds, _ = measure(emit)
+        bench_logger.removeHandler(queue_handler)
+        started = time.perf_counter()
+        listener.stop()
+        rec.add("logging", name, seconds, ops=LOG_OPS, drain_seconds=round(time.perf_counter() - started, 6))
+        handler.close()
+
+    for path in storage.DATA_DIR.glob("bench.app.log*"):
+        path.unlink()
+
+
+BENCHES = {
+    "storage": bench_storage,
+    "calculator": bench_calculator,
+    "rewards": bench_rewards,
+    "search": bench_search,
+    "dashboard": bench_dashboard,
+    "logging": bench_logging,
+}
+
+
+def run(n_users: int, n_history: int, suites, seed: int) -> list[dict]:
+    log(f"\n== users={n_users:,} history={n_history:,} (data={_BASE_DIR / 'data'})")
+    started = time.perf_counter()
+    write_dataset(_BASE_DIR, n_users, n_history, seed)
+    for derived in ("history.idx.json", "stats.json", "dashboard.snapshot", "users.checkpoint.json"):
+        (storage.DATA_DIR / derived).unlink(missing_ok=True)
+    log(f"  dataset generated in {time.perf_counter() - started:.1f}s")
+
+    rec = Recorder(n_users, n_history)
+    ctx = SimpleNamespace(users=storage.load_users())
+    for suite in SUITES:
+        if suite in suites:
+            BENCHES[suite](rec, ctx)
+    return rec.results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핵심 경로 벤치마크 (JSON 출력)")
+    parser.add_argument("--users", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--history", type=int, nargs="+", default=None,
+                        help="--users와 같은 개수 (생략 시 사용자 수의 10배)")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out", type=Path, help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    histories = args.history or [n * 10 for n in args.users]
+    if len(histories) != len(args.users):
+        parser.error("--history는 --users와 같은 개수로 지정해야 합니다")
+
+    results = []
+    try:
+        for n_users, n_history in zip(args.users, histories):
+            results.extend(run(n_users, n_history, args.only, args.seed))
+    finally:
+        if _OWN_BASE_DIR:
+            shutil.rmtree(_BASE_DIR, ignore_errors=True)
+
+    report = {"meta": report_meta(args.seed, benchmark="core"), "results": results}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_search.py
+"""
+전화번호 검색 벤치마크 (선형 스캔 vs PhoneSearchIndex)
+
+실행:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --sizes 100000 1000000 --queries 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from modules.search_index import PhoneSearchIndex  # noqa: E402
+
+
+def make_phones(n: int, seed: int = 42) -> list[str]:
+    """010으로 시작하는 11자리 전화번호 n개를 결정적으로 생성한다."""
+    rng = random.Random(seed)
+    phones = set()
+    while len(phones) < n:
+        phones.add(f"010{rng.randrange(10**8):08d}")
+    return list(phones)
+
+
+def linear_search(phones, keyword):
+    """기존 _prepare_display_data 방식의 부분 문자열 스캔"""
+    return [phone for phone in phones if keyword in phone]
+
+
+def timeit(fn, queries):
+    start = time.perf_counter()
+    hits = 0
+    for q in queries:
+        hits += len(fn(q))
+    elapsed = time.perf_counter() - start
+    return elapsed / len(queries) * 1000, hits / len(queries)
+
+
+def run(size: int, n_queries: int):
+    phones = make_phones(size)
+    rng = random.Random(size)
+
+    start = time.perf_counter()
+    index = PhoneSearchIndex(phones)
+    build_s = time.perf_counter() - start
+
+    samples = [rng.choice(phones) for _ in range(n_queries)]
+    cases = {
+        "last4": [p[-4:] for p in samples],
+        "mid6": [p[4:10] for p in samples],
+        "prefix3": ["010"] * max(1, n_queries // 20),
+    }
+
+    print(f"\n== users={size:,}  index build={build_s:.2f}s")
+    print(f"{'query':<8} {'hits/q':>10} {'linear ms/q':>12} {'index ms/q':>12} {'speedup':>8}")
+    for name, queries in cases.items():
+        lin_ms, hits = timeit(lambda q: linear_search(phones, q), queries)
+        idx_ms, idx_hits = timeit(index.search, queries)
+        assert hits == idx_hits, f"{name}: 결과 불일치 ({hits} != {idx_hits})"
+        print(f"{name:<8} {hits:>10.1f} {lin_ms:>12.3f} {idx_ms:>12.3f} {lin_ms / idx_ms:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전화번호 검색 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+# benchmarks/bench_ui.py
+"""
+Qt 화면 벤치마크 (메인 테이블 / 로그 다이얼로그, QT_QPA_PLATFORM=offscreen)
+
+- 합성 데이터(benchmarks/dataset.py)로 MainWindow + Controller, LogDialog를 실제로 띄워
+  표시 / 행 갱신 / 필터·정렬 / 끝까지 스크롤 시간을 측정 (그리기는 viewport().repaint()로 동기 실행)
+- 크기마다 별도 프로세스에서 실행 → 측정 항목별 최대 메모리(peak_rss_kb)를 크기끼리 섞지 않음
+- 결과 형식은 bench_core.py와 같음 (benchmarks/compare.py로 커밋 간 비교)
+
+실행:
+    python benchmarks/bench_ui.py
+    python benchmarks/bench_ui.py --users 10000 200000 --out ui.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import Recorder, log, measure, report_meta  # noqa: E402
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+# 행 갱신 측정에서 바꿀 사용자 수
+REFRESH_USERS = 100
+# 로그 다이얼로그에서 끝까지 스크롤해 읽을 페이지 수
+LOG_SCROLL_PAGES = 10
+# 작업 스레드 결과를 기다리는 최대 시간(초)
+WAIT_TIMEOUT_S = 300
+
+
+def peak_rss_kb() -> int | None:
+    """이 프로세스의 지금까지 최대 메모리 사용량(KB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak   # macOS는 byte 단위
+
+
+# ---------------------------------------------------------
+# 자식 프로세스: 크기 하나 측정
+# ---------------------------------------------------------
+def run_child(n_users: int, n_history: int, seed: int) -> list[dict]:
+    # 앱 모듈 import 전에 데이터 경로/플랫폼 지정 (부모가 환경 변수로 전달)
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+    from dataset import write_dataset
+    from PySide6.QtCore import QEventLoop
+    from PySide6.QtWidgets import QApplication
+
+    write_dataset(Path(os.environ["CPM_DATA_DIR"]), n_users, n_history, seed)
+
+    app = QApplication([])
+    from modules.controller import Controller
+    from ui.main_window_view import MainWindow
+
+    rec = Recorder(n_users, n_history)
+
+    def add(name, seconds, ops=1, **extra):
+        rec.add("ui", name, seconds, ops, peak_rss_kb=peak_rss_kb(), **extra)
+
+    def wait_until(condition):
+        deadline = time.perf_counter() + WAIT_TIMEOUT_S
+        while not condition():
+            if time.perf_counter() > deadline:
+                raise TimeoutError("작업 스레드 응답 없음")
+            app.processEvents(QEventLoop.AllEvents, 10)
+
+    # --- 메인 창 ---
+    def open_main():
+        view = MainWindow()
+        controller = Controller(view)   # users.json 로드 + 인덱스 생성 포함
+        view.connect_controller(controller)
+        view.show()
+        app.processEvents()
+        view.repaint()
+        return view, controller
+    # 처음에는 통계 집계 생성(로그 전체 1회 읽기) 포함, 두 번째는 이미 만든 집계 사용
+    seconds, (view, controller) = measure(open_main)
+    add("main_window_open_cold", seconds)
+    view.close()
+    seconds, (view, controller) = measure(open_main)
+    add("main_window_open", seconds)
+    table = view.ui.tableUsers
+
+    def paint_table():
+        table.viewport().repaint()
+
+    seconds, _ = measure(lambda: (controller.update_dashboard_command(), paint_table()), repeat=3)
+    add("render_user_list", seconds, rows=len(controller.users))
+
+    rng = random.Random(seed)
+    phones = list(controller.users)
+    changed = rng.sample(phones, min(REFRESH_USERS, len(phones)))
+
+    def refresh_rows():
+        for phone in changed:
+            controller.users[phone]["activity_1"] = controller.users[phone].get("activity_1", 0) + 1
+            controller._index_user(phone)
+        controller.update_rows_command(updated=changed)
+        paint_table()
+    seconds, _ = measure(refresh_rows)
+    add("refresh_rows", seconds, ops=len(changed))
+
+    def filter_sort():
+        controller.query.needs_reward = True
+        controller.sort_by_column(7)   # 총 포인트
+        paint_table()
+    seconds, _ = measure(filter_sort)
+    add("filter_sort", seconds, rows=view.user_model.rowCount())
+    controller.query.needs_reward = False
+    controller.query.sort_key = None
+    controller.update_dashboard_command()
+
+    def scroll_to_end():
+        table.scrollToBottom()
+        paint_table()
+    seconds, _ = measure(scroll_to_end)
+    add("main_scroll_to_end", seconds)
+
+    keyword = rng.choice(phones)[-4:]
+
+    def type_search():
+        # 한 글자씩 입력할 때마다 검색 (debounce 없이 최악의 경우)
+        for length in range(1, len(keyword) + 1):
+            view.ui.searchInput.blockSignals(True)
+            view.ui.searchInput.setText(keyword[:length])
+            view.ui.searchInput.blockSignals(False)
+            controller.filter_table()
+            paint_table()
+    seconds, _ = measure(type_search)
+    add("search_typing", seconds, ops=len(keyword))
+
+    seconds, _ = measure(controller._update_column_widths, repeat=3)
+    add("column_widths", seconds)
+
+    # --- 로그 다이얼로그 ---
+    seconds, dialog = measure(lambda: controller._get_dialog("log"))
+    add("log_dialog_create", seconds)
+    dialog.show()
+    model = dialog.log_model
+    logs = dialog.ui.tableLogs
+
+    def first_page():
+        dialog.reset()
+        wait_until(lambda: not model.is_loading())
+        logs.viewport().repaint()
+        return model.rowCount()
+    # 처음에는 히스토리 인덱스 생성 포함, 두 번째부터는 저장된 인덱스 사용
+    seconds, rows = measure(first_page)
+    add("log_first_page_cold", seconds, rows=rows)
+    seconds, rows = measure(first_page, repeat=3)
+    add("log_first_page", seconds, rows=rows)
+
+    def scroll_pages():
+        pages = 0
+        while pages < LOG_SCROLL_PAGES and model.canFetchMore():
+            logs.scrollToBottom()
+            model.fetchMore()
+            wait_until(lambda: not model.is_loading())
+            logs.viewport().repaint()
+            pages += 1
+        return pages
+    seconds, pages = measure(scroll_pages)
+    add("log_scroll_pages", seconds, ops=max(1, pages), rows=model.rowCount())
+
+    def filter_phone():
+        dialog.ui.lineLogPhone.setText(rng.choice(phones))
+        dialog.load_log_table()
+        wait_until(lambda: not model.is_loading())
+        logs.viewport().repaint()
+        return model.rowCount()
+    seconds, rows = measure(filter_phone, repeat=3)
+    add("log_filter_phone", seconds, rows=rows)
+
+    dialog.done(0)
+    view.close()
+    return rec.results
+
+
+# ---------------------------------------------------------
+# 부모 프로세스: 크기별 자식 실행 후 결과 합치기
+# ---------------------------------------------------------
+def run_size(n_users: int, n_history: int, seed: int) -> list[dict]:
+    log(f"\n== users={n_users:,} history={n_history:,}")
+    base_dir = Path(tempfile.mkdtemp(prefix="cpm-bench-ui-"))
+    env = {**os.environ, "QT_QPA_PLATFORM": "offscreen", "CPM_DATA_DIR": str(base_dir)}
+    try:
+        completed = subprocess.run(
+            [sys.executable, __file__, "--child", str(n_users), str(n_history), "--seed", str(seed)],
+            env=env, stdout=subprocess.PIPE, check=True,
+        )
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
+    return json.loads(completed.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Qt 화면 벤치마크 (offscreen, JSON 출력)")
+    parser.add_argument("--users", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--history", type=int, nargs="+", default=None,
+                        help="--users와 같은 개수 (생략 시 사용자 수의 10배)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=Path, help="결과 JSON 파일 경로")
+    parser.add_argument("--child", type=int, nargs=2, metavar=("USERS", "HISTORY"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(*args.child, args.seed)))
+        return
+
+    histories = args.history or [n * 10 for n in args.users]
+    if len(histories) != len(args.users):
+        parser.error("--history는 --users와 같은 개수로 지정해야 합니다")
+
+    results = []
+    for n_users, n_history in zip(args.users, histories):
+        results.extend(run_size(n_users, n_history, args.seed))
+
+    report = {"meta": report_meta(args.seed, benchmark="ui", platform_plugin="offscreen"), "results": results}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
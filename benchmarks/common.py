@@ -0,0 +1,78 @@
+# benchmarks/common.py
+"""
+벤치마크 공통 도구 (측정 / 결과 기록 / 실행 환경 정보)
+
+- 결과 레코드 형식은 모든 벤치마크가 같음 → benchmarks/compare.py로 커밋 간 비교
+"""
+
+from __future__ import annotations
+
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def log(message: str) -> None:
+    """진행 상황은 stderr로 (stdout은 JSON 결과 전용)"""
+    print(message, file=sys.stderr, flush=True)
+
+
+def measure(fn, repeat: int = 1):
+    """fn을 repeat번 실행해 가장 빠른 시간(초)과 마지막 반환값"""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+class Recorder:
+    """측정 결과 모음 (크기별로 suite/name/소요 시간/처리 건수 기록)"""
+
+    def __init__(self, n_users: int, n_history: int):
+        self.n_users = n_users
+        self.n_history = n_history
+        self.results = []
+
+    def add(self, suite: str, name: str, seconds: float, ops: int = 1, **extra) -> None:
+        record = {
+            "suite": suite,
+            "name": name,
+            "users": self.n_users,
+            "history": self.n_history,
+            "seconds": round(seconds, 6),
+            "ops": ops,
+            "ms_per_op": round(seconds / ops * 1000, 6) if ops else None,
+            **extra,
+        }
+        self.results.append(record)
+        log(f"  {suite:<10} {name:<28} {seconds * 1000:>10.2f}ms  ops={ops:,}")
+
+
+def git_commit() -> str | None:
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report_meta(seed: int, **extra) -> dict:
+    """결과 JSON의 meta (비교 시 같은 환경/seed인지 확인용)"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": git_commit(),
+        "seed": seed,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        **extra,
+    }
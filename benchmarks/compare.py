@@ -0,0 +1,85 @@
+# benchmarks/compare.py
+"""
+두 벤치마크 결과(JSON)를 비교한다. (커밋 간 성능 회귀 확인)
+
+- (suite, name, users, history)가 같은 레코드끼리 seconds / peak_rss_kb 비교
+- 기준보다 threshold 이상 느려지거나 메모리가 늘어난 항목이 있으면 종료 코드 1
+
+실행:
+    python benchmarks/compare.py baseline.json current.json
+    python benchmarks/compare.py baseline.json current.json --threshold 0.25 --min-ms 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 비교할 값 (레코드에 있는 것만)
+METRICS = ("seconds", "peak_rss_kb")
+
+
+def _key(record: dict):
+    return record["suite"], record["name"], record["users"], record["history"]
+
+
+def load_results(path: Path) -> tuple[dict, dict]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    return {_key(record): record for record in report["results"]}, report.get("meta", {})
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_ms: float) -> list[dict]:
+    """
+    Returns:
+        list[dict]: 비교 행 (regression=True면 threshold 초과로 나빠짐)
+    """
+    rows = []
+    for key, new in current.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        for metric in METRICS:
+            if metric not in old or metric not in new or not old[metric]:
+                continue
+            ratio = new[metric] / old[metric]
+            # 너무 짧은 측정은 잡음이 커서 회귀 판정에서 제외
+            noisy = metric == "seconds" and max(old[metric], new[metric]) * 1000 < min_ms
+            rows.append({
+                "key": key, "metric": metric, "old": old[metric], "new": new[metric],
+                "ratio": ratio, "regression": not noisy and ratio > 1 + threshold,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 볼 증가 비율 (기본 0.2 = 20%%)")
+    parser.add_argument("--min-ms", type=float, default=5.0, help="이보다 짧은 측정은 회귀 판정 제외")
+    args = parser.parse_args()
+
+    baseline, old_meta = load_results(args.baseline)
+    current, new_meta = load_results(args.current)
+    print(f"baseline: {old_meta.get('commit')} ({old_meta.get('created')})")
+    print(f"current : {new_meta.get('commit')} ({new_meta.get('created')})")
+    if old_meta.get("seed") != new_meta.get("seed"):
+        print("warning: seed가 달라 데이터가 같지 않습니다")
+
+    rows = compare(baseline, current, args.threshold, args.min_ms)
+    print(f"\n{'suite':<10} {'name':<28} {'users':>9} {'metric':<12} {'old':>12} {'new':>12} {'ratio':>7}")
+    for row in rows:
+        suite, name, users, _ = row["key"]
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{suite:<10} {name:<28} {users:>9,} {row['metric']:<12} "
+              f"{row['old']:>12.4f} {row['new']:>12.4f} {row['ratio']:>6.2f}x{flag}")
+
+    regressions = [row for row in rows if row["regression"]]
+    print(f"\n{len(rows)} compared, {len(regressions)} regression(s) (threshold {args.threshold:.0%})")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
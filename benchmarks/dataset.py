@@ -0,0 +1,139 @@
+# benchmarks/dataset.py
+"""
+벤치마크용 합성 데이터 생성기 (같은 seed면 항상 같은 데이터)
+
+- users.json: 사용자 n명 (활동 횟수/포인트 분포는 실제 운영 데이터와 비슷하게)
+- history.jsonl: 기록 n건 (이용 추가 / 포인트 지급 / 일괄 지급 요약 / 사용자 삭제), 날짜 오름차순
+- 기록은 한 줄씩 만들어 바로 쓰므로 1천만 건도 메모리를 거의 쓰지 않음
+
+실행:
+    python benchmarks/dataset.py --users 100000 --history 1000000 --out /tmp/cpm-data
+    (앱을 이 데이터로 실행: CPM_DATA_DIR=/tmp/cpm-data python src/main.py)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from modules.calculator import COUNTS_FOR_REWARD  # noqa: E402
+from modules.rewards import APP_VERSION, POINTS_TO_GIVE  # noqa: E402
+
+DEFAULT_SEED = 42
+# 기록 종류 비율 (이용 추가 / 지급 / 일괄 지급 요약 / 삭제)
+HISTORY_MIX = (("usage", 0.70), ("reward", 0.27), ("reward_batch", 0.02), ("delete_users", 0.01))
+# 기록 날짜 범위: HISTORY_START부터 HISTORY_DAYS일 동안 고르게
+HISTORY_START = datetime(2025, 1, 1, 9, 0)
+HISTORY_DAYS = 365
+# history.jsonl에 한 번에 쓰는 줄 수
+WRITE_CHUNK_LINES = 10_000
+
+
+def make_phones(n: int, seed: int = DEFAULT_SEED) -> list[str]:
+    """010으로 시작하는 서로 다른 11자리 전화번호 n개 (생성 순서도 seed로 고정)"""
+    rng = random.Random(seed)
+    return [f"010{number:08d}" for number in rng.sample(range(10**8), n)]
+
+
+def make_users(n: int, seed: int = DEFAULT_SEED) -> dict:
+    """사용자 n명 (users.json 형식)"""
+    rng = random.Random(seed + 1)
+    users = {}
+    for phone in make_phones(n, seed):
+        # 대부분은 몇 회, 일부는 지급 기준을 넘긴 상태
+        activity_1 = min(int(rng.expovariate(1 / 3)), 40)
+        activity_2 = min(int(rng.expovariate(1 / 2)), 40)
+        users[phone] = {
+            "activity_1": activity_1,
+            "activity_2": activity_2,
+            "total_points": POINTS_TO_GIVE * rng.randrange(0, 6),
+        }
+    return users
+
+
+def iter_history(n: int, phones: list[str], seed: int = DEFAULT_SEED):
+    """기록 n건을 날짜 오름차순으로 하나씩 만든다. (history.jsonl 한 줄 = 기록 1건)"""
+    rng = random.Random(seed + 2)
+    kinds = [kind for kind, _ in HISTORY_MIX]
+    weights = [weight for _, weight in HISTORY_MIX]
+    step = timedelta(days=HISTORY_DAYS) / max(1, n)
+    for i in range(n):
+        date = (HISTORY_START + step * i).strftime("%Y-%m-%d %H:%M")
+        kind = rng.choices(kinds, weights)[0]
+        phone = rng.choice(phones)
+        if kind == "usage":
+            entry = {
+                "type": "usage", "phone": phone,
+                "activity_1": rng.randrange(0, 3), "activity_2": rng.randrange(0, 2),
+                "new_user": rng.random() < 0.05,
+            }
+        elif kind == "reward":
+            count_before = COUNTS_FOR_REWARD + rng.randrange(0, 5)
+            entry = {
+                "type": "reward", "phone": phone, "points": POINTS_TO_GIVE,
+                "count_before": count_before, "count_after": count_before - COUNTS_FOR_REWARD,
+                "counts_for_reward": COUNTS_FOR_REWARD, "reason": f"누적 {COUNTS_FOR_REWARD}회 달성",
+            }
+        elif kind == "reward_batch":
+            eligible = rng.randrange(1, 50)
+            entry = {
+                "type": "reward_batch", "selected": eligible + rng.randrange(0, 10), "eligible": eligible,
+                "excluded": 0, "counts_for_reward": COUNTS_FOR_REWARD, "success": eligible, "errors": 0,
+            }
+        else:
+            entry = {"type": "delete_users", "deleted_count": rng.randrange(1, 5)}
+        entry["app_version"] = APP_VERSION
+        entry["date"] = date
+        yield entry
+
+
+def write_history(path: Path, n: int, phones: list[str], seed: int = DEFAULT_SEED) -> None:
+    """기록 n건을 history.jsonl 형식으로 쓴다. (WRITE_CHUNK_LINES 줄씩 모아서)"""
+    with path.open("w", encoding="utf-8") as f:
+        chunk = []
+        for entry in iter_history(n, phones, seed):
+            chunk.append(json.dumps(entry, ensure_ascii=False))
+            if len(chunk) >= WRITE_CHUNK_LINES:
+                f.write("\n".join(chunk) + "\n")
+                chunk.clear()
+        if chunk:
+            f.write("\n".join(chunk) + "\n")
+
+
+def write_dataset(base_dir: Path, n_users: int, n_history: int, seed: int = DEFAULT_SEED) -> dict:
+    """
+    base_dir/data 아래에 users.json, history.jsonl을 만든다. (CPM_DATA_DIR=base_dir로 앱/벤치마크 실행)
+
+    Returns:
+        dict: 생성한 사용자 데이터
+    """
+    data_dir = base_dir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    users = make_users(n_users, seed)
+    # 앱이 저장하는 형식과 같게 (safe_write_json: indent=4)
+    (data_dir / "users.json").write_text(json.dumps(users, ensure_ascii=False, indent=4), encoding="utf-8")
+    write_history(data_dir / "history.jsonl", n_history, list(users), seed)
+    # 전화번호 키 마이그레이션은 이미 끝난 상태로 (storage.migrate_users_phone_keys_once)
+    (data_dir / ".migrated_phone_v1").write_text("ok", encoding="utf-8")
+    return users
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--history", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out", type=Path, required=True, help="생성할 기준 폴더 (data/ 하위에 파일 생성)")
+    args = parser.parse_args()
+    write_dataset(args.out, args.users, args.history, args.seed)
+    print(f"users={args.users:,} history={args.history:,} → {args.out / 'data'}")
+
+
+if __name__ == "__main__":
+    main()
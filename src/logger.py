@@ -1,11 +1,101 @@
 # logger.py
 
 from __future__ import annotations
+import atexit
+import copy
+import gzip
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import shutil
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
-def setup_logging(log_dir: Path, level: int = logging.INFO) -> None:
+# 로그 형식: "text"(기본) / "json" (한 줄에 JSON 하나)
+LOG_FORMAT_ENV = "CPM_LOG_FORMAT"
+LOG_MAX_BYTES = 2_000_000
+LOG_BACKUP_COUNT = 3
+
+_listener: QueueListener | None = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드 하나를 JSON 한 줄로 (ts / level / logger / thread / msg [/ exc])"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _GzipRotator:
+    """회전된 백업 파일을 gzip으로 압축 (app.log.1.gz ...) - 리스너 스레드에서 실행"""
+
+    @staticmethod
+    def namer(name: str) -> str:
+        return name + ".gz"
+
+    @staticmethod
+    def rotator(source: str, dest: str) -> None:
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+
+class _PreparedQueueHandler(QueueHandler):
+    """
+    큐에 넣기 전 메시지만 완성 (포맷은 리스너 쪽 핸들러가 담당)
+    기본 QueueHandler.prepare는 예외 traceback을 메시지에 합쳐 JSON 형식에서 "exc"로 분리할 수 없음
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자 객체가 나중에 바뀌어도 기록 시점의 값이 남도록 호출 스레드에서 문자열로 만듦
+        message = record.getMessage()
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = logging.Formatter().formatException(record.exc_info)
+        record = copy.copy(record)
+        record.msg, record.args = message, None
+        record.exc_info, record.exc_text = None, exc_text
+        return record
+
+
+def build_file_handler(log_path: Path, json_format: bool = False, compress: bool = True) -> RotatingFileHandler:
+    """app.log 회전 파일 핸들러 (compress=True면 백업 파일을 gzip으로 압축)"""
+    handler = RotatingFileHandler(
+        log_path,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8"
+    )
+    if compress:
+        handler.namer = _GzipRotator.namer
+        handler.rotator = _GzipRotator.rotator
+    handler.setFormatter(
+        JsonLinesFormatter() if json_format
+        else logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    )
+    return handler
+
+
+def setup_logging(log_dir: Path, level: int = logging.INFO, json_format: bool | None = None) -> None:
+    """
+    루트 로거 설정
+    - 호출한 스레드(GUI 스레드 포함)는 큐에 넣기만 하고, 파일 쓰기/회전/압축은 리스너 스레드가 처리
+    - json_format=None이면 CPM_LOG_FORMAT 환경 변수("json")를 따름
+    - 종료 시(shutdown_logging 또는 atexit) 큐에 남은 로그를 모두 기록
+    """
+    global _listener
     log_dir.mkdir(parents=True, exist_ok=True)
     log_path = log_dir / "app.log"
 
@@ -14,16 +104,31 @@ def setup_logging(log_dir: Path, level: int = logging.INFO) -> None:
         return
 
     root.setLevel(level)
+    if json_format is None:
+        json_format = os.getenv(LOG_FORMAT_ENV, "text").lower() == "json"
 
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    file_handler = build_file_handler(log_path, json_format=json_format)
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    root.addHandler(_PreparedQueueHandler(log_queue))
+    atexit.register(shutdown_logging)
 
-    file_handler = RotatingFileHandler(
-        log_path, 
-        maxBytes=2_000_000, 
-        backupCount=3, 
-        encoding="utf-8"
-    )
-    file_handler.setFormatter(formatter)
-    root.addHandler(file_handler)
\ No newline at end of file
+
+def shutdown_logging() -> None:
+    """
+    리스너를 멈추고 큐에 남은 로그를 파일에 기록 (여러 번 호출해도 안전)
+    이후의 로그는 파일 핸들러로 바로 기록 (닫기는 logging.shutdown이 담당)
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()   # 큐에 남은 레코드를 모두 처리한 뒤 스레드 종료
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _PreparedQueueHandler):
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        handler.flush()
+        root.addHandler(handler)
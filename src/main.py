@@ -1,40 +1,151 @@
 # 실행부
 
 from __future__ import annotations
-import sys, logging
+import time
+# 시작 시간 측정 기준 (무거운 import 전에 기록)
+_STARTED = time.perf_counter()
+
+import os, sys, logging, argparse
 from modules.pathutils import resource_path
-from logger import setup_logging
+from logger import setup_logging, shutdown_logging
 from modules.storage import ensure_files_exist, migrate_users_phone_keys_once, HISTORY_DIR #, DATA_DIR
+from modules.startup import StartupProfiler, FirstPaintWatcher
+from modules.profiling import ProfileSession, PROFILE_ENV, PROFILE_MEMORY_ENV
+from modules.memory import RssMonitor, MONITOR_INTERVAL_ENV, DEFAULT_MONITOR_INTERVAL_MIN
+from modules.stats import get_history_stats
+from modules.projection import loaded_user_projection
+from modules.message_utils import show_warning
+from modules import perf
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QThreadPool, QTimer
 from ui.main_window_view import MainWindow
+from ui.workers import DataLoadTask
 from modules.controller import Controller
 
+# 데이터 로드 완료 후 다이얼로그 미리 생성까지 대기 시간(ms)
+DIALOG_PREWARM_DELAY_MS = 500
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Client Point Manager")
+    parser.add_argument(
+        "--log-json", action="store_true",
+        help="app.log를 한 줄에 JSON 하나 형식으로 기록 (CPM_LOG_FORMAT=json과 같음)",
+    )
+    parser.add_argument(
+        "--perf", action="store_true",
+        help="주요 경로 지연 시간 히스토그램을 기록하고 주기적/종료 시 요약을 로그로 남김 (CPM_PERF=1과 같음)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="이벤트 루프 종료까지 cProfile로 수집해 로그 폴더에 저장 (CPM_PROFILE=1과 같음)",
+    )
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="--profile과 함께 tracemalloc 스냅샷(시작/첫 화면/종료)도 저장 (CPM_PROFILE_MEMORY=1과 같음)",
+    )
+    parser.add_argument(
+        "--startup-profile", action="store_true",
+        help="시작 단계별 소요 시간을 출력하고 조작 가능 상태가 되면 종료",
+    )
+    # Qt 인자(-style 등)는 QApplication에 그대로 전달
+    args, _ = parser.parse_known_args(argv[1:])
+    return args
+
+
+def _prepare_data():
+    """파일 / 데이터 준비 (작업 스레드에서 실행)"""
+    ensure_files_exist()
+    migrate_users_phone_keys_once()
+
+
 def main():
+    args = parse_args(sys.argv)
+    profiler = StartupProfiler(_STARTED)
+    profiler.mark("imports")
+
     app = QApplication(sys.argv)
     # ensure_data_dir_or_exit(DATA_DIR)
 
     # 로거 설정
-    setup_logging(HISTORY_DIR, level=logging.INFO)
+    setup_logging(HISTORY_DIR, level=logging.INFO, json_format=True if args.log_json else None)
     logger = logging.getLogger(__name__)
     logger.info("앱 시작")
+    if args.perf or os.getenv(perf.PERF_ENV) == "1":
+        perf.enable(float(os.getenv(perf.PERF_INTERVAL_ENV, perf.DEFAULT_INTERVAL_MIN)))
+    # 프로세스 메모리(RSS)를 주기적으로 로그에 기록 (기준값 초과 시 경고)
+    rss_monitor = RssMonitor(float(os.getenv(MONITOR_INTERVAL_ENV, DEFAULT_MONITOR_INTERVAL_MIN)))
+    rss_monitor.start()
 
-    # 파일 / 데이터 준비
-    try:
-        ensure_files_exist()
-        migrate_users_phone_keys_once()
+    # 진단용 프로파일링 (창 생성 ~ 이벤트 루프 종료까지)
+    profile_memory = args.profile_memory or os.getenv(PROFILE_MEMORY_ENV) == "1"
+    profile_session = None
+    if args.profile or profile_memory or os.getenv(PROFILE_ENV) == "1":
+        profile_session = ProfileSession(HISTORY_DIR, trace_memory=profile_memory)
+        profile_session.start()
 
+    try:
         # View 객체 생성 (MainWindow)
         mainwindow_view = MainWindow()
-        
-        # Controller 객체 생성 및 View 연결
-        controller = Controller(mainwindow_view)
+
+        # Controller 객체 생성 및 View 연결 (사용자 데이터는 창을 띄운 뒤 작업 스레드에서 로드)
+        controller = Controller(mainwindow_view, users={})
         mainwindow_view.connect_controller(controller)
-        
-        # 화면 표시 및 이벤트 루프 시작
+        mainwindow_view.set_data_loading(True)
+        profiler.mark("qt_init")
+
+        # 화면 표시 (첫 화면이 그려지는 시점 기록)
+        FirstPaintWatcher(mainwindow_view, lambda: profiler.mark("first_paint"))
         mainwindow_view.show()
-        
+
+        def on_snapshot_loaded(snapshot):
+            # 실제 데이터를 읽는 동안 지난 실행의 대시보드로 첫 화면 표시 (읽기 전용)
+            controller.show_snapshot(snapshot)
+            profiler.mark("snapshot")
+
+        def on_loaded(users, search_index, user_indexes, changed):
+            profiler.mark("data_load")
+            controller.attach_data(users, search_index, user_indexes, changed)
+            mainwindow_view.set_data_loading(False)
+            profiler.mark("interactive")
+            if profile_session is not None:
+                profile_session.snapshot("first_render")
+            if args.startup_profile:
+                report = profiler.report()
+                logger.info("Startup profile\n%s", report)
+                print(report)
+                QTimer.singleShot(0, app.quit)
+                return
+            # 유휴 시간에 다이얼로그 미리 생성 (첫 열기 지연 감소)
+            QTimer.singleShot(DIALOG_PREWARM_DELAY_MS, controller.prewarm_dialogs)
+
+        def on_failed(message):
+            show_warning(mainwindow_view, "데이터 로드 실패", f"사용자 데이터를 불러오지 못했습니다.\n{message}")
+            app.exit(1)
+
+        task = DataLoadTask(prepare=_prepare_data)
+        task.signals.snapshotLoaded.connect(on_snapshot_loaded)
+        task.signals.loaded.connect(on_loaded)
+        task.signals.failed.connect(on_failed)
+        QThreadPool.globalInstance().start(task)
+
+        # 이벤트 루프 시작
         exit_code = app.exec()
+        if profile_session is not None:
+            profile_session.stop()
+        # 종료 시 대시보드 스냅샷 저장 (진행 중인 작업이 끝난 뒤)
+        QThreadPool.globalInstance().waitForDone()
+        controller.save_snapshot(background=False)
+        rss_monitor.stop()
+        rss_monitor.sample()
+        get_history_stats().save_if_changed()
+        # 다음 시작 때 재생할 이벤트가 없도록 사용자 체크포인트 저장
+        projection = loaded_user_projection()
+        if projection is not None:
+            projection.save_if_changed()
         logger.info("앱 종료")
+        # 큐에 남은 로그를 파일에 기록하고 리스너 스레드 종료 (이후 로그는 파일에 바로 기록)
+        shutdown_logging()
         sys.exit(exit_code)
     except Exception:
         logger.exception("앱 비정상 종료")
@@ -0,0 +1,479 @@
+# modules/api_server.py
+"""
+로컬 HTTP/JSON API 서버 (asyncio, Qt 비의존, 추가 패키지 없음)
+POS 등 다른 프로그램이 버튼 대신 방문 기록/지급 확인을 자동으로 하기 위해 존재한다.
+
+- 읽기(사용자 조회/검색)는 메모리의 사용자 데이터와 검색 인덱스에서 바로 응답
+- 쓰기(이용 추가/지급)는 큐에 넣고 쓰기 작업 하나(single writer)가 순서대로 처리
+  · 대기 중인 쓰기를 모아 이벤트를 한 번에 추가 (modules.projection, 체크포인트는 N건마다 / 종료 시)
+  · 파일 저장은 전용 스레드 1개에서 실행 → 저장 중에도 읽기 요청은 계속 처리
+  · 메모리 반영은 저장에 성공한 뒤 이벤트 루프에서 → 읽기는 항상 저장된 상태만 봄
+- 로그 조회는 히스토리 인덱스(modules.history_index)로, 파일 읽기는 스레드에서
+- 루프백 주소(127.0.0.1 / ::1 / localhost)에만 열 수 있음
+- 앱 화면과 같은 데이터를 동시에 쓰지 않도록 앱을 끈 상태에서 단독 실행하거나,
+  다른 파이썬 프로그램 안에서 ApiServer를 직접 시작 (run_in_thread)
+
+엔드포인트 (JSON):
+    GET  /health
+    GET  /users/<전화번호>                      사용자 조회
+    GET  /users?q=5678&limit=50                 전화번호 부분 검색
+    POST /usage   {"phone", "activity_1", "activity_2"}   이용 추가 (없는 번호는 신규 등록)
+    POST /reward  {"phone"} 또는 {"phones": [...]}         포인트 지급
+    GET  /history?phone=&type=&from=YYYY-MM-DD&to=YYYY-MM-DD&limit=50
+
+실행 (src에서):
+    python -m modules.api_server --port 8765
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import logging
+import threading
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+from . import perf, storage
+from .calculator import add_usage, normalize_phone, summarize_user, COUNTS_FOR_REWARD
+from .history_index import ENTRY_TYPES, HistoryFilter, get_history_index
+from .projection import get_user_projection
+from .rewards import APP_VERSION, POINTS_TO_GIVE, compute_reward_batch
+from .search_index import PhoneSearchIndex
+from .validator import validate_phone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# 요청 본문 최대 크기 / 한 번에 모아 저장할 최대 쓰기 수 / 목록 응답 최대 건수
+MAX_BODY_BYTES = 64 * 1024
+MAX_WRITE_BATCH = 1000
+MAX_LIMIT = 1000
+DEFAULT_LIMIT = 50
+# API에서 만든 로그 표시
+SOURCE = "api"
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ApiError(Exception):
+    """HTTP 오류 응답 (status, 메시지, 추가 필드)"""
+
+    def __init__(self, status: int, message: str, **extra):
+        super().__init__(message)
+        self.status = status
+        self.payload = {"error": message, **extra}
+
+
+@dataclass
+class _Write:
+    """쓰기 요청 1건 (kind: "usage" / "reward")"""
+    kind: str
+    payload: dict
+    future: asyncio.Future = field(repr=False)
+
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _phone_arg(value) -> str:
+    phone = normalize_phone(value)
+    if not validate_phone(phone):
+        raise ApiError(400, "invalid phone", phone=value)
+    return phone
+
+
+def _count_arg(body: dict, key: str) -> int:
+    value = body.get(key, 0)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ApiError(400, f"{key} must be a non-negative integer")
+    return value
+
+
+def _limit_arg(query: dict) -> int:
+    try:
+        limit = int(query.get("limit", [DEFAULT_LIMIT])[0])
+    except ValueError:
+        raise ApiError(400, "limit must be an integer") from None
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def _date_arg(query: dict, name: str) -> str | None:
+    value = query.get(name, [None])[0] or None
+    if value is not None:
+        try:
+            datetime.strptime(value, "%Y-%m-%d")
+        except ValueError:
+            raise ApiError(400, f"{name} must be YYYY-MM-DD", value=value) from None
+    return value
+
+
+def _type_arg(query: dict) -> str | None:
+    value = query.get("type", [None])[0] or None
+    if value is not None and value not in ENTRY_TYPES:
+        raise ApiError(400, "unknown type", type=value, types=list(ENTRY_TYPES))
+    return value
+
+
+class ApiServer:
+    """
+    로컬 API 서버
+
+    - 사용자 데이터는 공유 사용자 상태(modules.projection)를 그대로 씀 (복사본 없음)
+
+    Args:
+        host: 루프백 주소만 허용
+        port: 0이면 비어 있는 포트 (시작 후 self.port)
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        if not is_loopback(host):
+            raise ValueError(f"API 서버는 루프백 주소에서만 열 수 있습니다: {host}")
+        self.host = host
+        self.port = port
+        self.users = get_user_projection().users
+        self.search_index = PhoneSearchIndex(self.users)
+        self._queue: asyncio.Queue | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._server: asyncio.base_events.Server | None = None
+        # 파일 저장 전용 스레드 (저장 순서 = 요청 처리 순서)
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-writer")
+
+    # ---------------------------------------------------------
+    # 시작 / 종료
+    # ---------------------------------------------------------
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("API server listening on http://%s:%d (users=%d)", self.host, self.port, len(self.users))
+
+    async def close(self) -> None:
+        """새 연결을 받지 않고, 대기 중인 쓰기를 모두 저장한 뒤 종료"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._writer_task is not None:
+            await self._queue.put(None)
+            await self._writer_task
+            self._writer_task = None
+            # 다음 시작 때 재생할 이벤트가 없도록 체크포인트 저장
+            await asyncio.get_running_loop().run_in_executor(self._io, get_user_projection().save_if_changed)
+        self._io.shutdown(wait=True)
+        logger.info("API server stopped")
+
+    # ---------------------------------------------------------
+    # HTTP
+    # ---------------------------------------------------------
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    self._send(writer, 400, {"error": "bad request line"}, keep_alive=False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0 or length > MAX_BODY_BYTES:
+                    self._send(writer, 413 if length > 0 else 400, {"error": "invalid body size"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._dispatch(method, target, body)
+                self._send(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _send(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+        )
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> tuple[int, dict]:
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        query = parse_qs(url.query)
+        route = parts[0] if parts else ""
+        try:
+            with perf.timed(f"api.{method.lower()}.{route or 'root'}"):
+                if method == "GET":
+                    if route == "health" and len(parts) == 1:
+                        return 200, {"status": "ok", "users": len(self.users)}
+                    if route == "users" and len(parts) == 2:
+                        return 200, self._get_user(parts[1])
+                    if route == "users" and len(parts) == 1:
+                        return 200, self._search_users(query)
+                    if route == "history" and len(parts) == 1:
+                        return 200, await self._query_history(query)
+                elif method == "POST" and len(parts) == 1 and route in ("usage", "reward"):
+                    try:
+                        payload = json.loads(body or b"{}")
+                    except ValueError:
+                        raise ApiError(400, "invalid JSON body") from None
+                    if not isinstance(payload, dict):
+                        raise ApiError(400, "JSON body must be an object")
+                    return 200, await self._submit(route, payload)
+                if route in ("health", "users", "history", "usage", "reward"):
+                    raise ApiError(405, "method not allowed")
+                raise ApiError(404, "not found")
+        except ApiError as e:
+            return e.status, e.payload
+        except Exception:
+            logger.exception("API request failed: %s %s", method, target)
+            return 500, {"error": "internal error"}
+
+    # ---------------------------------------------------------
+    # 읽기 (메모리 / 인덱스)
+    # ---------------------------------------------------------
+    def _get_user(self, raw_phone: str) -> dict:
+        phone = _phone_arg(raw_phone)
+        data = self.users.get(phone)
+        if data is None:
+            raise ApiError(404, "user not found", phone=phone)
+        return summarize_user(phone, data)
+
+    def _search_users(self, query: dict) -> dict:
+        keyword = normalize_phone(query.get("q", [""])[0])
+        if not keyword:
+            raise ApiError(400, "q (digits) is required")
+        phones = self.search_index.search(keyword)
+        limit = _limit_arg(query)
+        return {
+            "count": len(phones),
+            "users": [summarize_user(phone, self.users[phone]) for phone in phones[:limit]],
+        }
+
+    async def _query_history(self, query: dict) -> dict:
+        flt = HistoryFilter(phone=query.get("phone", [None])[0] or None, date_from=_date_arg(query, "from"),
+                            date_to=_date_arg(query, "to"), entry_type=_type_arg(query))
+        limit = _limit_arg(query)
+
+        def read():
+            # 인덱스 갱신 + 파일 읽기 (최신 기록부터 limit건)
+            return [entry for _, entry in islice(get_history_index().query(flt), limit)]
+        return {"entries": await asyncio.to_thread(read)}
+
+    # ---------------------------------------------------------
+    # 쓰기 (single writer)
+    # ---------------------------------------------------------
+    async def _submit(self, kind: str, payload: dict) -> dict:
+        # 형식 검사는 큐에 넣기 전에 (잘못된 요청이 일괄 저장을 막지 않도록)
+        if kind == "usage":
+            request = {
+                "phone": _phone_arg(payload.get("phone")),
+                "activity_1": _count_arg(payload, "activity_1"),
+                "activity_2": _count_arg(payload, "activity_2"),
+            }
+            if request["activity_1"] + request["activity_2"] == 0:
+                raise ApiError(400, "activity_1 + activity_2 must be at least 1")
+        else:
+            raw_phones = payload["phones"] if isinstance(payload.get("phones"), list) else [payload.get("phone")]
+            phones = list(dict.fromkeys(_phone_arg(raw) for raw in raw_phones))
+            if not phones:
+                raise ApiError(400, "phone or phones is required")
+            request = {"phones": phones, "single": "phones" not in payload}
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Write(kind, request, future))
+        return await future
+
+    async def _writer(self) -> None:
+        """쓰기 요청을 순서대로 처리 (대기 중인 요청은 모아서 한 번에 저장)"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            batch = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= MAX_WRITE_BATCH or self._queue.empty():
+                    break
+                item = self._queue.get_nowait()
+            stopping = item is None
+            if batch:
+                await self._apply_batch(loop, batch)
+
+    async def _apply_batch(self, loop, batch: list[_Write]) -> None:
+        changed: dict[str, dict] = {}
+        view = ChainMap(changed, self.users)   # 이번 묶음 안의 앞선 변경을 다음 요청이 봄
+        entries: list[dict] = []
+        results: list[tuple[_Write, object]] = []   # (요청, 응답 dict 또는 ApiError)
+
+        for item in batch:
+            request = item.payload
+            if item.kind == "usage":
+                phone = request["phone"]
+                is_new = phone not in view
+                single = {phone: dict(view[phone])} if not is_new else {}
+                add_usage(single, phone, request["activity_1"], request["activity_2"])
+                changed[phone] = single[phone]
+                entries.append({
+                    "type": "usage", "phone": phone,
+                    "activity_1": request["activity_1"], "activity_2": request["activity_2"],
+                    "new_user": is_new, "app_version": APP_VERSION, "source": SOURCE,
+                })
+                results.append((item, {"new_user": is_new, "user": summarize_user(phone, changed[phone])}))
+                continue
+
+            phones = request["phones"]
+            unknown = [phone for phone in phones if phone not in view]
+            if unknown:
+                results.append((item, ApiError(404, "user not found", phones=unknown)))
+                continue
+            reward = compute_reward_batch(view, phones, points=POINTS_TO_GIVE, counts_for_reward=COUNTS_FOR_REWARD)
+            if request["single"] and reward.errors:
+                _, count = reward.errors[0]
+                results.append((item, ApiError(409, "insufficient count", count=count,
+                                               counts_for_reward=COUNTS_FOR_REWARD)))
+                continue
+            if reward.updated:
+                changed.update(reward.updated)
+                entries.extend({**entry, "source": SOURCE} for entry in reward.entries)
+                entries.append({
+                    "type": "reward_batch", "selected": len(phones), "eligible": len(reward.updated),
+                    "excluded": len(reward.errors), "success": len(reward.updated), "errors": len(reward.errors),
+                    "counts_for_reward": COUNTS_FOR_REWARD, "app_version": APP_VERSION, "source": SOURCE,
+                })
+            results.append((item, {
+                "points": POINTS_TO_GIVE,
+                "rewarded": [summarize_user(phone, data) for phone, data in reward.updated.items()],
+                "insufficient": [{"phone": phone, "count": count} for phone, count in reward.errors],
+            }))
+
+        if changed:
+            try:
+                await loop.run_in_executor(self._io, self._persist, changed, entries)
+            except Exception:
+                logger.exception("API write batch failed: %d requests (not applied)", len(batch))
+                for item, _ in results:
+                    if not item.future.done():
+                        item.future.set_exception(ApiError(500, "save failed"))
+                return
+            # 저장 성공 → self.users에는 저장 스레드에서 이미 반영됨 (루프는 사용자 단위 조회만 하므로 겹쳐도 안전)
+            for phone in changed:
+                self.search_index.add(phone)
+            logger.info("API write batch committed: requests=%d users=%d entries=%d",
+                        len(batch), len(changed), len(entries))
+
+        for item, result in results:
+            if item.future.done():   # 연결이 끊겨 취소된 요청
+                continue
+            if isinstance(result, ApiError):
+                item.future.set_exception(result)
+            else:
+                item.future.set_result(result)
+
+    def _persist(self, changed: dict, entries: list[dict]) -> None:
+        """[저장 스레드] 이벤트 일괄 추가 (기록에 성공하면 changed가 self.users에 반영됨)"""
+        get_user_projection().append(entries, changed=changed)
+
+
+# ---------------------------------------------------------
+# 다른 프로그램 안에서 실행 / 단독 실행
+# ---------------------------------------------------------
+class ServerThread:
+    """ApiServer를 별도 스레드의 이벤트 루프에서 실행 (stop()으로 대기 중인 쓰기까지 저장 후 종료)"""
+
+    def __init__(self, server: ApiServer):
+        self.server = server
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="api-server", daemon=True)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self.server.start())
+        self._started.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self.server.close())
+        self._loop.close()
+
+    def start(self) -> "ServerThread":
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def run_in_thread(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ServerThread:
+    """현재 프로그램 안에서 서버 시작 (반환값.server.port로 실제 포트 확인)"""
+    return ServerThread(ApiServer(host, port)).start()
+
+
+async def _serve(host: str, port: int) -> None:
+    server = ApiServer(host=host, port=port)
+    await server.start()
+    # 포트 0으로 실행한 쪽(벤치마크 등)이 실제 주소를 알 수 있도록 한 줄 출력
+    print(f"listening on http://{server.host}:{server.port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m modules.api_server", description="로컬 HTTP/JSON API 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="루프백 주소만 허용 (기본 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0이면 비어 있는 포트")
+    args = parser.parse_args()
+    if not is_loopback(args.host):
+        parser.error(f"루프백 주소만 허용됩니다: {args.host}")
+
+    from logger import setup_logging, shutdown_logging
+    setup_logging(storage.HISTORY_DIR)
+    storage.init_dirs()
+    storage.ensure_files_exist()
+    try:
+        asyncio.run(_serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -137,4 +137,17 @@ def split_eligible(users, phones, counts_for_reward):
             eligible.append(phone)
         else:
             insufficient.append((phone, cnt))
-    return eligible, insufficient
\ No newline at end of file
+    return eligible, insufficient
+
+def summarize_user(phone, data, counts_for_reward=COUNTS_FOR_REWARD):
+    """사용자 1명의 표시/내보내기용 값 (CLI 출력, API 응답)"""
+    total = get_total_count(data)
+    return {
+        "phone": phone,
+        "activity_1": int(data.get("activity_1", 0)),
+        "activity_2": int(data.get("activity_2", 0)),
+        "total_counts": total,
+        "remaining": get_remaining(total, counts_for_reward),
+        "total_points": int(data.get("total_points", 0)),
+        "needs_reward": check_reward_needed(total, counts_for_reward),
+    }
@@ -0,0 +1,447 @@
+# modules/cli.py
+"""
+화면 없이 실행하는 명령줄 도구 (PySide6를 import하지 않음)
+스크립트/일괄 데이터 수정을 Qt 시작 비용 없이 하기 위해 존재한다. (storage / calculator / rewards / projection 직접 사용)
+
+- 사용자 상태는 앱과 같이 체크포인트 + 이후 이벤트 재생으로 읽음 (modules.projection)
+- 여러 사용자를 바꾸는 명령은 이벤트를 한 번에 추가 (users.json은 체크포인트 때 갱신)
+- 기록은 앱과 같은 형식으로 남기고, CLI에서 만든 기록에는 "source": "cli"를 붙임
+- 앱이 실행 중일 때 바꾼 내용은 앱을 다시 시작해야 화면에 반영되므로 앱을 끈 상태에서 실행
+
+실행 (src에서, 데이터 경로는 앱과 같음 / CPM_DATA_DIR로 변경):
+    python -m modules.cli add-usage 01012345678 --a1 1
+    python -m modules.cli add-usage --file visits.csv          (한 줄에 "전화번호,활동A,활동B")
+    python -m modules.cli reward --all-eligible [--dry-run]
+    python -m modules.cli reward 01012345678 01098765432
+    python -m modules.cli delete 01012345678 --yes
+    python -m modules.cli search 5678
+    python -m modules.cli export --format csv --out users.csv
+    python -m modules.cli verify
+    python -m modules.cli compact
+    python -m modules.cli reconcile [--fix] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from . import storage
+from .calculator import (
+    add_usage, get_total_count, normalize_phone, split_eligible, summarize_user, COUNTS_FOR_REWARD,
+)
+from .projection import get_user_projection
+from .reconcile import adjustment_entries, reconcile_points, write_report
+from .rewards import APP_VERSION, POINTS_TO_GIVE, compute_reward_batch, commit_reward_batch
+from .validator import validate_phone
+
+logger = logging.getLogger(__name__)
+
+# CLI에서 만든 로그 표시
+SOURCE = "cli"
+EXPORT_FIELDS = ("phone", "activity_1", "activity_2", "total_counts", "remaining", "total_points", "needs_reward")
+
+
+def _out(message: str = "") -> None:
+    print(message)
+
+
+def _err(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def _parse_phones(raw_phones) -> tuple[list[str], list[str]]:
+    """(정규화한 전화번호 목록(중복 제거, 순서 유지), 형식이 잘못된 입력 목록)"""
+    phones, invalid = [], []
+    for raw in raw_phones:
+        phone = normalize_phone(raw)
+        if validate_phone(phone):
+            if phone not in phones:
+                phones.append(phone)
+        else:
+            invalid.append(raw)
+    return phones, invalid
+
+
+def _load_users() -> dict:
+    """사용자 상태 (체크포인트 + 이후 이벤트 재생, modules.projection)"""
+    storage.init_dirs()
+    return get_user_projection().users
+
+
+def _commit(entries: list[dict], changed: dict | None = None, removed=()) -> None:
+    """이벤트 일괄 추가 (기록에 성공하면 changed/removed가 사용자 상태에 반영됨)"""
+    get_user_projection().append(entries, changed=changed, removed=removed)
+
+
+# ---------------------------------------------------------
+# 명령
+# ---------------------------------------------------------
+def cmd_add_usage(args) -> int:
+    requests = []   # (원본 입력, 활동 A, 활동 B)
+    for raw in args.phones:
+        requests.append((raw, args.a1, args.a2))
+    if args.file:
+        with args.file.open(encoding="utf-8-sig", newline="") as f:
+            for row in csv.reader(f):
+                if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                    continue
+                try:
+                    a1 = int(row[1]) if len(row) > 1 and row[1].strip() else args.a1
+                    a2 = int(row[2]) if len(row) > 2 and row[2].strip() else args.a2
+                except ValueError:
+                    _err(f"숫자가 아닌 횟수: {','.join(row)}")
+                    return 1
+                requests.append((row[0].strip(), a1, a2))
+    if not requests:
+        _err("추가할 전화번호가 없습니다 (인자 또는 --file)")
+        return 1
+
+    invalid = [raw for raw, _, _ in requests if not validate_phone(normalize_phone(raw))]
+    negative = [raw for raw, a1, a2 in requests if a1 < 0 or a2 < 0 or a1 + a2 == 0]
+    if invalid or negative:
+        for raw in invalid:
+            _err(f"잘못된 전화번호: {raw}")
+        for raw in negative:
+            _err(f"횟수는 0 이상이고 합이 1 이상이어야 합니다: {raw}")
+        return 1
+
+    users = _load_users()
+    changed = {}    # 바뀐 사용자만 복사해서 계산 (공유 상태는 기록에 성공한 뒤 반영)
+    entries = []
+    new_users = 0
+    for raw, a1, a2 in requests:
+        phone = normalize_phone(raw)
+        is_new = phone not in users and phone not in changed
+        new_users += is_new
+        if phone not in changed and phone in users:
+            changed[phone] = dict(users[phone])
+        add_usage(changed, phone, a1, a2)
+        entries.append({
+            "type": "usage",
+            "phone": phone,
+            "activity_1": a1,
+            "activity_2": a2,
+            "new_user": is_new,
+            "app_version": APP_VERSION,
+            "source": SOURCE,
+        })
+    if args.dry_run:
+        _out(f"[dry-run] 이용 추가 {len(entries)}건 (신규 {new_users}명) - 저장하지 않음")
+        return 0
+    _commit(entries, changed)
+    _out(f"이용 추가 {len(entries)}건 저장 (신규 {new_users}명)")
+    return 0
+
+
+def cmd_reward(args) -> int:
+    if bool(args.phones) == args.all_eligible:
+        _err("전화번호 또는 --all-eligible 중 하나만 지정하세요")
+        return 2
+    users = _load_users()
+    if args.all_eligible:
+        selected = [phone for phone, data in users.items() if get_total_count(data) >= COUNTS_FOR_REWARD]
+    else:
+        selected, invalid = _parse_phones(args.phones)
+        unknown = [phone for phone in selected if phone not in users]
+        for raw in invalid:
+            _err(f"잘못된 전화번호: {raw}")
+        for phone in unknown:
+            _err(f"등록되지 않은 전화번호: {phone}")
+        if invalid or unknown:
+            return 1
+
+    eligible, insufficient = split_eligible(users, selected, counts_for_reward=COUNTS_FOR_REWARD)
+    if not args.all_eligible:
+        for phone, count in insufficient:
+            _err(f"누적 횟수 부족으로 제외: {phone} ({count}회)")
+    if not eligible:
+        _out("지급 가능한 사용자가 없습니다.")
+        return 0
+
+    result = compute_reward_batch(users, eligible, points=POINTS_TO_GIVE, counts_for_reward=COUNTS_FOR_REWARD)
+    if args.dry_run:
+        _out(f"[dry-run] 지급 대상 {len(result.updated)}명, {len(result.updated) * POINTS_TO_GIVE:,}P - 저장하지 않음")
+        return 0
+    result.entries = [{**entry, "source": SOURCE} for entry in result.entries]
+    commit_reward_batch(result, {
+        "type": "reward_batch",
+        "selected": len(selected),
+        "eligible": len(eligible),
+        "excluded": len(insufficient),
+        "counts_for_reward": COUNTS_FOR_REWARD,
+        "app_version": APP_VERSION,
+        "source": SOURCE,
+    })
+    _out(f"{len(result.updated)}명 지급 완료 ({len(result.updated) * POINTS_TO_GIVE:,}P), 오류 {len(result.errors)}명")
+    return 0
+
+
+def cmd_delete(args) -> int:
+    phones, invalid = _parse_phones(args.phones)
+    for raw in invalid:
+        _err(f"잘못된 전화번호: {raw}")
+    if invalid:
+        return 1
+    users = _load_users()
+    targets = [phone for phone in phones if phone in users]
+    for phone in phones:
+        if phone not in users:
+            _err(f"등록되지 않은 전화번호 (건너뜀): {phone}")
+    if not targets:
+        _out("삭제할 사용자가 없습니다.")
+        return 0
+    if not args.yes:
+        answer = input(f"{len(targets)}명의 사용자 정보를 삭제합니다. 계속할까요? [y/N] ")
+        if answer.strip().lower() not in ("y", "yes"):
+            _out("취소했습니다.")
+            return 1
+
+    _commit([{
+        "type": "delete_users",
+        "deleted_count": len(targets),
+        "phones": targets,
+        "app_version": APP_VERSION,
+        "source": SOURCE,
+    }], removed=targets)
+    _out(f"{len(targets)}명 삭제 완료")
+    return 0
+
+
+def cmd_search(args) -> int:
+    keyword = normalize_phone(args.keyword)
+    if not keyword:
+        _err("검색어는 숫자여야 합니다")
+        return 1
+    users = _load_users()
+    # 한 번만 검색하므로 검색 인덱스를 만들지 않고 바로 훑음 (인덱스 생성 비용 > 한 번 순회)
+    phones = sorted(phone for phone in users if keyword in phone)
+    rows = [summarize_user(phone, users[phone]) for phone in phones[:args.limit]]
+    if args.json:
+        _out(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        _out(f"{'전화번호':<14}{'A':>6}{'B':>6}{'합계':>7}{'남은':>6}{'포인트':>10}")
+        for row in rows:
+            _out(f"{row['phone']:<14}{row['activity_1']:>6}{row['activity_2']:>6}{row['total_counts']:>7}"
+                 f"{row['remaining']:>6}{row['total_points']:>10,}{'  *지급 필요' if row['needs_reward'] else ''}")
+        _out(f"\n{len(phones):,}건" + (f" 중 {len(rows):,}건 표시" if len(rows) < len(phones) else ""))
+    return 0
+
+
+def cmd_export(args) -> int:
+    users = _load_users()
+    rows = (summarize_user(phone, data) for phone, data in users.items())
+    # 파일로 쓸 때는 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    out = args.out.open("w", encoding="utf-8-sig" if args.format == "csv" else "utf-8", newline="") \
+        if args.out else sys.stdout
+    try:
+        if args.format == "csv":
+            writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(list(rows), out, ensure_ascii=False, indent=2)
+            out.write("\n")
+    finally:
+        if args.out:
+            out.close()
+    if args.out:
+        _out(f"{len(users):,}명 → {args.out}")
+    return 0
+
+
+def cmd_verify(args) -> int:
+    """사용자 상태 / users.json 사본 / history.jsonl 형식 검사 (문제가 있으면 종료 코드 1)"""
+    problems = []
+    # 검사 대상은 다른 명령과 같은 사용자 상태 (users.json은 체크포인트 때만 갱신되는 사본)
+    users = _load_users()
+    projection = get_user_projection()
+    saved = None
+    try:
+        saved = json.loads(storage.USER_FILE.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        problems.append(f"users.json(체크포인트 사본) 없음: {storage.USER_FILE}")
+    except (ValueError, OSError) as e:
+        problems.append(f"users.json(체크포인트 사본) 읽기/파싱 실패: {e}")
+    if saved is not None and not isinstance(saved, dict):
+        problems.append("users.json(체크포인트 사본) 최상위가 객체(dict)가 아님")
+        saved = None
+
+    for phone, data in users.items():
+        if not validate_phone(phone) or normalize_phone(phone) != phone:
+            problems.append(f"user {phone}: 전화번호 형식 오류")
+        if not isinstance(data, dict):
+            problems.append(f"user {phone}: 데이터가 객체(dict)가 아님")
+            continue
+        for key in ("activity_1", "activity_2", "total_points"):
+            value = data.get(key, 0)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                problems.append(f"user {phone}: {key}={value!r} (0 이상 정수가 아님)")
+
+    lines = corrupt = 0
+    try:
+        with storage.HISTORY_FILE.open("rb") as f:
+            offset = 0
+            for line in f:
+                lines += 1
+                if not line.endswith(b"\n"):
+                    problems.append(f"history offset={offset}: 끊긴 마지막 줄")
+                    corrupt += 1
+                elif line.strip():
+                    try:
+                        json.loads(line)
+                    except ValueError:
+                        problems.append(f"history offset={offset}: JSON 손상")
+                        corrupt += 1
+                offset += len(line)
+    except FileNotFoundError:
+        problems.append(f"history.jsonl 없음: {storage.HISTORY_FILE}")
+
+    shown = problems if args.all else problems[:args.max_problems]
+    for problem in shown:
+        _out(f"  - {problem}")
+    if len(shown) < len(problems):
+        _out(f"  ... 외 {len(problems) - len(shown)}건 (--all로 전체 표시)")
+    if saved is not None and projection.pending:
+        _out(f"users.json 사본은 마지막 체크포인트 기준 ({len(saved):,}명, 이후 이벤트 {projection.pending:,}건 미반영)")
+    _out(f"users {len(users):,}명, history {lines:,}줄 (손상 {corrupt}줄): "
+         + ("문제 없음" if not problems else f"문제 {len(problems)}건"))
+    if corrupt:
+        _out("손상된 로그 줄은 'compact'로 제거할 수 있습니다.")
+    return 1 if problems else 0
+
+
+def cmd_compact(args) -> int:
+    if not storage.HISTORY_FILE.exists():
+        _err(f"history.jsonl 없음: {storage.HISTORY_FILE}")
+        return 1
+    # 줄 위치가 바뀌므로 압축 전 상태로 체크포인트를 다시 시작
+    projection = get_user_projection()
+    kept, dropped, before, after = storage.compact_history()
+    projection.reset(projection.users)
+    _out(f"history.jsonl: {kept:,}건 유지, {dropped}줄 제거, {before:,} → {after:,} bytes")
+    return 0
+
+
+def cmd_reconcile(args) -> int:
+    """total_points ↔ 로그 지급 합계 대조 (어긋난 사용자가 남아 있으면 종료 코드 1)"""
+    users = _load_users()
+    projection = get_user_projection()
+    # 사용자 상태에 반영된 위치까지만 합산 (그 사이 다른 곳에서 추가된 기록 제외)
+    result = reconcile_points(users, storage.HISTORY_FILE, projection.indexed_upto, workers=args.workers)
+    _out(f"users {result.checked_users:,}명, history {result.history_lines:,}줄 "
+         f"(지급 {result.reward_entries:,}건, 손상 {result.corrupt_lines}줄), "
+         f"작업자 {result.workers}개, {result.elapsed:.2f}초")
+    if result.legacy_deletes:
+        _out(f"전화번호 없는 이전 형식 삭제 기록 {result.legacy_deletes}건 - 이후 재등록한 사용자는 차이가 날 수 있음")
+    if result.orphan_phones:
+        _out(f"users에 없는 전화번호의 지급 기록: {result.orphan_phones:,}명 (삭제된 사용자, 보정 대상 아님)")
+    if not result.mismatches:
+        _out("total_points와 로그 지급 합계가 모두 일치합니다.")
+        return 0
+
+    for item in result.mismatches[:args.max_show]:
+        _out(f"  - {item.phone}: total_points={item.users_points:,} 로그 합계={item.history_points:,} "
+             f"(차이 {item.diff:+,}, 지급 {item.rewards}건)")
+    if len(result.mismatches) > args.max_show:
+        _out(f"  ... 외 {len(result.mismatches) - args.max_show}명")
+    report = args.report or storage.HISTORY_DIR / f"reconcile-{time.strftime('%Y%m%d-%H%M%S')}.csv"
+    write_report(result, report)
+    _out(f"불일치 {len(result.mismatches):,}명 → {report}")
+
+    if not args.fix:
+        _out("--fix로 total_points를 로그 합계에 맞출 수 있습니다.")
+        return 1
+    changed, entries = adjustment_entries(users, result, APP_VERSION, SOURCE)
+    _commit(entries, changed)
+    _out(f"{len(result.mismatches):,}명 보정 완료 (points_adjust 기록)")
+    return 0
+
+
+# ---------------------------------------------------------
+# 진입점
+# ---------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m modules.cli", description="Client Point Manager 명령줄 도구")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그를 화면에도 출력")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("add-usage", help="이용 추가 (없는 번호는 신규 등록)")
+    p.add_argument("phones", nargs="*", help="전화번호")
+    p.add_argument("--a1", type=int, default=1, help="활동 A 횟수 (기본 1)")
+    p.add_argument("--a2", type=int, default=0, help="활동 B 횟수 (기본 0)")
+    p.add_argument("--file", type=Path, help='CSV 파일 (한 줄에 "전화번호[,활동A,활동B]", 생략한 값은 --a1/--a2)')
+    p.add_argument("--dry-run", action="store_true", help="저장하지 않고 결과만 표시")
+    p.set_defaults(func=cmd_add_usage)
+
+    p = sub.add_parser("reward", help="포인트 지급 (누적 횟수가 부족한 사용자는 제외)")
+    p.add_argument("phones", nargs="*", help="지급할 전화번호")
+    p.add_argument("--all-eligible", action="store_true", help="전화번호 대신 지급 가능한 모든 사용자")
+    p.add_argument("--dry-run", action="store_true", help="저장하지 않고 결과만 표시")
+    p.set_defaults(func=cmd_reward)
+
+    p = sub.add_parser("delete", help="사용자 삭제")
+    p.add_argument("phones", nargs="+", help="삭제할 전화번호")
+    p.add_argument("--yes", action="store_true", help="확인 질문 없이 삭제")
+    p.set_defaults(func=cmd_delete)
+
+    p = sub.add_parser("search", help="전화번호 부분 검색")
+    p.add_argument("keyword", help="전화번호 일부 (예: 뒤 4자리)")
+    p.add_argument("--limit", type=int, default=50, help="표시할 최대 건수 (기본 50)")
+    p.add_argument("--json", action="store_true", help="JSON으로 출력")
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser("export", help="사용자 목록 내보내기")
+    p.add_argument("--format", choices=("csv", "json"), default="csv")
+    p.add_argument("--out", type=Path, help="저장할 파일 (생략 시 화면 출력)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("verify", help="사용자 상태 / users.json 사본 / history.jsonl 형식 검사 (문제가 있으면 종료 코드 1)")
+    p.add_argument("--max-problems", type=int, default=20, help="표시할 최대 문제 수 (기본 20)")
+    p.add_argument("--all", action="store_true", help="문제를 모두 표시")
+    p.set_defaults(func=cmd_verify)
+
+    p = sub.add_parser("compact", help="history.jsonl의 손상된 줄 제거 (원본은 backup에 보관)")
+    p.set_defaults(func=cmd_compact)
+
+    p = sub.add_parser("reconcile", help="total_points와 로그 지급 합계 대조 (불일치가 남으면 종료 코드 1)")
+    p.add_argument("--fix", action="store_true", help="불일치 사용자의 total_points를 로그 합계로 보정")
+    p.add_argument("--workers", type=int, help="합산 프로세스 수 (기본: CPU 수, 1이면 프로세스 풀 없이)")
+    p.add_argument("--report", type=Path, help="불일치 CSV 경로 (기본: 로그 폴더의 reconcile-<시각>.csv)")
+    p.add_argument("--max-show", type=int, default=20, help="화면에 표시할 최대 불일치 수 (기본 20)")
+    p.set_defaults(func=cmd_reconcile)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    # 앱과 같은 app.log에 기록 (-v면 화면에도)
+    from logger import setup_logging, shutdown_logging
+    setup_logging(storage.HISTORY_DIR)
+    if args.verbose:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(levelname)s | %(name)s | %(message)s"))
+        logging.getLogger().addHandler(handler)
+    logger.info("CLI 실행: %s", " ".join(sys.argv[1:] if argv is None else argv))
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # 출력을 head 등으로 넘겨 읽는 쪽이 먼저 끝난 경우
+        sys.stdout = open(os.devnull, "w")
+        return 0
+    except Exception as e:
+        logger.exception("CLI 실패: %s", args.command)
+        _err(f"오류: {e}")
+        return 1
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,29 +2,161 @@
 
 # Model 및 Utility 임포트
 import logging
-from .storage import load_users, save_users, delete_users, save_history
-from .calculator import add_usage, apply_reward, check_reward_needed, normalize_phone, split_eligible, get_remaining, COUNTS_FOR_REWARD
+import time
+from importlib import import_module
+from PySide6.QtCore import QThreadPool, QTimer
+from .calculator import add_usage, check_reward_needed, split_eligible, get_remaining, COUNTS_FOR_REWARD
 from .messages import CONFIRM_REWARD_PAYMENT, ERROR_SELECT_USER, USER_REGISTERED
-from ui.input_dialog_view import InputDialog 
-from ui.log_dialog_view import LogDialog
-from ui.usage_dialog_view import UsageDialog
+from .search_index import PhoneSearchIndex, SearchResultCache
+from .user_query import UserIndexes, UserQuery
+from .rewards import APP_VERSION, POINTS_TO_GIVE
+from .stats import get_history_stats
+from .history_index import loaded_history_index
+from .projection import get_user_projection
+from . import perf
+from . import memory
+from .snapshot import capture_snapshot_values, source_signature, write_snapshot
 
 logger = logging.getLogger(__name__)
 
-# [상수 정의] 모듈 레벨 상수
-APP_VERSION = "v1.2"
-POINTS_TO_GIVE = 2000
+# [상수 정의] 모듈 레벨 상수 (APP_VERSION / POINTS_TO_GIVE는 modules.rewards)
+# 다이얼로그 이름 → (모듈, 클래스). 모듈은 처음 필요할 때 import (앱 시작 시 import 비용 X)
+DIALOG_CLASSES = {
+    "input": ("ui.input_dialog_view", "InputDialog"),
+    "usage": ("ui.usage_dialog_view", "UsageDialog"),
+    "log": ("ui.log_dialog_view", "LogDialog"),
+}
+# 시작 후 유휴 시간에 미리 만들어 둘 다이얼로그 (앞에서부터 이벤트 루프 한 바퀴에 하나씩)
+PREWARM_DIALOGS = ("input", "usage", "log")
+# 테이블 컬럼 → 정렬 인덱스 키 (정렬 인덱스가 있는 컬럼만)
+SORT_COLUMNS = {1: "phone", 4: "total_counts", 5: "total_counts", 6: "remaining", 7: "total_points"}
+# 마지막 데이터 변경 후 대시보드 스냅샷을 쓰기까지 대기 시간(ms) (변경이 이어지면 다시 대기)
+SNAPSHOT_IDLE_MS = 5000
 
 # [클래스 정의]
 class Controller:
     """프로그램의 흐름을 제어하고 View와 Model 간의 중개자 역할을 수행"""
     
-    def __init__(self, ui_view):
+    def __init__(self, ui_view, users=None):
+        """
+        Args:
+            ui_view: MainWindow
+            users: 초기 사용자 데이터 (None이면 체크포인트 + 이후 이벤트로 바로 로드,
+                   앱 시작 시에는 빈 dict로 만들고 작업 스레드에서 읽은 뒤 attach_data로 연결)
+        """
         self.view = ui_view
-        self.users = load_users()
+        self.users = get_user_projection().users if users is None else users
+        # 전화번호 검색 인덱스 (사용자 추가/삭제 시 함께 갱신)
+        self.search_index = PhoneSearchIndex(self.users)
+        # 입력 중 검색용 최근 결과 캐시 (인덱스가 바뀌면 자동 무효화)
+        self.search_cache = SearchResultCache(self.search_index)
+        # 마지막으로 렌더링한 검색 결과 (같은 결과면 다시 그리지 않음)
+        self._last_rendered_phones = None
+        # 정렬/복합 필터용 정렬 인덱스 (사용자 변경 시 해당 사용자만 갱신)
+        self.user_indexes = UserIndexes(self.users)
+        # 현재 화면에 적용된 검색어/필터/정렬 조건
+        self.query = UserQuery()
+        # 체크된 사용자 전화번호 집합 (테이블을 순회하지 않고 Controller가 직접 보관)
+        self.selected_phones = set()
+        # 진행 중인 포인트 일괄 지급 작업 (작업 스레드)
+        self._reward_task = None
+        # 한 번 만든 다이얼로그 재사용 (열 때마다 setupUi/스타일시트 적용 비용 X)
+        self._dialogs = {}
+        # 대시보드 스냅샷: 화면이 스냅샷(읽기 전용)을 표시 중인지 / 마지막 저장 이후 데이터가 바뀌었는지
+        self._showing_snapshot = False
+        self._snapshot_dirty = False
+        self._snapshot_timer = QTimer(self.view)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(SNAPSHOT_IDLE_MS)
+        self._snapshot_timer.timeout.connect(self.save_snapshot)
+        
+        # View 테이블이 필요한 행만 요청 시 계산하도록 행 생성 함수 연결
+        self.view.set_row_provider(self._build_display_row)
         
         # Controller가 View의 메서드를 호출하여 초기 상태 갱신 명령
         self.update_dashboard_command() 
+        if users is None:
+            self._refresh_stats()
+
+    def show_snapshot(self, snapshot):
+        """
+        [앱 시작] 실제 데이터를 읽기 전에 대시보드 스냅샷으로 첫 화면을 그린다. (읽기 전용)
+        데이터 조작은 attach_data 전까지 View에서 막혀 있어야 한다.
+        """
+        self.view.set_row_provider(snapshot.row_provider)
+        self.view.update_column_widths(snapshot.maxima())
+        self.view.render_user_list(list(snapshot.phones))
+        self._showing_snapshot = True
+        logger.info("Dashboard snapshot shown: users=%d", len(snapshot))
+
+    @perf.timed("controller.attach_data")
+    def attach_data(self, users, search_index, user_indexes, changed=None):
+        """
+        작업 스레드에서 읽고 인덱스까지 만든 사용자 데이터를 연결하고 화면을 갱신한다.
+        (앱 시작 시 창을 먼저 띄운 뒤 호출)
+
+        Args:
+            changed: 스냅샷과 값이 다른 전화번호 목록 (None이면 스냅샷 없음/표시 순서 다름)
+                     스냅샷을 표시 중이고 목록이 있으면 해당 행만 다시 그림 (스크롤 위치 유지)
+        """
+        self.users = users
+        self.search_index = search_index
+        self.search_cache = SearchResultCache(search_index)
+        self.user_indexes = user_indexes
+        self._last_rendered_phones = None
+        self.selected_phones.clear()
+        self.view.show_selection_count(0)
+        self.view.set_row_provider(self._build_display_row)
+
+        reconcile = self._showing_snapshot and changed is not None
+        if reconcile:
+            self._update_column_widths()
+            self.view.apply_row_changes(updated=changed)
+        else:
+            self.update_dashboard_command()
+        self._showing_snapshot = False
+        self._refresh_stats()
+        logger.info("User data attached: users=%d reconciled=%s changed=%s",
+                    len(users), reconcile, len(changed) if changed is not None else "-")
+
+        # 스냅샷이 없었거나 실제 데이터와 달랐으면 새로 씀
+        if not reconcile or changed:
+            self._mark_snapshot_dirty()
+
+    # -------------------------------------------------------------
+    # 대시보드 스냅샷 (save_snapshot 정의)
+    # -------------------------------------------------------------
+    def _mark_snapshot_dirty(self):
+        """데이터 변경 후 유휴 시간에 스냅샷을 쓰도록 예약 (변경이 이어지면 다시 대기)"""
+        self._snapshot_dirty = True
+        self._snapshot_timer.start()
+
+    @perf.timed("controller.save_snapshot")
+    def save_snapshot(self, background=True):
+        """
+        현재 사용자 데이터로 대시보드 스냅샷을 쓴다. (바뀐 것이 없으면 생략)
+        원시 값만 여기서(GUI 스레드) 뽑고, 행 계산/파일 쓰기는 background이면 작업 스레드에서.
+        """
+        if not self._snapshot_dirty or self._showing_snapshot:
+            return
+        if self._reward_task is not None:
+            # 지급 저장 중에는 로그와 메모리 데이터가 잠시 다름 → 끝난 뒤 다시 시도
+            self._snapshot_timer.start()
+            return
+        started = time.perf_counter()
+        # 변경은 바로 로그에 기록되므로 지금의 로그 상태 = 메모리 데이터
+        values = capture_snapshot_values(self.users)
+        source = source_signature()
+        self._snapshot_dirty = False
+        logger.info("Dashboard snapshot captured: users=%d (%.1fms)", len(values), (time.perf_counter() - started) * 1000)
+        if background:
+            from ui.workers import SnapshotWriteTask
+            QThreadPool.globalInstance().start(SnapshotWriteTask(values, source))
+            return
+        try:
+            write_snapshot(values, source)
+        except Exception:
+            logger.exception("Dashboard snapshot write failed")
 
     # -------------------------------------------------------------
     # 1. View Events Handling (이벤트 처리 및 흐름 제어)
@@ -36,8 +168,8 @@ class Controller:
     def handle_delete_click(self):
         """삭제 버튼 클릭 시 흐름 제어"""
         
-        # 1. View에게 선택된 사용자 목록 요청
-        selected_phones = self.view.get_selected_phones()
+        # 1. 선택된 사용자 목록 (Controller가 보관하는 선택 집합)
+        selected_phones = self.get_selected_phones()
 
         if not selected_phones:
             logger.warning("Delete blocked: no selection")
@@ -54,22 +186,26 @@ class Controller:
         try:
             # 삭제 스냅샷 (복구용)
             # snapshot_path = snapshot_deleted_users(self.users, selected_phones)
-            # 삭제 실행
-            delete_users(selected_phones)
-            save_history({
-                "type": "delete_users",
-                "deleted_count": len(selected_phones),
-                # "phones_masked": [p[:3] + "****" + p[-4:] if len(p) >= 11 else p for p in selected_phones],
-                # "snapshot": snapshot_path.name,   # 파일명만 남기면 깔끔
-                "app_version": APP_VERSION,
-            })
+            # 삭제 실행 (기록에 성공한 뒤에만 메모리에서 제거되므로 실패해도 순서/내용 그대로)
+            with perf.timed("controller.delete_users"):
+                # 삭제 이벤트 (재생할 수 있도록 전화번호 포함)
+                get_user_projection().append([{
+                    "type": "delete_users",
+                    "deleted_count": len(selected_phones),
+                    "phones": list(selected_phones),
+                    # "snapshot": snapshot_path.name,   # 파일명만 남기면 깔끔
+                    "app_version": APP_VERSION,
+                }], removed=selected_phones)
             logger.info("Delete success: requested=%d", len(selected_phones))
             # 4. View에게 최종 명령
             self.view.show_information("삭제 완료", f"{len(selected_phones)}명의 사용자 정보가 삭제되었습니다.")
             
-            # 5. 메모리 데이터 갱신 및 View 갱신 명령
-            self.users = load_users() # 메모리 데이터 갱신
-            self.update_dashboard_command()
+            # 5. View 갱신 명령 (메모리에서는 이미 삭제, 삭제된 행만 제거)
+            for phone in selected_phones:
+                self._unindex_user(phone)
+            self.selected_phones.difference_update(selected_phones)
+            self.view.show_selection_count(len(self.selected_phones))
+            self.update_rows_command(removed=selected_phones)
             
         except Exception as e:
             logger.exception("Delete failed: requested=%d", len(selected_phones))
@@ -85,29 +221,31 @@ class Controller:
         신규 사용자 등록 플로우를 제어합니다.
         (Dialog 실행 -> 성공 시 Model 호출 -> View 명령)
         """
-        dialog_view = InputDialog(self.view)
+        dialog_view = self._get_dialog("input")
         
         # 1. Dialog 실행: Dialog 내부에서 모든 검증과 확인이 처리됨
-        if dialog_view.exec(): 
+        if self._exec_dialog(dialog_view): 
             # 2. Dialog가 성공적으로 닫혔으므로, Controller는 저장 로직을 실행
             phone, activity_1, activity_2 = dialog_view.get_data()
             try:
-                # 3. Model 호출 (add_usage와 save_users)
-                add_usage(self.users, phone, activity_1, activity_2)
-                save_users(self.users)
-                logger.info("user added: phone=%s activity_1=%d activity_2=%d", phone, activity_1, activity_2)
-                # 4. View에게 최종 명령
-                self.view.show_information("등록 완료", USER_REGISTERED) 
-                self.update_dashboard_command()
-            except Exception:
+                is_new = phone not in self.users
+                # 3. Model 호출 (add_usage와 이벤트 기록)
+                with perf.timed("controller.add_user"):
+                    self._add_usage(phone, activity_1, activity_2, is_new)
+            except Exception as e:
                 logger.exception("user add failed: phone=%s", phone)
+                self.view.show_warning("오류 발생", f"등록 중 오류가 발생했습니다: {e}")
                 return
+            logger.info("user added: phone=%s activity_1=%d activity_2=%d", phone, activity_1, activity_2)
+            # 4. View에게 최종 명령
+            self.view.show_information("등록 완료", USER_REGISTERED) 
+            self._update_user_row(phone, is_new)
 
     # ===================================
     # (기존 사용자) 이용 추가 다이얼로그 (open_usage_dialog 정의)
     # ===================================
     def open_usage_dialog(self):
-        selected_phones = self.view.get_selected_phones()
+        selected_phones = self.get_selected_phones()
         
         if not selected_phones:
             logger.warning("Usage add blocked: no user selected")
@@ -122,19 +260,25 @@ class Controller:
             self.view.show_warning("선택 오류", "하나의 사용자만 선택해주세요.")
             return
 
-        phone = normalize_phone(selected_phones[0])
-        dialog_view = UsageDialog(self.view)
+        phone = selected_phones[0]  # 선택 집합에는 원본 키가 들어 있음
+        dialog_view = self._get_dialog("usage")
         
-        if dialog_view.exec():
+        if self._exec_dialog(dialog_view):
             activity_1, activity_2 = dialog_view.get_data()
+            is_new = phone not in self.users
             
             # Model 호출 (Controller의 책임)
-            add_usage(self.users, phone, activity_1, activity_2)
-            save_users(self.users)
+            try:
+                with perf.timed("controller.add_usage"):
+                    self._add_usage(phone, activity_1, activity_2, is_new)
+            except Exception as e:
+                logger.exception("Usage add failed: phone=%s", phone)
+                self.view.show_warning("오류 발생", f"이용 추가 중 오류가 발생했습니다: {e}")
+                return
             logger.info("Usage added: phone=%s activity_1=%d activity_2=%d", phone, activity_1, activity_2)
             # View에게 완료 메시지 및 갱신 명령
             self.view.show_information("추가 완료", "추가되었습니다.")
-            self.update_dashboard_command()
+            self._update_user_row(phone, is_new)
             
     # ===================================
     # 로그 보기 (open_log_dialog 정의)
@@ -142,12 +286,79 @@ class Controller:
     def open_log_dialog(self):
         """로그 보기 다이얼로그를 열고 실행 플로우를 제어합니다."""
         
-        # 1. View 계층의 Dialog 객체 생성 (Controller의 책임)
+        # 1. View 계층의 Dialog 객체 준비 (Controller의 책임, 한 번 만든 객체 재사용)
         #    self.view를 부모 위젯으로 전달하여 팝업 위치를 지정합니다.
-        dialog_view = LogDialog(self.view)
+        dialog_view = self._get_dialog("log")
         
         # 2. Dialog 실행 명령 (Controller의 책임)
-        dialog_view.exec()
+        self._exec_dialog(dialog_view)
+        
+    # ===================================
+    # 다이얼로그 캐시 (_get_dialog, prewarm_dialogs 정의)
+    # ===================================
+    def _get_dialog(self, name):
+        """다이얼로그 인스턴스를 처음 한 번만 만들고 이후에는 재사용 (모듈 import도 이때)"""
+        dialog_view = self._dialogs.get(name)
+        if dialog_view is None:
+            started = time.perf_counter()
+            module_name, class_name = DIALOG_CLASSES[name]
+            dialog_class = getattr(import_module(module_name), class_name)
+            dialog_view = dialog_class(self.view)
+            self._dialogs[name] = dialog_view
+            logger.info("Dialog created: %s (%.1fms)", class_name, (time.perf_counter() - started) * 1000)
+        return dialog_view
+    
+    def _exec_dialog(self, dialog_view):
+        """입력값 초기화 후 modal 실행 (열기 → 화면 표시까지 걸린 시간 기록)"""
+        started = time.perf_counter()
+        dialog_view.reset()
+        name = type(dialog_view).__name__
+
+        def log_latency():
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info("Dialog open latency: %s %.1fms", name, elapsed_ms)
+            perf.record_ms(f"dialog.open.{name}", elapsed_ms)
+        # exec()의 이벤트 루프가 처음 돌 때 = 다이얼로그가 화면에 표시된 직후
+        QTimer.singleShot(0, log_latency)
+        return dialog_view.exec()
+    
+    def prewarm_dialogs(self):
+        """
+        시작 후 유휴 시간에 다이얼로그를 미리 만들어 둔다.
+        한 번에 하나씩 만들고 다음 것은 이벤트 루프에 양보한 뒤 만든다 (메인 창 응답성 유지).
+        """
+        pending = [name for name in PREWARM_DIALOGS if name not in self._dialogs]
+        if not pending:
+            return
+        self._get_dialog(pending[0])
+        if len(pending) > 1:
+            QTimer.singleShot(0, self.prewarm_dialogs)
+
+    # ===================================
+    # 진단
+    # ===================================
+    def memory_structures(self):
+        """메모리 진단 대상: 이름 → 객체 (앞에 있는 구조부터 측정, 공유 객체는 먼저 잰 쪽에 포함)"""
+        structures = {
+            "users": self.users,
+            "search_index": self.search_index,
+            "search_cache": self.search_cache,
+            "user_indexes": self.user_indexes,
+            "selected_phones": self.selected_phones,
+            **self.view.memory_structures(),
+        }
+        log_dialog = self._dialogs.get("log")
+        if log_dialog is not None:
+            structures.update(log_dialog.log_model.memory_structures())
+        # 아직 불러오지 않은 인덱스는 진단 때문에 새로 불러오지 않음
+        structures["history_index"] = loaded_history_index()
+        structures["history_stats"] = get_history_stats()
+        return structures
+
+    def show_memory_report(self):
+        """구조별 메모리 사용량 + 프로세스 RSS 보고 (로그에도 기록, 기준값 초과 시 경고 포함)"""
+        report = memory.build_report(self.memory_structures())
+        self.view.show_report("메모리 사용량", report)
     
     # ===================================
     # 포인트 지급 처리 (handle_reward_click 정의)
@@ -155,8 +366,8 @@ class Controller:
     def handle_reward_click(self):
         """선택된 사용자에게 포인트 지급을 처리하는 플로우를 제어합니다."""
         
-        # 1. 🟢 View에게 선택된 전화번호 목록 요청 (View의 책임)
-        selected_phones = self.view.get_selected_phones() 
+        # 1. 🟢 선택된 전화번호 목록 (Controller가 보관하는 선택 집합)
+        selected_phones = self.get_selected_phones() 
 
         if not selected_phones:
             logger.warning("Reward blocked: no selection")
@@ -192,127 +403,320 @@ class Controller:
         
         # 중복 클릭 방지
         self.view.set_reward_button_enabled(False)
-        try:
-            success = 0
-            errors = 0
-            # 4. 🟢 Model 호출: 비즈니스 로직 실행 및 데이터 저장
-            for phone in eligible:
-                # 사용자 데이터 업데이트 (Model/Calculator의 책임)
-                result = apply_reward(self.users[phone], points=POINTS_TO_GIVE, counts_for_reward=COUNTS_FOR_REWARD)
-                if not result["ok"]:
-                    errors += 1
-                    count_before = result.get("count_before", "?")
-                    self.view.show_warning(
-                        "처리 오류",
-                        f"현재 누적 횟수는 {count_before}회입니다."
-                    )
-                    continue
-                
-                success += 1
-                # 로그 기록 (Model/Storage의 책임)
-                save_history({
-                    "type": "reward",
-                    "phone": phone, 
-                    "points": POINTS_TO_GIVE,
-                    "count_before": result['count_before'],
-                    "count_after" : result['count_after'],
-                    "counts_for_reward": COUNTS_FOR_REWARD,
-                    "reason": f"누적 {COUNTS_FOR_REWARD}회 달성",
-                    "app_version": APP_VERSION,
-                })
-            save_history({
+        
+        # 4. 🟢 Model 호출: 작업 스레드에서 계산(복사본) → 모두 저장 또는 모두 롤백
+        from ui.workers import RewardBatchTask
+        task = RewardBatchTask(
+            self.users, eligible,
+            batch_entry={
                 "type": "reward_batch",
-                "selected":len(selected_phones),
+                "selected": len(selected_phones),
                 "eligible": len(eligible),
                 "excluded": len(insufficient),
-                "success": success,
-                "errors" : errors,
                 "counts_for_reward": COUNTS_FOR_REWARD,
                 "app_version": APP_VERSION,
-            })
-            logger.info("Reward batch done: selected=%d eligible=%d excluded=%d success=%d errors=%d",
-            len(selected_phones), len(eligible), len(insufficient), success, errors)
-            
-            
-            # 사용자 데이터 파일에 저장 (Model/Storage의 책임)
-            save_users(self.users)
-            
-            # 5. View에게 최종 명령
-            self.view.show_information("지급 완료", f"{success}명 지급 완료")
-            
-            # 6. View에게 대시보드 갱신 명령
-            self.update_dashboard_command()
-        except Exception as e:
-            logger.exception("Reward batch failed: selected=%d eligible=%d", len(selected_phones), len(eligible))
-            self.view.show_warning("오류", f"처리 중 오류가 발생했습니다: {e}")
-        finally:
-            self.view.set_reward_button_enabled(True)
+            },
+            points=POINTS_TO_GIVE,
+            counts_for_reward=COUNTS_FOR_REWARD,
+            # 대량 지급이면 정렬 인덱스도 작업 스레드에서 새로 만듦
+            index_factory=UserIndexes if self.user_indexes.prefers_rebuild(len(eligible)) else None,
+        )
+        task.signals.progress.connect(self.view.update_progress)
+        task.signals.committing.connect(lambda: self.view.set_progress_label("저장 중...", cancellable=False))
+        task.signals.finished.connect(self._on_reward_batch_finished)
+        task.signals.cancelled.connect(self._on_reward_batch_cancelled)
+        task.signals.failed.connect(self._on_reward_batch_failed)
+        self._reward_task = task
+        # 진행 창은 modal: 작업 중 다른 조작으로 users가 바뀌지 않도록
+        self.view.start_progress("포인트 지급", f"{len(eligible)}명 포인트 지급 중...", len(eligible), task.cancel)
+        logger.info("Reward batch started: selected=%d eligible=%d excluded=%d",
+                    len(selected_phones), len(eligible), len(insufficient))
+        QThreadPool.globalInstance().start(task)
+        
+    @perf.timed("controller.reward_batch_finished")
+    def _on_reward_batch_finished(self, result, indexes):
+        """[작업 완료] 저장까지 끝난 지급 결과를 메모리/화면에 반영"""
+        self._reward_task = None
+        self.view.finish_progress()
+        self.view.set_reward_button_enabled(True)
+        
+        # 작업 스레드의 계산 + 저장 시간
+        perf.record_ms("rewards.batch", result.elapsed * 1000)
+        
+        # 메모리 데이터는 작업 스레드에서 기록과 함께 이미 반영됨 (self.users = 공유 사용자 상태)
+        rewarded = result.rewarded
+        if indexes is not None:
+            self.user_indexes = indexes
+        else:
+            for phone in rewarded:
+                self._index_user(phone)
+        logger.info("Reward batch done: success=%d errors=%d elapsed=%.3fs (%.0f users/sec)",
+                    len(rewarded), len(result.errors), result.elapsed, result.users_per_sec())
+        
+        # 5. View에게 최종 명령
+        if result.errors:
+            self.view.show_warning(
+                "처리 오류",
+                f"{len(result.errors)}명은 누적 횟수가 부족하여 지급하지 못했습니다."
+            )
+        self.view.show_information("지급 완료", f"{len(rewarded)}명 지급 완료")
+        
+        # 6. View에게 지급된 사용자 행만 갱신 명령
+        self.update_rows_command(updated=rewarded)
+        
+    def _on_reward_batch_cancelled(self, result):
+        """[작업 취소] 계산 도중 취소 → 저장된 것이 없으므로 화면도 그대로"""
+        self._reward_task = None
+        self.view.finish_progress()
+        self.view.set_reward_button_enabled(True)
+        self.view.show_information("지급 취소", "포인트 지급이 취소되었습니다. 변경된 내용은 없습니다.")
+        
+    def _on_reward_batch_failed(self, message):
+        """[작업 실패] 저장 실패 시 지급 로그도 롤백되어 변경된 내용 없음"""
+        self._reward_task = None
+        self.view.finish_progress()
+        self.view.set_reward_button_enabled(True)
+        self.view.show_warning("오류", f"처리 중 오류가 발생했습니다: {message}")
         
     # ===================================
     # 검색 (filter_table 정의)
     # ===================================
+    @perf.timed("controller.filter_table")
     def filter_table(self):
         """
         View로부터 검색 키워드를 받아 사용자 목록을 필터링하고 View에게 렌더링을 명령합니다.
+        (검색 버튼 클릭 및 입력 중 검색(debounce) 모두 이 메서드를 호출)
         """
         # 1. View에게 검색 키워드 요청 (View가 input 필드 값을 읽어옴)
         keyword = self.view.get_search_keyword() 
+        self.query.keyword = keyword or None
 
         if not keyword:
             # 2. 키워드가 없으면 전체 목록 갱신 명령을 내립니다.
             self.update_dashboard_command()
             return
         
-        # 3. Controller 내부에서 검색 로직 처리 및 데이터 준비
-        # _prepare_display_data가 Model 데이터를 필터링하고 가공합니다.
-        data_for_view = self._prepare_display_data(keyword)
+        # 3. 검색어 + 현재 필터/정렬 조건으로 화면 갱신
+        self._render_query()
+
+    # ===================================
+    # 필터 / 정렬 (handle_filter_change, sort_by_column 정의)
+    # ===================================
+    @perf.timed("controller.handle_filter_change")
+    def handle_filter_change(self):
+        """View의 필터 조건(지급 필요, 남은 횟수, 포인트)을 읽어 목록을 다시 조회합니다."""
+        options = self.view.get_filter_options()
+        self.query.needs_reward = options.get("needs_reward", False)
+        self.query.max_remaining = options.get("max_remaining")
+        self.query.points_over = options.get("points_over")
+        logger.info("Filter changed: %s", options)
+        self._render_query()
+
+    @perf.timed("controller.sort_by_column")
+    def sort_by_column(self, column):
+        """
+        헤더 클릭 시 해당 컬럼으로 정렬합니다. (같은 컬럼을 다시 누르면 순서 반전)
+        정렬 인덱스가 없는 컬럼은 무시합니다.
+        """
+        sort_key = SORT_COLUMNS.get(column)
+        if sort_key is None:
+            return
+        if self.query.sort_key == sort_key:
+            self.query.descending = not self.query.descending
+        else:
+            self.query.sort_key = sort_key
+            self.query.descending = False
+        self.view.set_sort_indicator(column, self.query.descending)
+        self._render_query()
 
-        # 4. 🟢 View에게 렌더링 명령 (View의 render_user_list 메서드 호출)
-        self.view.render_user_list(data_for_view)
+    def _render_query(self):
+        """현재 조건으로 조회한 사용자 목록을 View에게 렌더링 명령"""
+        # 결과가 직전 화면과 같으면 다시 그리지 않음 (입력 중 검색 지연 최소화)
+        phones = self._query_phones()
+        if phones == self._last_rendered_phones:
+            return
+
+        # 🟢 View에게 렌더링 명령 (행 데이터는 View가 보이는 행만 요청)
+        self.view.render_user_list(phones)
+        self._last_rendered_phones = phones
     
+    # ===================================
+    # 선택 (set_user_selected, select_* 정의)
+    # ===================================
+    def get_selected_phones(self):
+        """선택된 사용자 전화번호를 등록 순서로 반환 (선택 수에 비례)"""
+        return self.search_index.ordered(self.selected_phones)
+
+    def set_user_selected(self, phone, selected):
+        """View에서 체크박스가 바뀌었을 때 선택 집합에 반영"""
+        if selected:
+            self.selected_phones.add(phone)
+        else:
+            self.selected_phones.discard(phone)
+        self.view.show_selection_count(len(self.selected_phones))
+
+    @perf.timed("controller.select_all_filtered")
+    def select_all_filtered(self):
+        """현재 검색/필터 조건에 맞는 사용자 전체 선택"""
+        self._set_selection(self._query_phones(), True)
+
+    @perf.timed("controller.select_all_eligible")
+    def select_all_eligible(self):
+        """지급 가능(누적 횟수 기준 이상) 사용자 전체 선택 (정렬 인덱스 범위 조회)"""
+        eligible = self.user_indexes.indexes["total_counts"].iter_range(COUNTS_FOR_REWARD)
+        self._set_selection(list(eligible), True)
+
+    @perf.timed("controller.invert_selection")
+    def invert_selection(self):
+        """현재 검색/필터 조건에 맞는 사용자의 선택 반전"""
+        phones = self._query_phones()
+        selected = self.selected_phones
+        to_select = [phone for phone in phones if phone not in selected]
+        to_clear = [phone for phone in phones if phone in selected]
+        self._set_selection(to_clear, False)
+        self._set_selection(to_select, True)
+
+    @perf.timed("controller.clear_selection")
+    def clear_selection(self):
+        """전체 선택 해제"""
+        self._set_selection(list(self.selected_phones), False)
+
+    def _set_selection(self, phones, selected):
+        """선택 집합 갱신 후 View에게 해당 행 체크 상태만 반영하라고 명령"""
+        if selected:
+            self.selected_phones.update(phones)
+        else:
+            self.selected_phones.difference_update(phones)
+        self.view.set_rows_checked(phones, selected)
+        self.view.show_selection_count(len(self.selected_phones))
+        logger.info("Selection changed: %s %d (total=%d)",
+                    "select" if selected else "clear", len(phones), len(self.selected_phones))
+
     # -------------------------------------------------------------
     # 2. Data Preparation & Command (데이터 준비 및 갱신 명령)
     # -------------------------------------------------------------
 
+    @perf.timed("controller.update_dashboard_command")
     def update_dashboard_command(self):
         """View에게 화면 갱신을 명령하기 위한 데이터를 준비합니다."""
         
-        data_for_view = self._prepare_display_data() 
+        self.query.keyword = None
+        phones = self._query_phones() 
+        self._update_column_widths()
         
         # View에게 렌더링 명령 (View가 테이블 조작을 담당)
-        self.view.render_user_list(data_for_view)
+        self.view.render_user_list(phones)
+        self._last_rendered_phones = None
         
         # 2. 🟢 View에게 검색창을 지우라고 명령 (UX 개선)
         self.view.clear_search_input()
 
-    def _prepare_display_data(self, keyword=None):
-        """실제 화면에 표시할 데이터를 Model로부터 조합하고 가공하여 리스트로 반환"""
-        data_list = []
-        for phone, data in self.users.items():
-            if keyword and keyword not in phone:
-                continue
+    @perf.timed("controller.update_rows_command")
+    def update_rows_command(self, added=(), updated=(), removed=()):
+        """
+        사용자 단위 변경을 View에게 행 단위로 반영하라고 명령합니다.
+        (전체 목록 재구성 없이 변경된 사용자 수에 비례하는 비용)
+        """
+        self._update_column_widths()
+        self._mark_snapshot_dirty()
+        self._refresh_stats()
+        if not self.query.is_default():
+            # 필터/정렬 중에는 행 위치·포함 여부가 바뀔 수 있으므로 인덱스로 다시 조회
+            self._last_rendered_phones = None
+            self._render_query()
+            return
+
+        keyword = self.query.keyword
+        # 검색 중이면 검색어에 맞는 신규 사용자만 화면에 추가
+        added = [phone for phone in added if not keyword or keyword in phone]
 
-            # 1. 🟢 Model로부터 원시 값 및 캐시 값 읽어오기
-            activity_1 = data.get('activity_1', 0)
-            activity_2 = data.get('activity_2', 0)
-            
-            # 🟢 [수정됨] 캐시된 total_points 값을 사용 (성능 최적화)
-            # 데이터 파일에 해당 필드가 없을 경우를 대비해 기본값 0을 설정
-            total_points = data.get('total_points', 0)
-            
-            # 2. View를 위한 최종 값 계산 (Controller의 책임)
-            total_counts = activity_1 + activity_2
-            reward_needed = check_reward_needed(total_counts)
-            remaining = get_remaining(total_counts, COUNTS_FOR_REWARD)
-            
-            # 3. View가 렌더링할 최종 딕셔너리 포장
-            data_list.append({
-                'phone': phone,               
-                'activity_1': activity_1,           
-                'activity_2': activity_2,
-                'total_counts': total_counts, 
-                'reward_needed': reward_needed,
-                'remaining': remaining,      
-                'total_points': total_points # 캐시된 값 사용
-            })
-        return data_list
\ No newline at end of file
+        self.view.apply_row_changes(added, updated, removed)
+
+        # 화면의 행 구성이 바뀌었으므로 검색 결과 비교 기준 초기화
+        if added or removed:
+            self._last_rendered_phones = None
+
+    def _update_column_widths(self):
+        """숫자 컬럼 너비 갱신 명령 (최댓값은 정렬 인덱스에서 바로 읽음, 행 수와 무관)"""
+        indexes = self.user_indexes.indexes
+        self.view.update_column_widths({
+            "total_counts": indexes["total_counts"].max_value(),
+            "remaining": indexes["remaining"].max_value(),
+        })
+
+    def _add_usage(self, phone, activity_1, activity_2, is_new):
+        """이용 추가 + 이벤트 기록 (기록에 성공한 뒤에만 메모리에 반영, 실패하면 예외 전달)"""
+        single = {} if is_new else {phone: dict(self.users[phone])}
+        add_usage(single, phone, activity_1, activity_2)
+        # 이용 추가 이벤트 (사용자 상태 재생 / 통계 집계의 이용 횟수·신규 등록 원본)
+        get_user_projection().append([{
+            "type": "usage",
+            "phone": phone,
+            "activity_1": activity_1,
+            "activity_2": activity_2,
+            "new_user": is_new,
+            "app_version": APP_VERSION,
+        }], changed=single)
+        self._index_user(phone)
+
+    def _refresh_stats(self):
+        """통계 패널 갱신 명령 (로그에 추가된 기록만 집계에 반영, 조회는 O(1))"""
+        stats = get_history_stats()
+        stats.refresh()
+        self.view.show_stats(len(self.users), stats.summary())
+
+    def _update_user_row(self, phone, is_new):
+        """사용자 1명 추가/수정 후 해당 행만 갱신"""
+        if is_new:
+            self.update_rows_command(added=[phone])
+        else:
+            self.update_rows_command(updated=[phone])
+
+    @perf.timed("controller.query_phones")
+    def _query_phones(self):
+        """현재 조건(self.query)에 맞는 전화번호를 표시 순서대로 반환 (인덱스 기반)"""
+        query = self.query
+        # 검색 인덱스로 일치하는 사용자만 찾는다 (전체 순회 X)
+        keyword_phones = self.search_cache.search(query.keyword) if query.keyword else None
+        if query.is_default():
+            return keyword_phones if keyword_phones is not None else list(self.users)
+        return self.user_indexes.query(query, self.users, keyword_phones, self.search_index.ordered)
+
+    def _index_user(self, phone):
+        """사용자 추가/변경 후 검색·정렬 인덱스 갱신"""
+        self.search_index.add(phone)
+        self.user_indexes.update(phone, self.users[phone])
+
+    def _unindex_user(self, phone):
+        """사용자 삭제 후 검색·정렬 인덱스에서 제거"""
+        self.search_index.remove(phone)
+        self.user_indexes.remove(phone)
+
+    def _build_display_row(self, phone, data=None):
+        """사용자 1명의 데이터를 View가 렌더링할 딕셔너리로 가공 (View 모델이 보이는 행만 요청)"""
+        if data is None:
+            data = self.users[phone]
+        # 1. 🟢 Model로부터 원시 값 및 캐시 값 읽어오기
+        activity_1 = data.get('activity_1', 0)
+        activity_2 = data.get('activity_2', 0)
+        
+        # 🟢 [수정됨] 캐시된 total_points 값을 사용 (성능 최적화)
+        # 데이터 파일에 해당 필드가 없을 경우를 대비해 기본값 0을 설정
+        total_points = data.get('total_points', 0)
+        
+        # 2. View를 위한 최종 값 계산 (Controller의 책임)
+        total_counts = activity_1 + activity_2
+        reward_needed = check_reward_needed(total_counts)
+        remaining = get_remaining(total_counts, COUNTS_FOR_REWARD)
+        
+        # 3. View가 렌더링할 최종 딕셔너리 포장
+        return {
+            'phone': phone,               
+            'selected': phone in self.selected_phones,
+            'activity_1': activity_1,           
+            'activity_2': activity_2,
+            'total_counts': total_counts, 
+            'reward_needed': reward_needed,
+            'remaining': remaining,      
+            'total_points': total_points # 캐시된 값 사용
+        }
@@ -0,0 +1,394 @@
+# modules/history_index.py
+"""
+포인트 로그(history.jsonl) 조회용 보조 인덱스를 제공한다.
+전화번호/기간/종류로 로그를 걸러 볼 때 전체 로그를 파싱하지 않기 위해 존재한다.
+
+- 전화번호 → 기록 offset 목록, 종류 → 기록 offset 목록
+- 날짜(YYYY-MM-DD) → [첫 기록 offset, 마지막 기록 끝 offset, 건수]
+- data/history.idx.json 에 저장하고, 다음 실행 때는 indexed_upto 이후에 추가된 기록만 읽어 따라잡음
+- 로그 파일이 교체/축소되었으면(끝부분 서명 불일치) 처음부터 다시 만든다
+- 작업 스레드에서 갱신할 수 있도록 진행률 콜백/취소 이벤트를 받고, 취소 시 그때까지 반영한 부분은 유지
+- 따라 읽기/저장/변경 감지는 HistoryFollower로 분리 (통계 집계 modules.stats도 같은 방식)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+
+from .calculator import normalize_phone
+from .storage import HISTORY_FILE, DATA_DIR, iter_history_at, iter_history_reverse
+
+logger = logging.getLogger(__name__)
+
+HISTORY_INDEX_FILE = DATA_DIR / "history.idx.json"
+INDEX_FORMAT_VERSION = 1
+# 서명으로 비교할 indexed_upto 직전 바이트 수
+TAIL_SIGNATURE_SIZE = 64
+# 따라잡은 기록이 이만큼 이상이면 인덱스 파일을 다시 저장
+INDEX_SAVE_MIN_LINES = 500
+# 진행률 보고/취소 확인 간격 (기록 수)
+PROGRESS_EVERY_LINES = 2000
+# 로그 기록 종류 (type이 없는 이전 기록은 reward)
+ENTRY_TYPES = ("reward", "reward_batch", "delete_users", "usage", "points_adjust")
+
+
+@dataclass
+class HistoryFilter:
+    """
+    로그 조회 조건
+
+    Attributes:
+        phone: 전화번호 (숫자만 비교, 일부만 입력하면 부분 일치)
+        date_from: 시작일 "YYYY-MM-DD" (포함)
+        date_to: 종료일 "YYYY-MM-DD" (포함)
+        entry_type: 기록 종류 (ENTRY_TYPES: reward / reward_batch / delete_users / usage / points_adjust, None이면 전체)
+    """
+    phone: str | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+    entry_type: str | None = None
+
+    def __post_init__(self):
+        self.phone = normalize_phone(self.phone) or None
+
+    def has_date_range(self) -> bool:
+        return self.date_from is not None or self.date_to is not None
+
+    def is_empty(self) -> bool:
+        return not self.phone and not self.has_date_range() and self.entry_type is None
+
+    def matches(self, entry: dict) -> bool:
+        """기록 1건이 조건을 만족하는지"""
+        if self.entry_type is not None and entry.get("type", "reward") != self.entry_type:
+            return False
+        if self.phone and self.phone not in entry.get("phone", ""):
+            return False
+        if self.has_date_range():
+            day = entry.get("date", "")[:10]
+            if not day:
+                return False
+            if self.date_from is not None and day < self.date_from:
+                return False
+            if self.date_to is not None and day > self.date_to:
+                return False
+        return True
+
+
+class HistoryFollower:
+    """
+    history.jsonl을 따라 읽으며 파생 데이터를 유지하는 공통 부분
+
+    - indexed_upto 이후에 추가된 기록만 _add로 반영하고, state_path에 저장해 다음 실행 때 이어서 읽음
+    - indexed_upto 직전 바이트 서명(tail)이 다르면 로그가 교체/축소된 것 → 처음부터 다시 만듦
+    - 하위 클래스는 _reset_state / _state / _restore_state / _add 를 구현한다
+    """
+
+    FORMAT_VERSION = INDEX_FORMAT_VERSION
+    # 한 번의 갱신에서 이만큼 이상 반영하면 저장
+    SAVE_MIN_LINES = INDEX_SAVE_MIN_LINES
+    # 로그 메시지에 쓸 이름
+    label = "history 파생 데이터"
+
+    def __init__(self, history_path: Path, state_path: Path):
+        self.history_path = history_path
+        self.state_path = state_path
+        self._lock = threading.RLock()   # 갱신은 한 스레드씩
+        self._saved_upto = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self.indexed_upto = 0
+        self.tail = ""
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        raise NotImplementedError
+
+    def _state(self) -> dict:
+        """저장할 파생 데이터 (indexed_upto/tail/version 제외)"""
+        raise NotImplementedError
+
+    def _restore_state(self, saved: dict) -> None:
+        """저장된 파생 데이터 복원 (키가 없거나 형식이 다르면 KeyError/TypeError/ValueError)"""
+        raise NotImplementedError
+
+    def _add(self, offset: int, end: int, entry: dict) -> None:
+        """기록 1건 반영 (offset: 줄 시작, end: 다음 줄 시작)"""
+        raise NotImplementedError
+
+    # ---------------------------------------------------------
+    # 저장 / 불러오기
+    # ---------------------------------------------------------
+    def load(self, progress=None, cancel=None) -> None:
+        """저장된 데이터를 읽고 로그 파일과 맞춰 따라잡는다. (없거나 맞지 않으면 다시 생성)"""
+        with self._lock:
+            self._load_saved()
+            self.refresh(progress, cancel)
+
+    def rebuild(self, progress=None, cancel=None) -> int:
+        """저장된 데이터를 버리고 로그 전체를 처음부터 한 번 읽어 다시 만든다."""
+        with self._lock:
+            self._reset()
+            added = self._refresh(progress, cancel)
+            self.save()
+            return added
+
+    def _load_saved(self) -> None:
+        try:
+            saved = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if saved.get("version") != self.FORMAT_VERSION:
+                raise ValueError("format version mismatch")
+            self.indexed_upto = saved["indexed_upto"]
+            self.tail = saved["tail"]
+            self._restore_state(saved)
+            self._saved_upto = self.indexed_upto
+        except FileNotFoundError:
+            logger.info("%s 없음 - 새로 생성: %s", self.label, self.state_path)
+            self._reset()
+        except (ValueError, KeyError, TypeError):
+            logger.warning("%s 손상/형식 불일치 - 다시 생성: %s", self.label, self.state_path)
+            self._reset()
+        except OSError:
+            logger.exception("%s 읽기 실패(OS) - 다시 생성: %s", self.label, self.state_path)
+            self._reset()
+
+    def save(self) -> None:
+        """임시파일에 쓴 뒤 교체 (파생 데이터라 .bak은 남기지 않음)"""
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        with self._lock:
+            try:
+                tmp_path.write_text(
+                    json.dumps({
+                        "version": self.FORMAT_VERSION,
+                        "indexed_upto": self.indexed_upto,
+                        "tail": self.tail,
+                        **self._state(),
+                    }, ensure_ascii=False, separators=(",", ":")),
+                    encoding="utf-8"
+                )
+                os.replace(tmp_path, self.state_path)
+                self._saved_upto = self.indexed_upto
+                logger.debug("%s 저장: %s (upto=%d)", self.label, self.state_path, self.indexed_upto)
+            except OSError:
+                # 언제든 다시 만들 수 있으므로 저장 실패는 기록만 남긴다
+                logger.exception("%s 저장 실패: %s", self.label, self.state_path)
+
+    def save_if_changed(self) -> None:
+        """마지막 저장 이후 반영한 기록이 있으면 저장 (앱 종료 시)"""
+        if self.indexed_upto != self._saved_upto:
+            self.save()
+
+    def _read_tail(self, f, end: int) -> str:
+        start = max(0, end - TAIL_SIGNATURE_SIZE)
+        f.seek(start)
+        return f.read(end - start).hex()
+
+    # ---------------------------------------------------------
+    # 증분 갱신
+    # ---------------------------------------------------------
+    def refresh(self, progress=None, cancel=None) -> int:
+        """
+        indexed_upto 이후에 추가된 기록을 반영한다.
+
+        Args:
+            progress: progress(읽은 바이트, 전체 바이트) 콜백 (작업 스레드에서 호출됨)
+            cancel: set()되면 중단하는 threading.Event (중단 전까지 반영한 부분은 유지)
+
+        Returns:
+            int: 새로 반영한 기록 수
+        """
+        with self._lock:
+            return self._refresh(progress, cancel)
+
+    def _refresh(self, progress, cancel) -> int:
+        try:
+            f = self.history_path.open("rb")
+        except FileNotFoundError:
+            if self.indexed_upto:
+                self._reset()
+            return 0
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            if size < self.indexed_upto or self._read_tail(f, self.indexed_upto) != self.tail:
+                logger.warning("history.jsonl 변경 감지(교체/축소) - %s 다시 생성", self.label)
+                self._reset()
+            if size == self.indexed_upto:
+                return 0
+
+            added = 0
+            offset = self.indexed_upto
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # 아직 쓰는 중이거나 끊긴 마지막 줄: 다음 갱신 때 다시 읽음
+                if line.strip():
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logger.error("history.jsonl 손상된 줄 제외(%s): offset=%d", self.label, offset)
+                    else:
+                        self._add(offset, offset + len(line), entry)
+                        added += 1
+                        if added % PROGRESS_EVERY_LINES == 0:
+                            if progress is not None:
+                                progress(offset, size)
+                            if cancel is not None and cancel.is_set():
+                                offset += len(line)
+                                logger.info("%s 갱신 취소: upto=%d/%d", self.label, offset, size)
+                                break
+                offset += len(line)
+
+            self.indexed_upto = offset
+            self.tail = self._read_tail(f, offset)
+
+        if added:
+            logger.info("%s 갱신: +%d건 (upto=%d)", self.label, added, self.indexed_upto)
+        if added >= self.SAVE_MIN_LINES:
+            self.save()
+        return added
+
+
+class HistoryIndex(HistoryFollower):
+    """history.jsonl 보조 인덱스 (추가된 기록만 증분 반영)"""
+
+    label = "history 인덱스"
+
+    def __init__(self, history_path: Path = HISTORY_FILE, index_path: Path = HISTORY_INDEX_FILE):
+        super().__init__(history_path, index_path)
+
+    def _reset_state(self) -> None:
+        self.phones: dict[str, list[int]] = {}
+        self.types: dict[str, list[int]] = {}
+        self.days: dict[str, list[int]] = {}
+
+    def _state(self) -> dict:
+        return {"phones": self.phones, "types": self.types, "days": self.days}
+
+    def _restore_state(self, saved: dict) -> None:
+        self.phones = saved["phones"]
+        self.types = saved["types"]
+        self.days = saved["days"]
+
+    def _add(self, offset: int, end: int, entry: dict) -> None:
+        phone = entry.get("phone")
+        if phone:
+            self.phones.setdefault(phone, []).append(offset)
+        self.types.setdefault(entry.get("type", "reward"), []).append(offset)
+        day = entry.get("date", "")[:10]
+        if day:
+            span = self.days.get(day)
+            if span is None:
+                self.days[day] = [offset, end, 1]
+            else:
+                # 시계가 되돌아간 경우에도 해당 날짜 기록을 모두 포함하도록 구간을 넓힘
+                span[0] = min(span[0], offset)
+                span[1] = max(span[1], end)
+                span[2] += 1
+
+    # ---------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------
+    def _phone_offsets(self, phone: str) -> list[int]:
+        """전화번호 일치 기록 offset (정확히 일치하는 번호가 없으면 부분 일치)"""
+        exact = self.phones.get(phone)
+        if exact is not None:
+            return exact
+        matched = [offsets for key, offsets in self.phones.items() if phone in key]
+        if len(matched) == 1:
+            return matched[0]
+        return sorted(offset for offsets in matched for offset in offsets)
+
+    def _date_span(self, flt: HistoryFilter):
+        """기간에 속한 날짜들의 (시작 offset, 끝 offset, 건수). 해당 날짜가 없으면 None."""
+        spans = [
+            span for day, span in self.days.items()
+            if (flt.date_from is None or day >= flt.date_from)
+            and (flt.date_to is None or day <= flt.date_to)
+        ]
+        if not spans:
+            return None
+        return min(s[0] for s in spans), max(s[1] for s in spans), sum(s[2] for s in spans)
+
+    def query(self, flt: HistoryFilter, progress=None, cancel=None):
+        """
+        조건을 만족하는 기록을 최신 기록부터 반환한다.
+
+        - 전화번호/종류 offset 목록과 기간 구간 중 가장 작은 후보만 읽고 나머지 조건은 기록에서 검증
+        - 기간 구간이 가장 작으면 그 구간만 파일 끝 방향에서 거꾸로 읽음
+
+        Args:
+            flt: 조회 조건
+            progress: 인덱스 갱신 진행률 콜백 (refresh 참고)
+            cancel: 인덱스 갱신 취소 이벤트 (refresh 참고)
+
+        Returns:
+            Iterator[tuple[int, dict]]: (줄 시작 offset, 기록)
+        """
+        self.refresh(progress, cancel)
+        if flt.is_empty():
+            return iter_history_reverse(end=self.indexed_upto)
+
+        start, end = 0, self.indexed_upto
+        span_count = None
+        if flt.has_date_range():
+            span = self._date_span(flt)
+            if span is None:
+                return iter(())
+            start, end, span_count = span
+
+        # 후보 offset 목록 (기간 구간으로 잘라 둠)
+        candidates = None
+        for offsets in (
+            self._phone_offsets(flt.phone) if flt.phone else None,
+            self.types.get(flt.entry_type, []) if flt.entry_type is not None else None,
+        ):
+            if offsets is None:
+                continue
+            lo, hi = bisect_left(offsets, start), bisect_left(offsets, end)
+            if candidates is None or hi - lo < len(candidates):
+                candidates = offsets[lo:hi]
+
+        if candidates is None or (span_count is not None and span_count < len(candidates)):
+            records = iter_history_reverse(end=end)
+            return (
+                (offset, entry) for offset, entry in _take_from(records, start)
+                if flt.matches(entry)
+            )
+        return (
+            (offset, entry) for offset, entry in iter_history_at(reversed(candidates))
+            if flt.matches(entry)
+        )
+
+
+def _take_from(records, start: int):
+    """거꾸로 읽는 기록에서 start offset 이전 기록이 나오면 멈춘다."""
+    for offset, entry in records:
+        if offset < start:
+            return
+        yield offset, entry
+
+
+_history_index: HistoryIndex | None = None
+_history_index_lock = threading.Lock()
+
+
+def loaded_history_index() -> HistoryIndex | None:
+    """이미 불러온 히스토리 인덱스 (없으면 None, 새로 불러오지 않음)"""
+    return _history_index
+
+
+def get_history_index(progress=None, cancel=None) -> HistoryIndex:
+    """앱 전체에서 공유하는 히스토리 인덱스 (처음 호출 시 불러오고, 이후엔 추가분만 반영)"""
+    global _history_index
+    with _history_index_lock:
+        if _history_index is None:
+            index = HistoryIndex()
+            index.load(progress, cancel)
+            _history_index = index
+    return _history_index
@@ -0,0 +1,256 @@
+# modules/memory.py
+"""
+메모리 사용량 진단 (Qt 비의존)
+4GB 매장 PC에서 사용자 데이터 / 인덱스 / 로그 행이 실제로 얼마나 차지하는지 확인하기 위해 존재한다.
+
+- measure_structures: 구조별 항목 수 / 객체 수 / 깊은 크기(deep size)
+- process_memory_kb: 프로세스 현재 RSS / 최대 RSS
+- RssMonitor: interval마다 RSS를 로그에 기록하고 기준값을 넘으면 경고
+- 기준값(MB)은 환경 변수로 변경: CPM_MEM_WARN_RSS_MB / CPM_MEM_WARN_STRUCT_MB
+
+실행 (앱 없이 체크포인트 / 로그를 읽어 같은 구조를 만든 뒤 보고, src에서):
+    python -m modules.memory
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+logger = logging.getLogger(__name__)
+
+RSS_WARN_ENV = "CPM_MEM_WARN_RSS_MB"
+STRUCT_WARN_ENV = "CPM_MEM_WARN_STRUCT_MB"
+MONITOR_INTERVAL_ENV = "CPM_MEM_LOG_INTERVAL_MIN"
+# 4GB PC 기준: 프로세스 1GB / 구조 하나 256MB를 넘으면 경고
+DEFAULT_RSS_WARN_MB = 1024
+DEFAULT_STRUCT_WARN_MB = 256
+DEFAULT_MONITOR_INTERVAL_MIN = 10
+
+# 따라가지 않는 객체 (코드/모듈/클래스는 데이터가 아님)
+_SKIP_TYPES = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType)
+_SEQUENCE_TYPES = (list, tuple, set, frozenset, deque)
+# 다른 객체를 참조하지 않는 값 (자주 나오므로 먼저 확인)
+_LEAF_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _env_mb(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %s", name, os.getenv(name), default)
+        return default
+
+
+# ---------------------------------------------------------
+# 측정
+# ---------------------------------------------------------
+def deep_sizeof(obj, seen: set[int] | None = None) -> tuple[int, int]:
+    """
+    obj에서 닿는 파이썬 객체의 크기 합(byte)과 객체 수
+    (seen에 이미 있는 객체는 세지 않음 → 여러 구조가 공유하는 객체는 먼저 잰 쪽에 포함)
+    """
+    seen = set() if seen is None else seen
+    getsizeof = sys.getsizeof
+    size = count = 0
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        o = pop()
+        oid = id(o)
+        if oid in seen:
+            continue
+        cls = type(o)
+        if cls in _LEAF_TYPES:
+            seen.add(oid)
+            size += getsizeof(o)
+            count += 1
+            continue
+        if isinstance(o, _SKIP_TYPES):
+            continue
+        seen.add(oid)
+        size += getsizeof(o)
+        count += 1
+        if isinstance(o, _SEQUENCE_TYPES):
+            extend(o)
+        elif isinstance(o, dict):
+            extend(o.keys())
+            extend(o.values())
+        else:
+            attrs = getattr(o, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            for slot in getattr(cls, "__slots__", ()):
+                if hasattr(o, slot):
+                    stack.append(getattr(o, slot))
+    return size, count
+
+
+@dataclass
+class StructureUsage:
+    name: str
+    items: int | None     # len()이 있으면 항목 수
+    objects: int
+    bytes: int
+
+
+def measure_structures(structures: dict) -> list[StructureUsage]:
+    """이름 → 객체 딕셔너리를 앞에서부터 측정 (None은 건너뜀)"""
+    seen: set[int] = set()
+    usages = []
+    for name, obj in structures.items():
+        if obj is None:
+            continue
+        size, objects = deep_sizeof(obj, seen)
+        try:
+            items = len(obj)
+        except TypeError:
+            items = None
+        usages.append(StructureUsage(name, items, objects, size))
+    return usages
+
+
+def process_memory_kb() -> tuple[int | None, int | None]:
+    """(현재 RSS, 최대 RSS) KB (알 수 없으면 None)"""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None, None
+        return counters.WorkingSetSize // 1024, counters.PeakWorkingSetSize // 1024
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak = peak // 1024 if sys.platform == "darwin" else peak   # macOS는 byte 단위
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            rss_pages = int(f.read().split()[1])
+        return rss_pages * os.sysconf("SC_PAGE_SIZE") // 1024, peak
+    except OSError:   # /proc 없음 (macOS)
+        return None, peak
+
+
+# ---------------------------------------------------------
+# 보고 / 경고
+# ---------------------------------------------------------
+def check_thresholds(usages: list[StructureUsage], rss_kb: int | None) -> list[str]:
+    """기준값을 넘은 항목 경고 (로그 + 반환)"""
+    warnings = []
+    rss_limit = _env_mb(RSS_WARN_ENV, DEFAULT_RSS_WARN_MB)
+    struct_limit = _env_mb(STRUCT_WARN_ENV, DEFAULT_STRUCT_WARN_MB)
+    if rss_kb is not None and rss_kb / 1024 > rss_limit:
+        warnings.append(f"프로세스 메모리 {rss_kb / 1024:.0f}MB > 기준 {rss_limit}MB")
+    for usage in usages:
+        if usage.bytes / 1024 / 1024 > struct_limit:
+            warnings.append(f"{usage.name} {usage.bytes / 1024 / 1024:.0f}MB > 기준 {struct_limit}MB")
+    for message in warnings:
+        logger.warning("Memory threshold exceeded: %s", message)
+    return warnings
+
+
+def format_report(usages: list[StructureUsage], rss_kb: int | None, peak_kb: int | None,
+                  warnings: list[str] = ()) -> str:
+    lines = [f"{'구조':<24}{'항목':>10}{'객체':>12}{'크기(MB)':>11}"]
+    for usage in usages:
+        items = f"{usage.items:,}" if usage.items is not None else "-"
+        lines.append(f"{usage.name:<24}{items:>10}{usage.objects:>12,}{usage.bytes / 1024 / 1024:>11.1f}")
+    total = sum(usage.bytes for usage in usages)
+    lines.append(f"{'합계':<24}{'':>10}{sum(u.objects for u in usages):>12,}{total / 1024 / 1024:>11.1f}")
+    rss = f"{rss_kb / 1024:.0f}MB" if rss_kb is not None else "?"
+    peak = f"{peak_kb / 1024:.0f}MB" if peak_kb is not None else "?"
+    lines.append(f"\n프로세스 메모리: 현재 {rss} / 최대 {peak}")
+    lines.extend(f"경고: {message}" for message in warnings)
+    return "\n".join(lines)
+
+
+def build_report(structures: dict) -> str:
+    """구조 측정 + RSS + 기준값 확인 후 보고서 문자열 (로그에도 기록)"""
+    started = time.perf_counter()
+    usages = measure_structures(structures)
+    rss_kb, peak_kb = process_memory_kb()
+    report = format_report(usages, rss_kb, peak_kb, check_thresholds(usages, rss_kb))
+    logger.info("Memory report (%.0fms)\n%s", (time.perf_counter() - started) * 1000, report)
+    return report
+
+
+class RssMonitor:
+    """interval마다 프로세스 RSS를 로그에 기록 (기준값을 처음 넘을 때 경고, 내려가면 다시 감시)"""
+
+    def __init__(self, interval_min: float = DEFAULT_MONITOR_INTERVAL_MIN):
+        self.interval_s = interval_min * 60
+        self.limit_mb = _env_mb(RSS_WARN_ENV, DEFAULT_RSS_WARN_MB)
+        self._over = False
+        self._timer: threading.Timer | None = None
+
+    def sample(self) -> None:
+        rss_kb, peak_kb = process_memory_kb()
+        if rss_kb is None:
+            return
+        logger.info("Process memory: rss=%.0fMB peak=%.0fMB", rss_kb / 1024, (peak_kb or 0) / 1024)
+        over = rss_kb / 1024 > self.limit_mb
+        if over and not self._over:
+            logger.warning("Memory threshold exceeded: rss %.0fMB > %sMB", rss_kb / 1024, self.limit_mb)
+        self._over = over
+
+    def start(self) -> None:
+        self.sample()
+        if self.interval_s > 0:
+            self._schedule()
+
+    def _schedule(self) -> None:
+        def tick():
+            self.sample()
+            self._schedule()
+        self._timer = threading.Timer(self.interval_s, tick)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+# ---------------------------------------------------------
+# CLI
+# ---------------------------------------------------------
+def main() -> None:
+    from .history_index import get_history_index
+    from .projection import get_user_projection
+    from .search_index import PhoneSearchIndex
+    from .stats import get_history_stats
+    from .user_query import UserIndexes
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s | %(name)s | %(message)s")
+    users = get_user_projection().users
+    search_index = PhoneSearchIndex(users)
+    structures = {
+        "users": users,
+        "search_index": search_index,
+        "user_indexes": UserIndexes(users),
+        "history_index": get_history_index(),
+        "history_stats": get_history_stats(),
+    }
+    print(build_report(structures))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtCore import Qt
 
 def show_warning(parent_widget: QWidget, title: str, message: str):
     """경고 메시지 실행"""
@@ -17,4 +19,11 @@ def ask_confirmation(parent_widget: QWidget, title: str, question: str) -> bool:
         parent_widget, title, question,
         QMessageBox.Yes | QMessageBox.No, QMessageBox.No 
     )
-    return result == QMessageBox.Yes
\ No newline at end of file
+    return result == QMessageBox.Yes
+
+def show_report(parent_widget: QWidget, title: str, text: str):
+    """표 형식 텍스트 보고서 실행 (고정폭 글꼴, 내용 복사 가능)"""
+    box = QMessageBox(QMessageBox.Information, title, text, QMessageBox.Ok, parent_widget)
+    box.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+    box.setTextInteractionFlags(Qt.TextSelectableByMouse)
+    box.exec()
@@ -14,6 +14,9 @@ from pathlib import Path
 import os
 import sys
 
+# 데이터/백업/로그 기준 경로를 바꾸는 환경 변수 (data_base_dir 참고)
+DATA_DIR_ENV = "CPM_DATA_DIR"
+
 def is_frozen() -> bool:
     """
     PyInstaller 실행 여부를 반환한다.
@@ -77,6 +80,7 @@ def data_base_dir() -> Path:
     """
     데이터/백업/로그 기준 경로를 반환한다.
 
+    - CPM_DATA_DIR 환경 변수가 있으면 그 경로 (벤치마크/배치 실행 등 별도 데이터로 실행할 때)
     - exe 실행: AppData
     - 소스 실행: 프로젝트 루트
 
@@ -86,6 +90,9 @@ def data_base_dir() -> Path:
     Returns:
         Path: 데이터 기준 경로
     """
+    override = os.getenv(DATA_DIR_ENV)
+    if override:
+        return Path(override).resolve()
     if is_frozen():
         return _user_data_dir("ClientPointManager", "ClientPointManager")
     return find_project_root(Path(__file__).resolve())
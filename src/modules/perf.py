@@ -0,0 +1,211 @@
+# modules/perf.py
+"""
+주요 경로 지연 시간/쓰기 크기 측정 (Qt 비의존)
+app.log의 개별 INFO 줄만으로는 느려진 정도를 알 수 없어, 분포(p50/p95/p99)를 보기 위해 존재한다.
+
+- timed("이름"): 데코레이터 또는 with 문으로 소요 시간 기록
+- record_bytes("이름", 크기): 쓰기 크기 기록
+- 고정 구간 히스토그램 (구간 수만큼의 정수 카운터 → 기록 비용/메모리 일정)
+- enable() 전에는 호출마다 플래그 한 번만 확인하고 바로 원래 함수 실행
+- 켜져 있으면 interval마다, 그리고 종료 시 요약을 로그로 남김
+
+사용:
+    python src/main.py --perf          (또는 CPM_PERF=1, 요약 간격: CPM_PERF_INTERVAL_MIN)
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+PERF_ENV = "CPM_PERF"
+PERF_INTERVAL_ENV = "CPM_PERF_INTERVAL_MIN"
+DEFAULT_INTERVAL_MIN = 10
+
+# 구간 상한 (마지막 구간은 그 이상 전부)
+LATENCY_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+SIZE_BOUNDS_BYTES = tuple(1024 * 4 ** i for i in range(11))   # 1KB ~ 1GB
+
+_enabled = False
+_lock = threading.Lock()
+_histograms: dict[str, "Histogram"] = {}
+_timer: threading.Timer | None = None
+
+
+class Histogram:
+    """고정 구간 히스토그램 (백분위는 해당 구간 안에서 선형 보간한 추정값)"""
+
+    def __init__(self, bounds, unit):
+        self.bounds = bounds
+        self.unit = unit
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                return min(self.max, lower + (upper - lower) * (rank - seen) / n)
+            seen += n
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def _histogram(name: str, bounds, unit) -> Histogram:
+    hist = _histograms.get(name)
+    if hist is None:
+        with _lock:
+            hist = _histograms.setdefault(name, Histogram(bounds, unit))
+    return hist
+
+
+def record_ms(name: str, elapsed_ms: float) -> None:
+    if _enabled:
+        hist = _histogram(name, LATENCY_BOUNDS_MS, "ms")
+        with _lock:
+            hist.add(elapsed_ms)
+
+
+def record_bytes(name: str, size: int) -> None:
+    if _enabled:
+        hist = _histogram(name + ".bytes", SIZE_BOUNDS_BYTES, "B")
+        with _lock:
+            hist.add(size)
+
+
+class timed:
+    """
+    소요 시간 기록 (데코레이터 / with 문 겸용)
+
+        @timed("storage.load_users")
+        def load_users(): ...
+
+        with timed("controller.add_usage"):
+            ...
+    """
+
+    __slots__ = ("name", "_started")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._started = None
+
+    def __enter__(self):
+        if _enabled:
+            self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._started is not None:
+            record_ms(self.name, (time.perf_counter() - self._started) * 1000)
+            self._started = None
+        return False
+
+    def __call__(self, fn):
+        name = self.name
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_ms(name, (time.perf_counter() - started) * 1000)
+        return wrapper
+
+
+# ---------------------------------------------------------
+# 요약 / 켜기·끄기
+# ---------------------------------------------------------
+def snapshot() -> dict[str, dict]:
+    """이름 → 요약 (count/mean/p50/p95/p99/max, 단위는 unit)"""
+    with _lock:
+        return {name: {"unit": hist.unit, **hist.summary()} for name, hist in sorted(_histograms.items())}
+
+
+def log_summary(reason: str = "periodic") -> None:
+    stats = snapshot()
+    if not stats:
+        return
+    lines = [f"Perf summary ({reason}, 시작 이후 누적)"]
+    for name, s in stats.items():
+        lines.append(
+            f"  {name:<40} n={s['count']:<7} p50={s['p50']:.1f} p95={s['p95']:.1f} "
+            f"p99={s['p99']:.1f} max={s['max']:.1f} {s['unit']}"
+        )
+    logger.info("\n".join(lines))
+
+
+def _schedule(interval_s: float) -> None:
+    global _timer
+    if not _enabled:
+        return
+
+    def tick():
+        log_summary()
+        _schedule(interval_s)
+
+    _timer = threading.Timer(interval_s, tick)
+    _timer.daemon = True
+    _timer.start()
+
+
+def enable(interval_min: float = DEFAULT_INTERVAL_MIN) -> None:
+    """측정 시작 (interval_min분마다 + 종료 시 요약 로그)"""
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    atexit.register(log_summary, "exit")
+    if interval_min and interval_min > 0:
+        _schedule(interval_min * 60)
+    logger.info("Perf instrumentation enabled (summary every %s min)", interval_min)
+
+
+def disable() -> None:
+    global _enabled, _timer
+    _enabled = False
+    if _timer is not None:
+        _timer.cancel()
+        _timer = None
+    atexit.unregister(log_summary)
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
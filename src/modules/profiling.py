@@ -0,0 +1,118 @@
+# modules/profiling.py
+"""
+진단용 프로파일링 모드 (--profile / CPM_PROFILE=1, 메모리: --profile-memory / CPM_PROFILE_MEMORY=1)
+매장 PC에서 느리다는 문의가 오면 짐작 대신 실제로 시간/메모리가 쓰인 곳을 보기 위해 존재한다.
+
+- cProfile: 켜진 시점부터 이벤트 루프 종료까지 GUI 스레드의 함수별 호출 횟수/시간
+  (작업 스레드(QRunnable)는 포함되지 않음 → 해당 작업은 --perf 히스토그램으로 확인)
+- tracemalloc: 시작 / 첫 화면 표시(데이터 연결 후) / 종료 시점 스냅샷 (추적 시작 이전 할당은 제외)
+- 결과는 로그 폴더에 저장
+    profile-<시각>.txt  : 상위 N개 요약 (바로 읽을 수 있는 텍스트)
+    profile-<시각>.zip  : 요약 + cProfile 원본(.prof) + tracemalloc 스냅샷 → 이 파일 하나만 받으면 됨
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "CPM_PROFILE"
+PROFILE_MEMORY_ENV = "CPM_PROFILE_MEMORY"
+# 요약에 표시할 상위 항목 수
+TOP_N = 30
+# tracemalloc이 할당마다 저장할 호출 스택 깊이 (깊을수록 메모리/속도 부담 증가)
+TRACEMALLOC_FRAMES = 10
+
+
+class ProfileSession:
+    """cProfile + (선택) tracemalloc 수집 후 로그 폴더에 요약/원본 저장"""
+
+    def __init__(self, out_dir: Path, trace_memory: bool = False, top_n: int = TOP_N):
+        self.out_dir = out_dir
+        self.trace_memory = trace_memory
+        self.top_n = top_n
+        self.stamp = time.strftime("%Y%m%d-%H%M%S")
+        self._profiler = cProfile.Profile()
+        self._snapshots: list[tuple[str, tracemalloc.Snapshot]] = []
+        self._started = None
+
+    def start(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.snapshot("startup")
+        self._started = time.perf_counter()
+        self._profiler.enable()
+        logger.info("Profiling started (memory=%s)", self.trace_memory)
+
+    def snapshot(self, label: str) -> None:
+        """tracemalloc 스냅샷 (trace_memory=False면 무시)"""
+        if self.trace_memory and tracemalloc.is_tracing():
+            self._snapshots.append((label, tracemalloc.take_snapshot()))
+
+    def stop(self) -> Path | None:
+        """
+        수집을 끝내고 결과 저장 (한 번만 동작)
+
+        Returns:
+            Path | None: 전달용 zip 파일 경로 (이미 멈췄으면 None)
+        """
+        if self._started is None:
+            return None
+        self._profiler.disable()
+        elapsed = time.perf_counter() - self._started
+        self._started = None
+        self.snapshot("exit")
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        base = self.out_dir / f"profile-{self.stamp}"
+        summary = self.summary(elapsed)
+        base.with_suffix(".txt").write_text(summary, encoding="utf-8")
+
+        bundle = base.with_suffix(".zip")
+        with tempfile.TemporaryDirectory() as tmp, \
+                zipfile.ZipFile(bundle, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("summary.txt", summary)
+            prof_path = Path(tmp) / "cpu.prof"
+            self._profiler.dump_stats(prof_path)
+            zf.write(prof_path, "cpu.prof")
+            for label, snap in self._snapshots:
+                snap_path = Path(tmp) / f"memory-{label}.tracemalloc"
+                snap.dump(str(snap_path))
+                zf.write(snap_path, snap_path.name)
+        logger.info("Profile saved: %s (summary: %s)", bundle, base.with_suffix(".txt").name)
+        return bundle
+
+    # ---------------------------------------------------------
+    # 요약
+    # ---------------------------------------------------------
+    def summary(self, elapsed: float) -> str:
+        out = io.StringIO()
+        out.write(f"Profile {self.stamp}  (측정 {elapsed:.1f}s, GUI 스레드)\n")
+        for sort_key, title in (("cumulative", "누적 시간 상위"), ("tottime", "자체 시간 상위")):
+            out.write(f"\n=== CPU: {title} {self.top_n} ({sort_key}) ===\n")
+            stats = pstats.Stats(self._profiler, stream=out)
+            stats.strip_dirs().sort_stats(sort_key).print_stats(self.top_n)
+
+        if self._snapshots:
+            for label, snap in self._snapshots:
+                stats = snap.statistics("lineno")
+                total = sum(stat.size for stat in stats)
+                out.write(f"\n=== 메모리: {label} (추적 중 할당 {total / 1024 / 1024:.1f}MB) 상위 {self.top_n} ===\n")
+                for stat in stats[:self.top_n]:
+                    out.write(f"{stat}\n")
+            first, last = self._snapshots[0][1], self._snapshots[-1][1]
+            out.write(f"\n=== 메모리: {self._snapshots[0][0]} → {self._snapshots[-1][0]} 증가 상위 {self.top_n} ===\n")
+            for stat in last.compare_to(first, "lineno")[:self.top_n]:
+                out.write(f"{stat}\n")
+        return out.getvalue()
@@ -0,0 +1,267 @@
+# modules/projection.py
+"""
+사용자 상태 = 체크포인트 + 이후 이벤트(history.jsonl) 재생 (Qt 비의존)
+users.json과 로그가 어긋나지 않도록(저장 도중 종료 등) 로그를 기준으로 사용자 상태를 만들기 위해 존재한다.
+
+- 모든 변경(이용 추가 usage / 지급 reward / 삭제 delete_users / 포인트 보정 points_adjust)은 history.jsonl에 이벤트로만 기록
+  → 변경 1건의 저장 = 로그 한 줄 추가 (users.json 전체를 다시 쓰지 않음)
+- data/users.checkpoint.json: 사용자 상태 + 어느 로그 위치(indexed_upto)까지 반영했는지
+- 시작 시 체크포인트를 읽고 그 이후 이벤트만 재생 → 시작 시간은 전체 로그가 아니라
+  마지막 체크포인트 이후 이벤트 수에 비례
+- 체크포인트는 이벤트 CHECKPOINT_EVERY건마다 + 종료 시(save_if_changed) 저장,
+  users.json도 이때 같은 내용으로 갱신 (사람이 읽는 사본 / 이전 버전 호환)
+- 체크포인트가 없거나 로그가 교체/축소되었으면 users.json을 현재 로그 끝 기준 상태로 보고 새로 시작
+  (이벤트에 전화번호가 없던 이전 로그는 재생할 수 없으므로)
+- 따라 읽기/저장/변경 감지는 HistoryFollower와 같음 (modules.history_index)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from . import perf
+from .calculator import add_usage, apply_reward, COUNTS_FOR_REWARD
+from .history_index import HistoryFollower
+from .storage import DATA_DIR, HISTORY_FILE, append_history_span, load_users, save_users
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = DATA_DIR / "users.checkpoint.json"
+CHECKPOINT_EVERY_ENV = "CPM_CHECKPOINT_EVERY"
+# 체크포인트 간격 (이벤트 수): 시작 시 재생할 이벤트 수의 상한
+DEFAULT_CHECKPOINT_EVERY = 500
+# 로그 끝의 완전한 줄 위치를 찾을 때 거꾸로 읽는 크기
+_TAIL_SCAN_BLOCK = 4096
+
+
+def _checkpoint_every() -> int:
+    try:
+        return max(1, int(os.getenv(CHECKPOINT_EVERY_ENV, DEFAULT_CHECKPOINT_EVERY)))
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %s", CHECKPOINT_EVERY_ENV, os.getenv(CHECKPOINT_EVERY_ENV),
+                       DEFAULT_CHECKPOINT_EVERY)
+        return DEFAULT_CHECKPOINT_EVERY
+
+
+def apply_event(users: dict, entry: dict) -> bool:
+    """
+    이벤트 1건을 사용자 상태에 반영한다.
+
+    Returns:
+        bool: 상태를 바꾸는 이벤트였으면 True (reward_batch 요약 등은 False)
+    """
+    entry_type = entry.get("type", "reward")
+    if entry_type == "usage":
+        add_usage(users, entry["phone"], entry.get("activity_1", 0), entry.get("activity_2", 0))
+        return True
+
+    if entry_type == "reward":
+        phone = entry["phone"]
+        data = users.get(phone)
+        if data is None:
+            logger.warning("Event replay mismatch: reward for unknown user phone=%s date=%s", phone, entry.get("date"))
+            return False
+        outcome = apply_reward(data, points=entry.get("points", 0),
+                               counts_for_reward=entry.get("counts_for_reward", COUNTS_FOR_REWARD))
+        if not outcome["ok"] or outcome["count_after"] != entry.get("count_after", outcome["count_after"]):
+            logger.warning("Event replay mismatch: reward phone=%s logged %s→%s, replayed %s→%s",
+                           phone, entry.get("count_before"), entry.get("count_after"),
+                           outcome["count_before"], outcome.get("count_after"))
+        return True
+
+    if entry_type == "delete_users":
+        phones = entry.get("phones")
+        if phones is None:
+            logger.warning("Event replay skipped: delete_users without phones (old format) date=%s count=%s",
+                           entry.get("date"), entry.get("deleted_count"))
+            return False
+        for phone in phones:
+            users.pop(phone, None)
+        return True
+
+    if entry_type == "points_adjust":
+        data = users.get(entry["phone"])
+        if data is None:
+            logger.warning("Event replay mismatch: points_adjust for unknown user phone=%s date=%s",
+                           entry["phone"], entry.get("date"))
+            return False
+        data["total_points"] = entry["points_after"]
+        return True
+
+    return False
+
+
+class UserProjection(HistoryFollower):
+    """
+    history.jsonl 이벤트로 만든 사용자 상태 (체크포인트 이후 이벤트만 재생)
+
+    - 앱/CLI/API는 같은 프로세스 안에서 이 객체의 users(dict 하나)를 함께 쓰고,
+      변경은 users를 직접 바꾸지 않고 append(entries, changed, removed)로 기록 → 기록에 성공한 뒤에만 반영
+    - 다른 프로세스가 그 사이 로그를 추가했으면(stale) 이번 실행 동안은 체크포인트를 쓰지 않음
+      → 다음 시작 때 마지막 체크포인트부터 두 쪽 이벤트를 모두 재생
+    """
+
+    label = "사용자 체크포인트"
+
+    def __init__(self, history_path: Path = HISTORY_FILE, checkpoint_path: Path = CHECKPOINT_FILE,
+                 checkpoint_every: int | None = None):
+        self.SAVE_MIN_LINES = checkpoint_every or _checkpoint_every()
+        super().__init__(history_path, checkpoint_path)
+
+    def _reset_state(self) -> None:
+        self.users: dict[str, dict] = {}
+        self.checkpointed = False   # 시작점(체크포인트 또는 users.json)이 정해졌는지
+        self.stale = False
+        self.pending = 0            # 마지막 체크포인트 이후 이벤트 수
+        self.replayed = 0           # 이번 실행에서 로그에서 읽어 재생한 이벤트 수
+
+    def _state(self) -> dict:
+        return {"users": self.users}
+
+    def _restore_state(self, saved: dict) -> None:
+        users = saved["users"]
+        if not isinstance(users, dict):
+            raise TypeError("users must be an object")
+        self.users = users
+        self.checkpointed = True
+
+    def _add(self, offset: int, end: int, entry: dict) -> None:
+        apply_event(self.users, entry)
+        self.pending += 1
+        self.replayed += 1
+
+    # ---------------------------------------------------------
+    # 시작점
+    # ---------------------------------------------------------
+    def _matches_history(self) -> bool:
+        try:
+            f = self.history_path.open("rb")
+        except FileNotFoundError:
+            return self.indexed_upto == 0
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            return size >= self.indexed_upto and self._read_tail(f, self.indexed_upto) == self.tail
+
+    def _complete_end(self) -> tuple[int, str]:
+        """로그 끝의 마지막 완전한 줄 끝 위치와 서명 (파일이 없으면 (0, ""))"""
+        try:
+            f = self.history_path.open("rb")
+        except FileNotFoundError:
+            return 0, ""
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            while pos > 0:
+                start = max(0, pos - _TAIL_SCAN_BLOCK)
+                f.seek(start)
+                newline = f.read(pos - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    return end, self._read_tail(f, end)
+                pos = start
+            return 0, ""
+
+    def _start_from(self, users: dict) -> None:
+        """users를 현재 로그 끝 기준 상태로 보고 새 체크포인트 저장"""
+        shared = self.users
+        self._reset()
+        # 이미 나눠 준 dict는 그대로 두고 내용만 교체 (앱/CLI/API가 같은 dict를 봄)
+        if users is not shared:
+            shared.clear()
+            shared.update(users)
+        self.users = shared
+        self.indexed_upto, self.tail = self._complete_end()
+        self.checkpointed = True
+        self.save()
+
+    def _refresh(self, progress, cancel) -> int:
+        if not self.checkpointed or not self._matches_history():
+            if self.checkpointed:
+                logger.warning("history.jsonl 변경 감지(교체/축소) - users.json 기준으로 %s 새로 시작", self.label)
+            else:
+                logger.info("%s 없음 - users.json 기준으로 시작: %s", self.label, self.state_path)
+            self._start_from(load_users())
+        return super()._refresh(progress, cancel)
+
+    def reset(self, users: dict) -> None:
+        """로그 파일을 다시 쓴 뒤(compact 등) users를 현재 로그 끝 기준 상태로 새로 시작"""
+        with self._lock:
+            self._start_from(users)
+            logger.info("%s 다시 시작: users=%d upto=%d", self.label, len(self.users), self.indexed_upto)
+
+    # ---------------------------------------------------------
+    # 변경 기록 / 체크포인트
+    # ---------------------------------------------------------
+    @perf.timed("projection.append")
+    def append(self, entries: list[dict], changed: dict | None = None, removed=()) -> None:
+        """
+        이벤트를 로그에 추가하고, 기록에 성공하면 변경분을 self.users에 반영한다.
+        (기록에 실패하면 예외만 전달하고 상태는 그대로, 이벤트 CHECKPOINT_EVERY건마다 체크포인트)
+
+        Args:
+            entries: 추가할 이벤트 (date는 여기서 채움)
+            changed: 추가/변경된 사용자 (전화번호 → 새 데이터 dict, self.users의 값을 직접 바꾸지 않은 것)
+            removed: 삭제된 전화번호
+        """
+        with self._lock:
+            start, end = append_history_span(entries)
+            for phone in removed:
+                self.users.pop(phone, None)
+            if changed:
+                self.users.update(changed)
+            if self.stale:
+                return
+            if start != self.indexed_upto:
+                self.stale = True
+                logger.warning("history.jsonl에 다른 곳에서 추가된 기록 있음 (expected=%d actual=%d) - "
+                               "이번 실행 동안 %s 중단, 다음 시작 때 이벤트 재생",
+                               self.indexed_upto, start, self.label)
+                return
+            with self.history_path.open("rb") as f:
+                self.tail = self._read_tail(f, end)
+            self.indexed_upto = end
+            self.pending += len(entries)
+            if self.pending >= self.SAVE_MIN_LINES:
+                self.save()
+
+    def save(self) -> None:
+        """체크포인트 저장 후 users.json도 같은 내용으로 갱신 (stale이면 저장하지 않음)"""
+        with self._lock:
+            if self.stale:
+                return
+            with perf.timed("projection.checkpoint"):
+                super().save()
+                if self._saved_upto != self.indexed_upto:
+                    return   # 체크포인트 저장 실패 (기록됨) → 다음 이벤트 때 다시
+                self.pending = 0
+                try:
+                    save_users(self.users)
+                except Exception:
+                    # 사본이므로 체크포인트는 유지 (다음 체크포인트 때 다시)
+                    logger.exception("users.json 사본 저장 실패: users=%d upto=%d", len(self.users), self.indexed_upto)
+
+
+_user_projection: UserProjection | None = None
+_user_projection_lock = threading.Lock()
+
+
+def loaded_user_projection() -> UserProjection | None:
+    """이미 불러온 사용자 상태 (없으면 None, 새로 불러오지 않음)"""
+    return _user_projection
+
+
+def get_user_projection(progress=None, cancel=None) -> UserProjection:
+    """프로세스 전체에서 공유하는 사용자 상태 (처음 호출 시 체크포인트를 읽고 이후 이벤트를 재생)"""
+    global _user_projection
+    with _user_projection_lock:
+        if _user_projection is None:
+            started = time.perf_counter()
+            projection = UserProjection()
+            projection.load(progress, cancel)
+            logger.info("User state ready: users=%d replayed=%d (%.1fms)",
+                        len(projection.users), projection.replayed, (time.perf_counter() - started) * 1000)
+            _user_projection = projection
+    return _user_projection
@@ -0,0 +1,241 @@
+# modules/reconcile.py
+"""
+사용자 total_points ↔ 로그 지급 합계 대조 (Qt 비의존)
+users의 total_points가 로그의 지급 기록 합과 맞는지 확인하고, 어긋난 사용자를 보고/보정하기 위해 존재한다.
+
+- 사용자마다 get_total_points를 부르면 O(사용자 × 로그) → 로그를 한 번만 읽어 전화번호별 합계를 만든다
+- 로그를 줄 경계에 맞춘 구간으로 나눠 프로세스 풀에서 동시에 합산한 뒤 순서대로 합침
+  (작은 로그 / CPU 1개면 풀 없이 바로 읽음)
+- 합계 규칙 = 사용자 상태 재생과 같음 (modules.projection)
+  · reward: points를 더함
+  · delete_users: 그 전화번호의 합계를 0부터 다시 (재등록한 사용자)
+  · points_adjust: 보정 후 값부터 다시
+- 지급과 관계없는 줄(이용 추가 등)은 JSON 파싱 전에 바이트 검사로 건너뜀
+- 결과: 어긋난 사용자 CSV 보고서(로그 폴더), --fix면 points_adjust 이벤트로 로그 합계에 맞춤
+
+실행 (src에서):
+    python -m modules.cli reconcile [--fix] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import perf
+
+logger = logging.getLogger(__name__)
+
+# 이 크기보다 작은 로그는 프로세스 풀 없이 읽음 (풀 시작 비용 > 나눠 읽는 이득)
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+# 작업자 1명당 구간 수 (구간마다 지급 기록 비율이 달라도 고르게 끝나도록)
+RANGES_PER_WORKER = 4
+# 합계에 영향을 주는 줄만 파싱 ("points" / "points_before" / "points_after" 키, 삭제 기록)
+_POINTS_MARK = b'"points'
+_DELETE_MARK = b"delete_users"
+
+REPORT_FIELDS = ("phone", "users_points", "history_points", "diff", "rewards")
+
+
+@dataclass
+class Discrepancy:
+    phone: str
+    users_points: int
+    history_points: int
+    rewards: int       # 합계에 들어간 지급 기록 수
+
+    @property
+    def diff(self) -> int:
+        return self.users_points - self.history_points
+
+
+@dataclass
+class ReconcileResult:
+    checked_users: int = 0
+    history_lines: int = 0
+    corrupt_lines: int = 0
+    reward_entries: int = 0
+    # 전화번호가 없는 이전 형식 삭제 기록 수 (이후 재등록한 사용자는 이전 지급까지 합산될 수 있음)
+    legacy_deletes: int = 0
+    # 로그에 지급 기록은 있지만 users에 없는 전화번호 수 (삭제된 사용자)
+    orphan_phones: int = 0
+    mismatches: list[Discrepancy] = field(default_factory=list)
+    workers: int = 1
+    elapsed: float = 0.0
+
+
+# ---------------------------------------------------------
+# 구간 합산 (작업 프로세스에서 실행)
+# ---------------------------------------------------------
+def split_ranges(path: Path, end: int, parts: int) -> list[tuple[int, int]]:
+    """[0, end)를 parts개 이하의 줄 경계 구간으로 나눈다."""
+    if end <= 0:
+        return []
+    cuts = [0]
+    with path.open("rb") as f:
+        for i in range(1, parts):
+            f.seek(end * i // parts)
+            f.readline()            # 다음 줄 시작으로
+            cut = min(f.tell(), end)
+            if cut > cuts[-1]:
+                cuts.append(cut)
+    if cuts[-1] < end:
+        cuts.append(end)
+    return list(zip(cuts, cuts[1:]))
+
+
+def scan_range(path: str, start: int, end: int) -> tuple[dict, int, int, int, int]:
+    """
+    [start, end) 구간의 전화번호별 지급 합계
+
+    Returns:
+        tuple: ({전화번호: [합계, 지급 수, 구간 안에서 다시 시작했는지]}, 줄 수, 손상 줄 수, 지급 기록 수, 이전 형식 삭제 수)
+    """
+    sums: dict[str, list] = {}
+    lines = corrupt = rewards = legacy_deletes = 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            if offset >= end:
+                break
+            offset += len(line)
+            lines += 1
+            if _POINTS_MARK not in line and _DELETE_MARK not in line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                corrupt += 1
+                continue
+            entry_type = entry.get("type", "reward")
+            if entry_type == "reward":
+                phone = entry.get("phone")
+                if not phone:
+                    continue
+                state = sums.get(phone)
+                if state is None:
+                    state = sums[phone] = [0, 0, False]
+                state[0] += entry.get("points", 0)
+                state[1] += 1
+                rewards += 1
+            elif entry_type == "delete_users":
+                phones = entry.get("phones")
+                if phones is None:
+                    legacy_deletes += 1
+                    continue
+                for phone in phones:
+                    sums[phone] = [0, 0, True]
+            elif entry_type == "points_adjust":
+                sums[entry["phone"]] = [entry.get("points_after", 0), 0, True]
+    return sums, lines, corrupt, rewards, legacy_deletes
+
+
+def _merge(total: dict, part: dict) -> None:
+    """앞 구간까지의 합계(total)에 다음 구간 합계를 이어 붙임 (다시 시작한 전화번호는 덮어씀)"""
+    for phone, (points, count, restarted) in part.items():
+        current = total.get(phone)
+        if restarted or current is None:
+            total[phone] = [points, count]
+        else:
+            current[0] += points
+            current[1] += count
+
+
+def history_point_sums(path: Path, end: int, workers: int | None = None,
+                       result: ReconcileResult | None = None) -> dict[str, list[int]]:
+    """
+    로그 [0, end)의 전화번호별 [지급 합계, 지급 수]
+
+    Args:
+        workers: 작업 프로세스 수 (None이면 CPU 수, 1이면 풀 없이)
+        result: 줄 수 / 손상 / 지급 기록 수를 채울 결과 객체
+    """
+    result = result or ReconcileResult()
+    workers = max(1, workers or os.cpu_count() or 1)
+    if end < PARALLEL_MIN_BYTES:
+        workers = 1
+    result.workers = workers
+
+    ranges = split_ranges(path, end, workers * RANGES_PER_WORKER if workers > 1 else 1)
+    if workers == 1:
+        parts = [scan_range(str(path), start, stop) for start, stop in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(scan_range, [str(path)] * len(ranges),
+                                  [start for start, _ in ranges], [stop for _, stop in ranges]))
+
+    total: dict[str, list[int]] = {}
+    for sums, lines, corrupt, rewards, legacy_deletes in parts:
+        _merge(total, sums)
+        result.history_lines += lines
+        result.corrupt_lines += corrupt
+        result.reward_entries += rewards
+        result.legacy_deletes += legacy_deletes
+    return total
+
+
+# ---------------------------------------------------------
+# 대조 / 보고서 / 보정
+# ---------------------------------------------------------
+@perf.timed("reconcile.points")
+def reconcile_points(users: dict, path: Path, end: int, workers: int | None = None) -> ReconcileResult:
+    """
+    users의 total_points와 로그 [0, end)의 지급 합계를 비교한다. (users는 end까지 반영된 상태여야 함)
+    """
+    started = time.perf_counter()
+    result = ReconcileResult()
+    sums = history_point_sums(path, end, workers, result)
+    for phone, data in users.items():
+        users_points = int(data.get("total_points", 0))
+        history_points, rewards = sums.get(phone, (0, 0))
+        if users_points != history_points:
+            result.mismatches.append(Discrepancy(phone, users_points, history_points, rewards))
+    result.checked_users = len(users)
+    result.orphan_phones = sum(1 for phone in sums if phone not in users)
+    result.elapsed = time.perf_counter() - started
+    logger.info("Reconcile done: users=%d lines=%d rewards=%d mismatches=%d orphans=%d workers=%d (%.2fs)",
+                result.checked_users, result.history_lines, result.reward_entries, len(result.mismatches),
+                result.orphan_phones, result.workers, result.elapsed)
+    return result
+
+
+def write_report(result: ReconcileResult, path: Path) -> Path:
+    """어긋난 사용자 CSV (엑셀에서 열 수 있도록 BOM 포함)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(REPORT_FIELDS)
+        for item in result.mismatches:
+            writer.writerow((item.phone, item.users_points, item.history_points, item.diff, item.rewards))
+    logger.info("Reconcile report written: %s (%d rows)", path, len(result.mismatches))
+    return path
+
+
+def adjustment_entries(users: dict, result: ReconcileResult, app_version: str,
+                       source: str) -> tuple[dict, list[dict]]:
+    """
+    어긋난 사용자의 total_points를 로그 합계로 맞출 변경분과 기록할 points_adjust 이벤트 (users는 바꾸지 않음)
+
+    Returns:
+        tuple: (전화번호 → 보정 후 데이터, points_adjust 이벤트 목록)
+    """
+    changed, entries = {}, []
+    for item in result.mismatches:
+        changed[item.phone] = {**users[item.phone], "total_points": item.history_points}
+        entries.append({
+            "type": "points_adjust",
+            "phone": item.phone,
+            "points_before": item.users_points,
+            "points_after": item.history_points,
+            "reason": "로그 지급 합계로 보정",
+            "app_version": app_version,
+            "source": source,
+        })
+    return changed, entries
@@ -0,0 +1,122 @@
+# modules/rewards.py
+"""
+포인트 일괄 지급 계산/저장 로직 (Qt 비의존)
+
+- 계산은 사용자 데이터 복사본에서만 수행 → 도중에 취소하면 아무것도 바뀌지 않음
+- 저장은 지급 이벤트 + reward_batch 요약을 로그에 한 번에 추가 (한 번의 write, 사용자 상태는 이벤트로 만들어짐)
+- 작업 스레드에서 실행할 수 있도록 진행률 콜백/취소 이벤트를 받는다
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from .calculator import apply_reward, COUNTS_FOR_REWARD
+from .projection import get_user_projection
+
+logger = logging.getLogger(__name__)
+
+APP_VERSION = "v1.2"
+POINTS_TO_GIVE = 2000
+# 진행률 보고/취소 확인 간격 (사용자 수)
+PROGRESS_EVERY_USERS = 200
+
+
+@dataclass
+class RewardBatchResult:
+    """
+    일괄 지급 계산 결과
+
+    Attributes:
+        updated: 지급 후 사용자 데이터 (전화번호 → 복사본)
+        entries: 기록할 reward 로그 목록
+        errors: 지급하지 못한 (전화번호, 지급 전 누적 횟수) 목록
+        cancelled: 계산 도중 취소되었는지 (True면 updated/entries는 버려야 함)
+        elapsed: 계산 + 저장에 걸린 시간(초)
+    """
+    updated: dict = field(default_factory=dict)
+    entries: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+    cancelled: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def rewarded(self) -> list[str]:
+        return list(self.updated)
+
+    def users_per_sec(self) -> float:
+        return len(self.updated) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def compute_reward_batch(users, phones, points=POINTS_TO_GIVE, counts_for_reward=COUNTS_FOR_REWARD,
+                         progress=None, cancel=None) -> RewardBatchResult:
+    """
+    사용자별 지급 결과를 복사본으로 계산한다. (users 원본과 파일은 건드리지 않음)
+
+    Args:
+        users: 전체 사용자 데이터 (읽기만 함)
+        phones: 지급할 전화번호 목록
+        points: 1인당 지급 포인트
+        counts_for_reward: 지급 기준 누적 횟수
+        progress: progress(처리한 수, 전체 수) 콜백
+        cancel: set()되면 다음 사용자 전에 중단하는 threading.Event
+
+    Returns:
+        RewardBatchResult: 계산 결과 (취소 시 cancelled=True)
+    """
+    result = RewardBatchResult()
+    started = time.perf_counter()
+    total = len(phones)
+    for done, phone in enumerate(phones):
+        if done % PROGRESS_EVERY_USERS == 0:
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            if progress is not None:
+                progress(done, total)
+
+        data = dict(users[phone])
+        outcome = apply_reward(data, points=points, counts_for_reward=counts_for_reward)
+        if not outcome["ok"]:
+            result.errors.append((phone, outcome.get("count_before", "?")))
+            continue
+        result.updated[phone] = data
+        result.entries.append({
+            "type": "reward",
+            "phone": phone,
+            "points": points,
+            "count_before": outcome['count_before'],
+            "count_after": outcome['count_after'],
+            "counts_for_reward": counts_for_reward,
+            "reason": f"누적 {counts_for_reward}회 달성",
+            "app_version": APP_VERSION,
+        })
+    else:
+        if progress is not None:
+            progress(total, total)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def commit_reward_batch(result: RewardBatchResult, batch_entry: dict) -> dict:
+    """
+    계산 결과를 이벤트로 기록한다. (지급 이벤트 + 요약 로그를 한 번에 추가, 실패하면 아무것도 기록되지 않음)
+    기록에 성공하면 result.updated가 공유 사용자 상태(modules.projection)에 반영된다.
+
+    Args:
+        result: compute_reward_batch 결과
+        batch_entry: 함께 기록할 reward_batch 요약 로그 (success/errors는 여기서 채움)
+
+    Returns:
+        dict: 기록 후 전체 사용자 데이터 (공유 사용자 상태, 복사본 아님)
+    """
+    started = time.perf_counter()
+    batch_entry = {**batch_entry, "success": len(result.updated), "errors": len(result.errors)}
+    projection = get_user_projection()
+    projection.append(result.entries + [batch_entry], changed=result.updated)
+    result.elapsed += time.perf_counter() - started
+    logger.info("Reward batch committed: rewarded=%d errors=%d elapsed=%.3fs (%.0f users/sec)",
+                len(result.updated), len(result.errors), result.elapsed, result.users_per_sec())
+    return projection.users
@@ -0,0 +1,195 @@
+# modules/search_index.py
+"""
+전화번호 부분 검색용 인덱스를 제공한다.
+검색할 때마다 전체 사용자를 순회하지 않고, 일치하는 사용자 수에 비례하는 시간으로
+검색 결과를 돌려주기 위해 존재한다.
+
+- 전화번호의 모든 4글자 조각(4-gram) → 전화번호 집합을 유지
+- 뒷자리 4자리 검색은 조각 하나의 집합이 곧 결과
+- 4글자 초과 검색은 가장 작은 조각 집합만 후보로 두고 부분 문자열 검증
+- 4글자 미만 검색은 검색어를 포함하는 조각 집합들의 합집합
+- 입력 중 검색(search-as-you-type)을 위한 최근 검색 결과 LRU 캐시
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+GRAM_SIZE = 4
+SEARCH_CACHE_SIZE = 32
+
+
+class PhoneSearchIndex:
+    """전화번호 n-gram 인덱스 (사용자 추가/삭제 시 증분 갱신)"""
+
+    def __init__(self, phones=()):
+        self._grams: dict[str, set[str]] = {}
+        self._short: set[str] = set()       # GRAM_SIZE보다 짧은 전화번호
+        self._order: dict[str, int] = {}    # 등록 순서 (결과 정렬용)
+        self._seq = 0
+        self.version = 0                    # 추가/삭제 시 증가 (캐시 무효화용)
+        for phone in phones:
+            self.add(phone)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, phone) -> bool:
+        return phone in self._order
+
+    @staticmethod
+    def _iter_grams(phone: str):
+        """전화번호의 서로 다른 4-gram을 반환한다."""
+        return {phone[i:i + GRAM_SIZE] for i in range(len(phone) - GRAM_SIZE + 1)}
+
+    def add(self, phone: str) -> None:
+        """
+        전화번호를 인덱스에 추가한다. 이미 있으면 아무것도 하지 않는다.
+
+        Args:
+            phone: 사용자 키(전화번호)
+
+        Returns:
+            None
+        """
+        if phone in self._order:
+            return
+        self._order[phone] = self._seq
+        self._seq += 1
+        self.version += 1
+
+        if len(phone) < GRAM_SIZE:
+            self._short.add(phone)
+            return
+        for gram in self._iter_grams(phone):
+            bucket = self._grams.get(gram)
+            if bucket is None:
+                self._grams[gram] = {phone}
+            else:
+                bucket.add(phone)
+
+    def remove(self, phone: str) -> None:
+        """
+        전화번호를 인덱스에서 제거한다. 없으면 아무것도 하지 않는다.
+
+        Args:
+            phone: 사용자 키(전화번호)
+
+        Returns:
+            None
+        """
+        if self._order.pop(phone, None) is None:
+            return
+        self.version += 1
+
+        if len(phone) < GRAM_SIZE:
+            self._short.discard(phone)
+            return
+        for gram in self._iter_grams(phone):
+            bucket = self._grams.get(gram)
+            if bucket is None:
+                continue
+            bucket.discard(phone)
+            if not bucket:
+                del self._grams[gram]
+
+    def search(self, keyword: str) -> list[str]:
+        """
+        keyword를 부분 문자열로 포함하는 전화번호를 등록 순서대로 반환한다.
+
+        Args:
+            keyword: 검색어 (예: 뒷자리 4자리)
+
+        Returns:
+            list[str]: 일치하는 전화번호 목록
+        """
+        if not keyword:
+            return list(self._order)
+
+        matches = {phone for phone in self._short if keyword in phone}
+
+        if len(keyword) == GRAM_SIZE:
+            matches |= self._grams.get(keyword, set())
+        elif len(keyword) > GRAM_SIZE:
+            buckets = []
+            for gram in self._iter_grams(keyword):
+                bucket = self._grams.get(gram)
+                if not bucket:
+                    return self.ordered(matches)
+                buckets.append(bucket)
+            # 가장 작은 후보 집합만 검증
+            candidates = min(buckets, key=len)
+            matches |= {phone for phone in candidates if keyword in phone}
+        else:
+            # 4글자 미만 검색어는 그것을 포함하는 4-gram 집합의 합집합이 곧 결과
+            buckets = [bucket for gram, bucket in self._grams.items() if keyword in gram]
+            if sum(map(len, buckets)) >= len(self._order):
+                # "010"처럼 대부분이 일치하는 검색어는 순차 스캔이 더 싸다
+                return [phone for phone in self._order if keyword in phone]
+            for bucket in buckets:
+                matches |= bucket
+
+        return self.ordered(matches)
+
+    def ordered(self, phones) -> list[str]:
+        """전화번호를 등록 순서로 정렬한다."""
+        order = self._order
+        if len(phones) * 16 > len(order):
+            # 결과가 전체의 상당 부분이면 정렬보다 등록 순서 순회가 빠르다
+            return [phone for phone in order if phone in phones]
+        return sorted(phones, key=order.__getitem__)
+
+
+class SearchResultCache:
+    """
+    최근 검색 결과 LRU 캐시
+
+    - 같은 검색어는 캐시에서 바로 반환
+    - 새 검색어가 캐시된 검색어를 포함하면(예: "12" → "123") 그 결과만 좁혀서 검사
+    - 인덱스가 바뀌면(version 변경) 캐시 전체를 버린다
+    """
+
+    def __init__(self, index: PhoneSearchIndex, maxsize: int = SEARCH_CACHE_SIZE):
+        self.index = index
+        self.maxsize = maxsize
+        self._results: OrderedDict[str, list[str]] = OrderedDict()
+        self._version = index.version
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._version = self.index.version
+
+    def search(self, keyword: str) -> list[str]:
+        """
+        keyword 검색 결과를 반환한다. (캐시 적중 → 좁히기 → 인덱스 검색 순)
+
+        Args:
+            keyword: 검색어
+
+        Returns:
+            list[str]: 일치하는 전화번호 목록 (등록 순서)
+        """
+        if self._version != self.index.version:
+            self.clear()
+
+        results = self._results
+        cached = results.get(keyword)
+        if cached is not None:
+            results.move_to_end(keyword)
+            return cached
+
+        # 새 검색어를 부분 문자열로 포함하는 이전 검색어 중 결과가 가장 작은 것을 기준으로 좁힌다
+        base = None
+        for prev_keyword, prev_result in results.items():
+            if prev_keyword in keyword and (base is None or len(prev_result) < len(base)):
+                base = prev_result
+
+        if base is not None:
+            found = [phone for phone in base if keyword in phone]
+        else:
+            found = self.index.search(keyword)
+
+        results[keyword] = found
+        if len(results) > self.maxsize:
+            results.popitem(last=False)
+        return found
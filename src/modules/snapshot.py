@@ -0,0 +1,189 @@
+# modules/snapshot.py
+"""
+대시보드 스냅샷 (마지막으로 표시한 사용자 목록의 표시용 값, Qt 비의존)
+
+앱 시작 시 사용자 데이터 로드/행 계산이 끝나기 전에 첫 화면을 바로 그리기 위해 존재한다.
+
+- 파일: data/dashboard.snapshot (1행: 헤더 JSON, 2행: 행 목록 JSON)
+- 행: [전화번호, 활동 A, 활동 B, 합계, 남은 횟수, 총 포인트, 지급 필요(0/1)]
+- 헤더의 checksum(행 목록 바이트)으로 손상, source(history.jsonl 크기/수정 시각)로
+  스냅샷 이후 사용자 데이터가 바뀌었는지를 확인 → 어느 쪽이든 맞지 않으면 사용하지 않음
+  (사용자 상태는 로그 이벤트로 만들어지므로(modules.projection) 로그가 그대로면 상태도 그대로)
+- 화면 표시용 보조 파일이므로 언제든 삭제해도 되며, 다음 종료/유휴 시 다시 만들어짐
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from .calculator import check_reward_needed, get_remaining, COUNTS_FOR_REWARD
+from .storage import DATA_DIR, HISTORY_FILE
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = DATA_DIR / "dashboard.snapshot"
+SNAPSHOT_VERSION = 1
+
+# 행 컬럼 위치
+PHONE, ACTIVITY_1, ACTIVITY_2, TOTAL_COUNTS, REMAINING, TOTAL_POINTS, REWARD_NEEDED = range(7)
+
+_write_lock = threading.Lock()
+
+
+def source_signature(path=HISTORY_FILE):
+    """사용자 데이터 상태 식별값 = history.jsonl [크기, 수정 시각(ns)] (없으면 None)"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _derive_row(phone, activity_1, activity_2, total_points):
+    total_counts = activity_1 + activity_2
+    return [
+        phone, activity_1, activity_2, total_counts,
+        get_remaining(total_counts, COUNTS_FOR_REWARD),
+        total_points,
+        int(check_reward_needed(total_counts)),
+    ]
+
+
+def project_row(phone, data):
+    """사용자 1명 → 스냅샷 행 (Controller._build_display_row와 같은 계산)"""
+    return _derive_row(phone, data.get('activity_1', 0), data.get('activity_2', 0), data.get('total_points', 0))
+
+
+def _checksum(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class DashboardSnapshot:
+    """
+    읽어 온 스냅샷 (표시 순서의 전화번호 목록 + 전화번호별 행)
+
+    row_provider(phone)는 Controller._build_display_row와 같은 형태의 딕셔너리를 반환하므로
+    UserTableModel에 그대로 연결할 수 있다. (읽기 전용: 선택 상태는 항상 False)
+    """
+
+    def __init__(self, rows, source=None):
+        self.phones = [row[PHONE] for row in rows]
+        self.rows = {row[PHONE]: row for row in rows}
+        self.source = source
+
+    def __len__(self):
+        return len(self.phones)
+
+    def row_provider(self, phone):
+        row = self.rows[phone]
+        return {
+            'phone': phone,
+            'selected': False,
+            'activity_1': row[ACTIVITY_1],
+            'activity_2': row[ACTIVITY_2],
+            'total_counts': row[TOTAL_COUNTS],
+            'reward_needed': bool(row[REWARD_NEEDED]),
+            'remaining': row[REMAINING],
+            'total_points': row[TOTAL_POINTS],
+        }
+
+    def maxima(self):
+        """숫자 컬럼 너비 계산용 최댓값 (View.update_column_widths 인자 형태)"""
+        rows = self.rows.values()
+        return {
+            "total_counts": max((row[TOTAL_COUNTS] for row in rows), default=0),
+            "remaining": max((row[REMAINING] for row in rows), default=0),
+        }
+
+    def changed_phones(self, users):
+        """
+        실제 데이터와 비교해 값이 다른 전화번호 목록을 반환한다.
+        표시 순서(전화번호 목록)부터 다르면 None (행 단위로 맞출 수 없음 → 전체 다시 표시)
+        """
+        if len(users) != len(self.phones) or any(a != b for a, b in zip(users, self.phones)):
+            return None
+        rows = self.rows
+        return [phone for phone, data in users.items() if project_row(phone, data) != rows[phone]]
+
+
+def capture_snapshot_values(users):
+    """
+    현재 사용자 데이터에서 스냅샷에 필요한 원시 값만 뽑는다. (GUI 스레드에서 호출)
+    합계/남은 횟수 등 계산과 파일 쓰기는 write_snapshot에서 (작업 스레드 가능)
+    """
+    return [
+        (phone, data.get('activity_1', 0), data.get('activity_2', 0), data.get('total_points', 0))
+        for phone, data in users.items()
+    ]
+
+
+def write_snapshot(values, source, path=SNAPSHOT_FILE):
+    """
+    스냅샷을 임시 파일에 쓴 뒤 교체한다. (작업 스레드에서 호출 가능, 동시 쓰기는 순서대로)
+
+    Args:
+        values: capture_snapshot_values 결과
+        source: 값을 뽑을 때의 source_signature() (변경 이벤트를 기록한 직후 값이어야 함)
+    """
+    started = time.perf_counter()
+    rows = [_derive_row(*value) for value in values]
+    payload = json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "counts_for_reward": COUNTS_FOR_REWARD,
+        "source": source,
+        "count": len(rows),
+        "checksum": _checksum(payload),
+    }
+    with _write_lock:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(payload)
+        os.replace(tmp_path, path)
+    logger.info("Dashboard snapshot written: rows=%d bytes=%d (%.1fms)",
+                len(rows), len(payload), (time.perf_counter() - started) * 1000)
+
+
+def load_snapshot(path=SNAPSHOT_FILE, source_file=HISTORY_FILE):
+    """
+    스냅샷을 읽는다. 없거나, 손상됐거나, 이후 사용자 데이터가 바뀌었으면 None.
+
+    Returns:
+        DashboardSnapshot | None
+    """
+    started = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            payload = f.read()
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Dashboard snapshot unreadable: %s", path, exc_info=True)
+        return None
+
+    if header.get("version") != SNAPSHOT_VERSION or header.get("counts_for_reward") != COUNTS_FOR_REWARD:
+        logger.info("Dashboard snapshot ignored: version/rule changed %s", header)
+        return None
+    if header.get("checksum") != _checksum(payload):
+        logger.warning("Dashboard snapshot ignored: checksum mismatch (%s)", path)
+        return None
+    source = source_signature(source_file)
+    if header.get("source") != source:
+        logger.info("Dashboard snapshot ignored: stale (snapshot=%s history=%s)", header.get("source"), source)
+        return None
+
+    try:
+        rows = json.loads(payload)
+    except ValueError:
+        logger.warning("Dashboard snapshot ignored: payload parse failed (%s)", path)
+        return None
+    snapshot = DashboardSnapshot(rows, source)
+    logger.info("Dashboard snapshot loaded: rows=%d (%.1fms)", len(snapshot), (time.perf_counter() - started) * 1000)
+    return snapshot
@@ -0,0 +1,58 @@
+# modules/startup.py
+"""
+앱 시작 단계별 소요 시간을 측정한다. (--startup-profile)
+창이 뜨기까지 / 조작 가능해지기까지 어디서 시간이 드는지 확인하기 위해 존재한다.
+
+- 단계: imports → qt_init → first_paint → (snapshot) → data_load → interactive
+- data_load는 작업 스레드에서 first_paint와 겹쳐 진행되므로, 각 단계는 "시작 이후 누적 시간" 기준으로 본다
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """시작 단계 기록 (mark 호출 시점 기준)"""
+
+    def __init__(self, started: float | None = None):
+        self.started = time.perf_counter() if started is None else started
+        self.phases: list[tuple[str, float]] = []   # (단계, 시작 이후 초)
+
+    def mark(self, phase: str) -> None:
+        elapsed = time.perf_counter() - self.started
+        self.phases.append((phase, elapsed))
+        logger.info("Startup phase: %s %.1fms", phase, elapsed * 1000)
+
+    def report(self) -> str:
+        """단계별 소요 시간 표 (단계 / 직전 단계 이후 / 시작 이후, ms)"""
+        lines = [f"{'phase':<14}{'step(ms)':>10}{'total(ms)':>11}"]
+        previous = 0.0
+        for phase, elapsed in self.phases:
+            lines.append(f"{phase:<14}{(elapsed - previous) * 1000:>10.1f}{elapsed * 1000:>11.1f}")
+            previous = elapsed
+        return "\n".join(lines)
+
+
+class FirstPaintWatcher(QObject):
+    """위젯의 첫 Paint 이벤트가 처리되면 callback을 한 번 호출한다."""
+
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self._widget = widget
+        self._callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self._widget and event.type() == QEvent.Paint:
+            self._widget.removeEventFilter(self)
+            # Paint 처리가 끝난 뒤 기록 (이벤트 필터는 처리 전에 호출됨)
+            callback, self._callback = self._callback, None
+            if callback is not None:
+                QTimer.singleShot(0, callback)
+        return False
@@ -0,0 +1,123 @@
+# modules/stats.py
+"""
+대시보드 통계용 누적 집계 (Qt 비의존)
+통계를 볼 때마다 users 전체/로그 전체를 훑지 않기 위해 존재한다.
+
+- 전체 합계 + 날짜별(YYYY-MM-DD) / 월별(YYYY-MM) 버킷: [이용 횟수, 지급 포인트, 지급 건수, 신규 등록, 삭제]
+- history.jsonl에 기록이 추가될 때마다 추가분만 반영 (이용 추가/지급/삭제 모두 로그를 남김)
+- data/stats.json 에 저장, 없거나 로그가 바뀌었으면 로그 전체를 한 번 읽어 다시 만듦
+- 조회는 버킷 몇 개만 읽으므로 데이터 크기와 무관
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from .history_index import HistoryFollower
+from .storage import DATA_DIR, HISTORY_FILE
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE = DATA_DIR / "stats.json"
+# 버킷 항목 순서
+STAT_FIELDS = ("visits", "points", "rewards", "new_members", "deleted")
+VISITS, POINTS, REWARDS, NEW_MEMBERS, DELETED = range(len(STAT_FIELDS))
+
+
+def _empty_bucket() -> list[int]:
+    return [0] * len(STAT_FIELDS)
+
+
+def _bucket_dict(bucket) -> dict:
+    return dict(zip(STAT_FIELDS, bucket or _empty_bucket()))
+
+
+class HistoryStats(HistoryFollower):
+    """history.jsonl 기반 누적 집계 (추가된 기록만 증분 반영)"""
+
+    label = "통계 집계"
+
+    def __init__(self, history_path: Path = HISTORY_FILE, stats_path: Path = STATS_FILE):
+        super().__init__(history_path, stats_path)
+
+    def _reset_state(self) -> None:
+        self.totals: list[int] = _empty_bucket()
+        self.days: dict[str, list[int]] = {}
+        self.months: dict[str, list[int]] = {}
+
+    def _state(self) -> dict:
+        return {"totals": self.totals, "days": self.days, "months": self.months}
+
+    def _restore_state(self, saved: dict) -> None:
+        totals = saved["totals"]
+        if len(totals) != len(STAT_FIELDS):
+            raise ValueError("stats field count mismatch")
+        self.totals = totals
+        self.days = saved["days"]
+        self.months = saved["months"]
+
+    def _add(self, offset: int, end: int, entry: dict) -> None:
+        entry_type = entry.get("type", "reward")
+        if entry_type == "usage":
+            delta = {
+                VISITS: entry.get("activity_1", 0) + entry.get("activity_2", 0),
+                NEW_MEMBERS: 1 if entry.get("new_user") else 0,
+            }
+        elif entry_type == "reward":
+            delta = {POINTS: entry.get("points", 0), REWARDS: 1}
+        elif entry_type == "delete_users":
+            delta = {DELETED: entry.get("deleted_count", 0)}
+        else:
+            return  # reward_batch 요약 등: 개별 기록으로 이미 집계됨
+
+        date = entry.get("date", "")
+        buckets = [self.totals]
+        if date:
+            buckets.append(self.days.setdefault(date[:10], _empty_bucket()))
+            buckets.append(self.months.setdefault(date[:7], _empty_bucket()))
+        for bucket in buckets:
+            for field, value in delta.items():
+                bucket[field] += value
+
+    # ---------------------------------------------------------
+    # 조회 (O(1))
+    # ---------------------------------------------------------
+    def day(self, day: str) -> dict:
+        """날짜("YYYY-MM-DD") 집계"""
+        return _bucket_dict(self.days.get(day))
+
+    def month(self, month: str) -> dict:
+        """월("YYYY-MM") 집계"""
+        return _bucket_dict(self.months.get(month))
+
+    def summary(self, now: datetime | None = None) -> dict:
+        """
+        대시보드 표시용 요약
+
+        Returns:
+            dict: {"total": 전체 합계, "today": 오늘, "month": 이번 달} (각각 STAT_FIELDS 키의 dict)
+        """
+        now = now or datetime.now()
+        return {
+            "total": _bucket_dict(self.totals),
+            "today": self.day(now.strftime("%Y-%m-%d")),
+            "month": self.month(now.strftime("%Y-%m")),
+        }
+
+
+_history_stats: HistoryStats | None = None
+_history_stats_lock = threading.Lock()
+
+
+def get_history_stats() -> HistoryStats:
+    """앱 전체에서 공유하는 통계 집계 (처음 호출 시 불러오고, 이후엔 추가분만 반영)"""
+    global _history_stats
+    with _history_stats_lock:
+        if _history_stats is None:
+            stats = HistoryStats()
+            stats.load()
+            _history_stats = stats
+    return _history_stats
@@ -6,6 +6,7 @@ from datetime import datetime
 from .validator import validate_phone
 from .calculator import normalize_phone
 from .pathutils import data_base_dir
+from . import perf
 
 logger = logging.getLogger(__name__)
     
@@ -13,7 +14,8 @@ BASE = data_base_dir()
 DATA_DIR = BASE / "data"
 BACKUP_DIR = BASE / "backup"
 USER_FILE = DATA_DIR / "users.json"
-HISTORY_FILE = DATA_DIR / "history.json"
+HISTORY_FILE = DATA_DIR / "history.jsonl"          # 한 줄에 기록 1건 (append-only)
+LEGACY_HISTORY_FILE = DATA_DIR / "history.json"    # v1.3 이하: 전체 JSON 배열
 HISTORY_DIR = DATA_DIR / "history"
 
 # 초기화 전용 함수
@@ -22,6 +24,7 @@ def init_dirs():
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
     HISTORY_DIR.mkdir(parents=True, exist_ok=True)
 
+@perf.timed("storage.safe_write_json")
 def safe_write_json(path: Path, obj, *, backup_dir, ensure_ascii=False, indent=4):
     """
     1) 기존 파일이 있으면 .bak 1개 갱신
@@ -45,6 +48,9 @@ def safe_write_json(path: Path, obj, *, backup_dir, ensure_ascii=False, indent=4
             encoding="utf-8"
         )
 
+        if perf.enabled():
+            perf.record_bytes("storage.safe_write_json", tmp_path.stat().st_size)
+
         # 3) 교체
         os.replace(tmp_path, path)
     except Exception:
@@ -78,6 +84,7 @@ def _load_json_file(path: Path, empty_value, *, not_found_msg: str, parse_error_
         logger.exception(os_error_msg, log_path)
         return empty_value
 
+@perf.timed("storage.load_users")
 def load_users():
     """사용자 데이터를 파일에서 로드 (예시: 항상 빈 dict 반환)"""
     return _load_json_file(
@@ -98,43 +105,202 @@ def save_users(data):
         logger.exception("users 저장 실패: %s", USER_FILE)
         raise
 
+@perf.timed("storage.load_history")
 def load_history():
-    """로그 데이터를 파일에서 로드"""
-    return _load_json_file(
-        HISTORY_FILE,
-        [],
-        not_found_msg="history.json 없음 - 빈 데이터로 시작: %s",
-        parse_error_msg="history.json JSON 파싱 실패(파일 손상 가능): %s",
-        os_error_msg="history.json 읽기 실패(OS): %s",
-        log_path=USER_FILE,
-    )
+    """로그 데이터를 파일에서 로드 (오래된 기록 → 최신 기록 순)"""
+    try:
+        with HISTORY_FILE.open("rb") as f:
+            return [entry for _, entry in _iter_history_lines(f, 0, None)]
+    except FileNotFoundError:
+        logger.warning("history.jsonl 없음 - 빈 데이터로 시작: %s", HISTORY_FILE)
+        return []
+    except OSError:
+        logger.exception("history.jsonl 읽기 실패(OS): %s", HISTORY_FILE)
+        return []
+
+def _parse_history_line(line: bytes, offset: int):
+    """기록 한 줄을 파싱한다. 손상된 줄(중간에 끊긴 기록 등)은 None."""
+    try:
+        return json.loads(line)
+    except ValueError:
+        logger.error("history.jsonl 손상된 줄 건너뜀: offset=%d", offset)
+        return None
 
+def _iter_history_lines(f, start: int, end):
+    """[start, end) 구간의 기록을 (줄 시작 offset, 기록) 순서대로 반환"""
+    f.seek(start)
+    offset = start
+    for line in f:
+        if end is not None and offset >= end:
+            break
+        if line.strip():
+            entry = _parse_history_line(line, offset)
+            if entry is not None:
+                yield offset, entry
+        offset += len(line)
+
+def iter_history_reverse(end=None, block_size=64 * 1024):
+    """
+    로그를 최신 기록부터 거꾸로 읽는다. 파일 끝에서 필요한 만큼만 블록 단위로 읽으므로
+    처음 몇 건을 가져오는 비용은 전체 로그 크기와 무관하다.
+
+    Args:
+        end: 이 offset 이전 기록부터 읽음 (None이면 파일 끝)
+        block_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        Iterator[tuple[int, dict]]: (줄 시작 offset, 기록)
+    """
+    try:
+        f = HISTORY_FILE.open("rb")
+    except FileNotFoundError:
+        return
+    with f:
+        pos = f.seek(0, os.SEEK_END) if end is None else end
+        tail = b""  # 아직 줄 시작을 못 찾은 조각
+        while pos > 0:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size) + tail
+            lines = chunk.split(b"\n")
+            # 첫 조각은 앞 블록과 이어질 수 있으므로 다음 블록으로 넘김
+            tail = lines[0]
+            line_end = pos + len(chunk)
+            for line in reversed(lines[1:]):
+                line_end -= len(line) + 1
+                if line.strip():
+                    entry = _parse_history_line(line, line_end + 1)
+                    if entry is not None:
+                        yield line_end + 1, entry
+        if tail.strip():
+            entry = _parse_history_line(tail, 0)
+            if entry is not None:
+                yield 0, entry
+
+def iter_history_at(offsets):
+    """
+    지정한 offset의 기록만 읽는다. (히스토리 인덱스 조회 결과를 읽을 때 사용)
+
+    Args:
+        offsets: 줄 시작 offset 목록 (반환 순서 그대로 읽음)
+
+    Returns:
+        Iterator[tuple[int, dict]]: (줄 시작 offset, 기록)
+    """
+    try:
+        f = HISTORY_FILE.open("rb")
+    except FileNotFoundError:
+        return
+    with f:
+        for offset in offsets:
+            f.seek(offset)
+            entry = _parse_history_line(f.readline(), offset)
+            if entry is not None:
+                yield offset, entry
+
+def _append_history_lines(entries) -> tuple[int, int]:
+    """기록들을 history.jsonl 끝에 한 번에 추가 (파일 전체를 다시 쓰지 않음). (추가 전, 추가 후) 파일 크기를 반환."""
+    data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode("utf-8")
+    with HISTORY_FILE.open("a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                # 이전 기록이 중간에 끊긴 경우 줄을 분리해 새 기록이 섞이지 않도록 함
+                data = b"\n" + data
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    perf.record_bytes("storage.history_append", len(data))
+    return size, size + len(data)
+
+@perf.timed("storage.save_history")
 def save_history(HISTORY_entry):
     """로그 데이터를 파일에 추가"""
     try:
-        history = load_history()
         HISTORY_entry['date'] = datetime.now().strftime("%Y-%m-%d %H:%M")
-        history.append(HISTORY_entry)
-        safe_write_json(HISTORY_FILE, history, backup_dir=BACKUP_DIR, ensure_ascii=False, indent=4)
-        logger.debug("history.json append: phone=%s points=%s", HISTORY_entry.get("phone"), HISTORY_entry.get("points"))
+        _append_history_lines([HISTORY_entry])
+        logger.debug("history.jsonl append: phone=%s points=%s", HISTORY_entry.get("phone"), HISTORY_entry.get("points"))
     except Exception:
         logger.exception("history 저장 실패: %s", HISTORY_FILE)
         raise
         
-def delete_users(phone_list):
-    """데이터 딕셔너리에서 사용자을 삭제하고 저장합니다."""
-    users = load_users()
-    before = len(users)
-    deleted = 0
-    for phone in phone_list:
-        if phone in users:
-            del users[phone]
-            deleted += 1
-            
-    save_users(users)
-    logger.info("사용자 삭제: requested=%d deleted=%d total %d->%d",
-                len(phone_list), deleted, before, len(users))
-    
+@perf.timed("storage.save_history_many")
+def save_history_many(entries) -> int:
+    """
+    여러 로그를 같은 시각으로 한 번에 추가한다. (한 번의 write + fsync, 추가만 하고 되돌리지 않음)
+
+    Args:
+        entries: 추가할 로그 딕셔너리 목록
+
+    Returns:
+        int: 추가 전 history.jsonl 크기 (= 이번 첫 기록의 offset)
+    """
+    return append_history_span(entries)[0]
+
+@perf.timed("storage.append_history_span")
+def append_history_span(entries) -> tuple[int, int]:
+    """
+    여러 로그를 같은 시각으로 한 번에 추가하고 추가한 구간을 반환한다. (한 번의 write + fsync)
+    history.jsonl은 추가만 한다: 기록된 이벤트는 되돌리지 않고, 실패하면 예외만 전달
+    (사용자 상태는 기록에 성공한 뒤에만 바뀜, modules.projection)
+
+    Returns:
+        tuple[int, int]: (추가 전 history.jsonl 크기, 추가 후 크기) - 사용자 체크포인트가 로그 위치를 따라가는 데 사용
+    """
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    for entry in entries:
+        entry['date'] = now
+    try:
+        span = _append_history_lines(entries)
+        logger.info("history.jsonl append: %d건", len(entries))
+        return span
+    except Exception:
+        logger.exception("history 일괄 저장 실패: %s (%d건)", HISTORY_FILE, len(entries))
+        raise
+
+def compact_history():
+    """
+    history.jsonl에서 손상된 줄/빈 줄/끊긴 마지막 줄을 제거해 다시 쓴다. (앱이 꺼져 있을 때 실행)
+    원본은 backup/history.jsonl.<시각>.bak 으로 보관하고 임시파일 → 교체로 저장한다.
+    (로그 인덱스/통계는 파일 교체를 감지해 다음 실행 때 다시 만듦,
+     사용자 체크포인트는 로그 위치가 바뀌므로 호출한 쪽에서 UserProjection.reset으로 다시 저장)
+
+    Returns:
+        tuple[int, int, int, int]: (남긴 기록 수, 제거한 줄 수, 이전 크기, 이후 크기)
+    """
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = HISTORY_FILE.with_suffix(HISTORY_FILE.suffix + ".tmp")
+    kept = dropped = 0
+    with HISTORY_FILE.open("rb") as src, tmp_path.open("wb") as dst:
+        before = src.seek(0, os.SEEK_END)
+        src.seek(0)
+        offset = 0
+        for line in src:
+            valid = line.endswith(b"\n") and line.strip()
+            if valid:
+                try:
+                    json.loads(line)
+                except ValueError:
+                    valid = False
+            if valid:
+                dst.write(line)
+                kept += 1
+            else:
+                logger.warning("history.jsonl 압축: 줄 제거 offset=%d (%d bytes)", offset, len(line))
+                dropped += 1
+            offset += len(line)
+        dst.flush()
+        os.fsync(dst.fileno())
+        after = dst.tell()
+    backup_path = BACKUP_DIR / f"history.jsonl.{datetime.now().strftime('%Y%m%d_%H%M%S')}.bak"
+    shutil.copy2(HISTORY_FILE, backup_path)
+    os.replace(tmp_path, HISTORY_FILE)
+    logger.info("history.jsonl 압축 완료: kept=%d dropped=%d %d→%d bytes (원본: %s)",
+                kept, dropped, before, after, backup_path)
+    return kept, dropped, before, after
+
 # def snapshot_deleted_users(users: dict, phones: list[str]) -> Path:
 #     """삭제 직전 복구용 스냅샷 저장(원본 포함)"""
 #     target = {p: users.get(p) for p in phones if p in users}
@@ -157,11 +323,35 @@ def ensure_files_exist():
         logger.info("users.json 생성: %s", USER_FILE)
 
     if not HISTORY_FILE.exists():
-        HISTORY_FILE.write_text(
-            json.dumps([], indent=4, ensure_ascii=False),
-            encoding="utf-8"
-        )
-        logger.info("users.json 생성: %s", HISTORY_FILE)
+        if LEGACY_HISTORY_FILE.exists():
+            migrate_history_to_jsonl()
+        else:
+            HISTORY_FILE.touch()
+            logger.info("history.jsonl 생성: %s", HISTORY_FILE)
+
+def migrate_history_to_jsonl():
+    """
+    v1.3 이하의 history.json(JSON 배열)을 history.jsonl(한 줄 1건)로 변환한다.
+    원본은 backup/history.json.migrated 로 옮겨 보관한다.
+    """
+    history = _load_json_file(
+        LEGACY_HISTORY_FILE,
+        [],
+        not_found_msg="history.json 없음 - 변환 스킵: %s",
+        parse_error_msg="history.json JSON 파싱 실패(파일 손상 가능): %s",
+        os_error_msg="history.json 읽기 실패(OS): %s",
+        log_path=LEGACY_HISTORY_FILE,
+    )
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = HISTORY_FILE.with_suffix(HISTORY_FILE.suffix + ".tmp")
+    tmp_path.write_text(
+        "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in history),
+        encoding="utf-8"
+    )
+    os.replace(tmp_path, HISTORY_FILE)
+    shutil.move(str(LEGACY_HISTORY_FILE), str(BACKUP_DIR / "history.json.migrated"))
+    logger.info("history.json → history.jsonl 변환 완료: %d건 (원본: %s)",
+                len(history), BACKUP_DIR / "history.json.migrated")
             
 def get_total_points(phone):
     """특정 사용자의 누적 포인트를 계산 (Model/Storage의 책임)"""
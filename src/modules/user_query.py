@@ -0,0 +1,253 @@
+# modules/user_query.py
+"""
+대시보드 정렬/복합 필터를 위한 정렬 인덱스를 제공한다.
+필터를 걸 때마다 전체 사용자를 순회·정렬하지 않기 위해 존재한다.
+
+- total_counts / remaining / total_points / phone 별 정렬 리스트를 유지
+- 사용자 추가·수정·삭제 시 해당 사용자만 증분 갱신 (bisect)
+- 범위 조건은 이분 탐색으로 개수를 구해 가장 작은 후보 집합부터 검사
+- 정렬 키의 범위 조건이면 결과가 이미 정렬된 순서로 나옴
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
+
+from .calculator import COUNTS_FOR_REWARD, get_remaining, get_total_count
+
+# 한 번에 바뀌는 사용자가 전체의 1/REBUILD_RATIO를 넘으면 항목별 insort보다 새로 만드는 편이 빠름
+REBUILD_RATIO = 8
+
+
+def _total_counts(phone, data):
+    return get_total_count(data)
+
+
+def _remaining(phone, data):
+    return get_remaining(get_total_count(data), COUNTS_FOR_REWARD)
+
+
+def _total_points(phone, data):
+    return int(data.get("total_points", 0))
+
+
+def _phone(phone, data):
+    return phone
+
+
+# 정렬 인덱스를 유지하는 키 → 값 계산 함수
+SORT_KEYS = {
+    "phone": _phone,
+    "total_counts": _total_counts,
+    "remaining": _remaining,
+    "total_points": _total_points,
+}
+
+
+class SortedIndex:
+    """(값, 전화번호) 오름차순 정렬 리스트 + 전화번호 → 값"""
+
+    def __init__(self, value_func, users=None):
+        self.value_func = value_func
+        self.value_of: dict[str, object] = {}
+        self._entries: list[tuple] = []
+        if users:
+            self.rebuild(users)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rebuild(self, users: dict) -> None:
+        value_func = self.value_func
+        self.value_of = {phone: value_func(phone, data) for phone, data in users.items()}
+        self._entries = sorted((value, phone) for phone, value in self.value_of.items())
+
+    def update(self, phone: str, data: dict) -> None:
+        """사용자 값이 바뀌었을 때 해당 항목만 재배치"""
+        value = self.value_func(phone, data)
+        old = self.value_of.get(phone)
+        if old == value and phone in self.value_of:
+            return
+        if phone in self.value_of:
+            self._discard(old, phone)
+        self.value_of[phone] = value
+        insort(self._entries, (value, phone))
+
+    def remove(self, phone: str) -> None:
+        if phone not in self.value_of:
+            return
+        self._discard(self.value_of.pop(phone), phone)
+
+    def _discard(self, value, phone) -> None:
+        i = bisect_left(self._entries, (value, phone))
+        if i < len(self._entries) and self._entries[i] == (value, phone):
+            del self._entries[i]
+
+    def _bounds(self, lo=None, hi=None) -> tuple[int, int]:
+        """값이 lo 이상 hi 이하인 구간의 [start, end) 위치"""
+        entries = self._entries
+        start = 0 if lo is None else bisect_left(entries, lo, key=itemgetter(0))
+        end = len(entries) if hi is None else bisect_right(entries, hi, key=itemgetter(0))
+        return start, max(start, end)
+
+    def count_range(self, lo=None, hi=None) -> int:
+        start, end = self._bounds(lo, hi)
+        return end - start
+
+    def iter_range(self, lo=None, hi=None, descending=False):
+        """값 범위 [lo, hi]에 속하는 전화번호를 정렬 순서대로 반환"""
+        start, end = self._bounds(lo, hi)
+        entries = self._entries
+        if descending:
+            return (entries[i][1] for i in range(end - 1, start - 1, -1))
+        return (phone for _, phone in islice(entries, start, end))
+
+    def max_value(self, default=0):
+        return self._entries[-1][0] if self._entries else default
+
+
+@dataclass
+class UserQuery:
+    """
+    대시보드 표시 조건
+
+    Attributes:
+        keyword: 전화번호 부분 검색어
+        needs_reward: True면 지급 필요(누적 횟수 기준 이상) 사용자만
+        points_over: 지정 시 총 포인트가 이 값보다 큰 사용자만
+        max_remaining: 지정 시 남은 횟수가 이 값 이하인 사용자만
+        sort_key: SORT_KEYS 중 하나 (None이면 등록 순서)
+        descending: 내림차순 여부
+    """
+    keyword: str | None = None
+    needs_reward: bool = False
+    points_over: int | None = None
+    max_remaining: int | None = None
+    sort_key: str | None = None
+    descending: bool = False
+
+    def has_filters(self) -> bool:
+        return self.needs_reward or self.points_over is not None or self.max_remaining is not None
+
+    def is_default(self) -> bool:
+        """검색어 외 필터/정렬이 없는 기본 상태인지"""
+        return not self.has_filters() and self.sort_key is None
+
+    def range_conditions(self) -> list[tuple[str, object, object]]:
+        """(인덱스 키, 최소값, 최대값) 범위 조건 목록"""
+        conditions = []
+        if self.needs_reward:
+            conditions.append(("total_counts", COUNTS_FOR_REWARD, None))
+        if self.points_over is not None:
+            conditions.append(("total_points", self.points_over + 1, None))
+        if self.max_remaining is not None:
+            conditions.append(("remaining", None, self.max_remaining))
+        return conditions
+
+
+class UserIndexes:
+    """정렬 인덱스 묶음 + 조건 조회"""
+
+    def __init__(self, users=None):
+        self.indexes = {key: SortedIndex(func) for key, func in SORT_KEYS.items()}
+        if users:
+            self.rebuild(users)
+
+    def rebuild(self, users: dict) -> None:
+        for index in self.indexes.values():
+            index.rebuild(users)
+
+    def update(self, phone: str, data: dict) -> None:
+        for index in self.indexes.values():
+            index.update(phone, data)
+
+    def remove(self, phone: str) -> None:
+        for index in self.indexes.values():
+            index.remove(phone)
+
+    def prefers_rebuild(self, changed: int) -> bool:
+        """changed명이 한꺼번에 바뀔 때 증분 갱신 대신 다시 만드는 편이 나은지"""
+        return changed * REBUILD_RATIO > len(self.indexes["phone"])
+
+    def matches(self, phone: str, query: UserQuery) -> bool:
+        """사용자 1명이 조건을 만족하는지 (O(조건 수))"""
+        if query.keyword and query.keyword not in phone:
+            return False
+        for key, lo, hi in query.range_conditions():
+            value = self.indexes[key].value_of.get(phone)
+            if value is None or (lo is not None and value < lo) or (hi is not None and value > hi):
+                return False
+        return True
+
+    def query(self, query: UserQuery, all_phones, keyword_phones=None, ordered=None) -> list[str]:
+        """
+        조건을 만족하는 전화번호를 정렬 순서대로 반환한다.
+
+        Args:
+            query: 표시 조건
+            all_phones: 전체 전화번호 (등록 순서, 조건이 없을 때 그대로 사용)
+            keyword_phones: 검색어 일치 전화번호 (등록 순서, 검색어 없으면 None)
+            ordered: 전화번호 목록을 등록 순서로 정렬하는 함수
+
+        Returns:
+            list[str]: 전화번호 목록
+        """
+        conditions = query.range_conditions()
+
+        # 1. 가장 작은 후보 집합을 driver로 선택 (범위 조건은 이분 탐색으로 개수만 계산)
+        driver = None            # (크기, 종류, 값)
+        if keyword_phones is not None:
+            driver = (len(keyword_phones), "keyword", None)
+        for condition in conditions:
+            key, lo, hi = condition
+            size = self.indexes[key].count_range(lo, hi)
+            if driver is None or size < driver[0]:
+                driver = (size, "range", condition)
+
+        if driver is None:
+            # 조건 없음: 정렬만
+            if query.sort_key is None:
+                return list(all_phones)
+            return list(self.indexes[query.sort_key].iter_range(descending=query.descending))
+
+        # 2. driver 후보를 나머지 조건으로 검증
+        checks = [c for c in conditions if driver[1] != "range" or c is not driver[2]]
+
+        def passes(phone):
+            for key, lo, hi in checks:
+                value = self.indexes[key].value_of[phone]
+                if (lo is not None and value < lo) or (hi is not None and value > hi):
+                    return False
+            return True
+
+        if driver[1] == "keyword":
+            candidates = keyword_phones
+            sorted_by = None           # 등록 순서
+        else:
+            key, lo, hi = driver[2]
+            candidates = self.indexes[key].iter_range(lo, hi)
+            sorted_by = key
+        if query.keyword and driver[1] != "keyword":
+            keyword = query.keyword
+            phones = [p for p in candidates if keyword in p and passes(p)]
+        else:
+            phones = [p for p in candidates if passes(p)]
+
+        # 3. 정렬: driver가 이미 정렬 키 순서면 그대로, 아니면 결과만 정렬
+        if query.sort_key is None:
+            if sorted_by is not None and ordered is not None:
+                phones = ordered(phones)
+            return phones
+        if sorted_by == query.sort_key:
+            return phones[::-1] if query.descending else phones
+
+        index = self.indexes[query.sort_key]
+        if len(phones) * 16 > len(index):
+            # 결과가 전체의 상당 부분이면 정렬 인덱스를 순회하며 거르는 편이 빠름
+            wanted = set(phones)
+            return [p for p in index.iter_range(descending=query.descending) if p in wanted]
+        value_of = index.value_of
+        return sorted(phones, key=lambda p: (value_of[p], p), reverse=query.descending)
@@ -0,0 +1,92 @@
+# ui/column_widths.py
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFontMetrics
+from PySide6.QtWidgets import QHeaderView
+
+# 셀 좌우 padding + 격자선 여유 (스타일시트의 item/section padding 포함)
+COLUMN_PADDING = 24
+# 내용 길이를 알 수 없는 컬럼에서 너비 계산에 쓸 최대 행 수
+SAMPLE_ROWS = 50
+# 측정한 텍스트 폭 캐시 최대 개수 (넘으면 비움)
+TEXT_CACHE_SIZE = 4096
+
+
+class ColumnWidthEstimator:
+    """
+    컬럼 너비를 셀 측정(ResizeToContents) 없이 계산한다.
+
+    - 숫자 컬럼: 최대 자릿수만큼의 숫자 폭으로 계산 (값의 최대 자릿수만 알면 됨)
+    - 자유 텍스트 컬럼: 최대 SAMPLE_ROWS개 행만 측정
+    - 계산한 너비는 캐시하고, 바뀐 컬럼만 resizeSection → 행 수와 무관한 비용
+    """
+
+    def __init__(self, table, padding=COLUMN_PADDING):
+        table.ensurePolished()   # 스타일시트 글꼴 반영 후 측정
+        self._table = table
+        self._header = table.horizontalHeader()
+        self._metrics = QFontMetrics(table.font())
+        self._header_metrics = QFontMetrics(self._header.font())
+        self._padding = padding
+        self._text_widths = {}   # 텍스트 → 픽셀 폭
+        self._applied = {}       # 컬럼 → 마지막으로 적용한 너비
+        self._content = {}       # 컬럼 → 지금까지 본 최대 내용 폭 (sample_rows용)
+
+    def text_width(self, text):
+        width = self._text_widths.get(text)
+        if width is None:
+            if len(self._text_widths) >= TEXT_CACHE_SIZE:
+                self._text_widths.clear()
+            width = self._metrics.horizontalAdvance(text)
+            self._text_widths[text] = width
+        return width
+
+    def digits_width(self, digits):
+        """digits 자리 숫자의 폭 (숫자 글리프는 폭이 같으므로 "0"으로 측정)"""
+        return self.text_width("0" * max(1, digits))
+
+    def _header_width(self, column):
+        label = self._table.model().headerData(column, Qt.Horizontal, Qt.DisplayRole) or ""
+        return self._header_metrics.horizontalAdvance(str(label))
+
+    def set_fixed(self, columns):
+        """계산한 너비로만 크기를 정하는 컬럼 (Qt가 내용을 측정하지 않음)"""
+        for column in columns:
+            self._header.setSectionResizeMode(column, QHeaderView.Fixed)
+
+    def apply(self, column, content_width):
+        """
+        내용 폭으로 컬럼 너비를 정한다. (이전과 같으면 아무것도 하지 않음)
+
+        Returns:
+            bool: 너비가 바뀌었는지
+        """
+        width = max(content_width, self._header_width(column)) + self._padding
+        if self._applied.get(column) == width:
+            return False
+        self._applied[column] = width
+        self._header.resizeSection(column, width)
+        return True
+
+    def apply_digits(self, column, max_value):
+        """숫자 컬럼: 최댓값의 자릿수 기준"""
+        return self.apply(column, self.digits_width(len(str(max_value))))
+
+    def apply_sample(self, column, first_row=0):
+        """
+        자유 텍스트 컬럼: first_row부터 최대 SAMPLE_ROWS개 행만 측정해 지금까지의 최대 폭을 유지
+        (새 페이지가 붙을 때 그 페이지의 앞부분만 확인)
+        """
+        model = self._table.model()
+        last_row = min(model.rowCount(), first_row + SAMPLE_ROWS)
+        widest = self._content.get(column, 0)
+        for row in range(first_row, last_row):
+            text = model.data(model.index(row, column), Qt.DisplayRole)
+            if text:
+                widest = max(widest, self.text_width(str(text)))
+        self._content[column] = widest
+        return self.apply(column, widest)
+
+    def reset_samples(self):
+        """조회 조건이 바뀌어 표시 내용이 전부 바뀐 경우 측정 기록 초기화"""
+        self._content.clear()
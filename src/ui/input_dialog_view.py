@@ -21,6 +21,12 @@ class InputDialog(QDialog):
         self.ui.btnSubmit.clicked.connect(self.handle_submit)
         self.ui.btnCancel.clicked.connect(self.reject)
         
+    def reset(self):
+        """재사용 전 입력값 초기화 (Controller가 인스턴스를 캐시해 다시 엶)"""
+        self.ui.inputPhone.clear()
+        self.ui.spinLaundry.setValue(0)
+        self.ui.spinDry.setValue(0)
+        self.ui.inputPhone.setFocus()
 
     def handle_submit(self):
         """
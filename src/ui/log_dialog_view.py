@@ -1,15 +1,26 @@
 # ui/log_dialog_view.py
 
 import logging
-from PySide6.QtWidgets import QDialog, QTableWidgetItem, QAbstractItemView
+from PySide6.QtCore import QDate, QThreadPool
+from PySide6.QtWidgets import QDialog, QAbstractItemView
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QHeaderView
 from .ui_log_dialog import Ui_LogDialog
-from modules.storage import load_history
-from modules.calculator import format_phone
+from .log_table_model import LogTableModel
+from .column_widths import ColumnWidthEstimator
+from .workers import HistoryPageTask
+from modules.history_index import HistoryFilter
+from modules.message_utils import show_warning
 
 logger = logging.getLogger(__name__)
 
+# comboLogType 순서 → 기록 종류 (None: 전체)
+LOG_TYPES = [None, "reward", "reward_batch", "delete_users", "usage", "points_adjust"]
+DEFAULT_LOG_TYPE_INDEX = 1  # 기본은 포인트 지급 기록만
+# 계산한 너비를 쓰는 컬럼: 번호(행 수 자릿수) / 지급 사유(앞쪽 일부 행만 측정)
+NUMBER_COLUMN = 0
+REASON_COLUMN = 5
+
 class LogDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -18,7 +29,20 @@ class LogDialog(QDialog):
         self.ui.setupUi(self)
         self.ui.tableLogs.verticalHeader().setVisible(False)
         
+        # 로그 테이블 모델 (스크롤할 때 최신 기록부터 페이지 단위로 읽음)
+        self.log_model = LogTableModel(self)
+        self.ui.tableLogs.setModel(self.log_model)
+        self.log_model.pageRequested.connect(self._request_next_page)
+        
+        # 백그라운드 로딩 상태 (generation: 조회 조건을 바꿀 때마다 증가, 이전 결과는 무시)
+        self._generation = 0
+        self._source = None
+        self._task = None
+        self.ui.btnLogCancel.clicked.connect(self.cancel_loading)
+        self._set_loading(False)
+        
         self.setFixedSize(860, 399)
+        self._column_widths = ColumnWidthEstimator(self.ui.tableLogs)
         
         self.setWindowTitle("포인트 지급 내역")
         
@@ -27,9 +51,13 @@ class LogDialog(QDialog):
 
         # 닫기 버튼 이벤트
         self.ui.btnClose.clicked.connect(self.reject)
-
-        # 로그 데이터 로딩
-        self.load_log_table()
+        
+        # 조회 조건 (전화번호 / 종류 / 기간)
+        self.ui.checkLogDate.toggled.connect(self._on_date_range_toggled)
+        self.ui.btnLogSearch.clicked.connect(self.load_log_table)
+        self.ui.lineLogPhone.returnPressed.connect(self.load_log_table)
+        self.ui.comboLogType.currentIndexChanged.connect(self.load_log_table)
+        # 로그 데이터 로딩은 reset()에서 (Controller가 열 때마다 호출)
         
         # 열 비율 조정
         self.apply_column_ratio()
@@ -48,9 +76,9 @@ class LogDialog(QDialog):
         table = self.ui.tableLogs
         header = table.horizontalHeader()
 
-        # 모든 컬럼을 내용물 크기에 딱 맞게 줄이기
-        # ResizeToContents : 글자 수만큼만 공간 차지
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        # 번호 / 지급 사유는 계산한 고정 너비 (ResizeToContents처럼 셀마다 측정 X)
+        self._column_widths.set_fixed((NUMBER_COLUMN, REASON_COLUMN))
+        self._update_column_widths(0)
 
         # 넓게 보여주고 싶은 핵심 컬럼만 Stretch(남은 공간 꽉 채우기)로 설정
         
@@ -66,55 +94,124 @@ class LogDialog(QDialog):
     # =================================================
     # 로그 테이블 채우기
     # =================================================
+    def reset(self):
+        """조회 조건을 기본값으로 되돌리고 최신 로그부터 다시 읽기 시작 (다이얼로그 재사용 시)"""
+        today = QDate.currentDate()
+        self.ui.lineLogPhone.clear()
+        self.ui.dateLogFrom.setDate(today.addMonths(-1))
+        self.ui.dateLogTo.setDate(today)
+        self.ui.checkLogDate.setChecked(False)
+        self._on_date_range_toggled(False)
+        # 조건을 바꾸는 동안 조회가 여러 번 시작되지 않도록 시그널 차단 후 한 번만 로딩
+        self.ui.comboLogType.blockSignals(True)
+        self.ui.comboLogType.setCurrentIndex(DEFAULT_LOG_TYPE_INDEX)
+        self.ui.comboLogType.blockSignals(False)
+        self.load_log_table()
+        
+    def _on_date_range_toggled(self, checked):
+        self.ui.dateLogFrom.setEnabled(checked)
+        self.ui.dateLogTo.setEnabled(checked)
+        
+    def get_log_filter(self) -> HistoryFilter:
+        """입력된 조회 조건을 HistoryFilter로 변환"""
+        date_from = date_to = None
+        if self.ui.checkLogDate.isChecked():
+            date_from = self.ui.dateLogFrom.date().toString("yyyy-MM-dd")
+            date_to = self.ui.dateLogTo.date().toString("yyyy-MM-dd")
+        return HistoryFilter(
+            phone=self.ui.lineLogPhone.text().strip(),
+            date_from=date_from,
+            date_to=date_to,
+            entry_type=LOG_TYPES[self.ui.comboLogType.currentIndex()],
+        )
+
     def load_log_table(self):
+        """조회 조건에 맞는 로그를 최신 기록부터 작업 스레드에서 읽어 오도록 시작"""
         try:
-            logs = load_history()
-
-            table = self.ui.tableLogs
-            table.setRowCount(0)
-
-            for log in logs:
-                log_type = log.get("type", "reward")
-                # reward 로그만 표시
-                if log_type != "reward":
-                    continue
-                
-                row = table.rowCount()
-                table.insertRow(row)
-
-                # log 데이터 필드
-                date = log.get("date", "")
-                phone = log.get("phone", "")
-                points = log.get("points","")
-                reason = log.get("reason", "")
-                row_idx = row + 1
-                formatted_phone = format_phone(phone)
-                
-                count_before = log.get("count_before","")
-                count_after = log.get("count_after","")
-                
-                if count_before is None or count_after is None:
-                    transition = ""
-                else:
-                    transition = f"{count_before} → {count_after}"
-
-                # 테이블에 삽입
-                table.setItem(row, 0, self._item(str(row_idx)))
-                table.setItem(row, 1, self._item(date))
-                table.setItem(row, 2, self._item(formatted_phone))
-                table.setItem(row, 3, self._item(points))
-                table.setItem(row, 4, self._item(transition))
-                table.setItem(row, 5, self._item(reason))
-
-            table.resizeColumnsToContents()
+            log_filter = self.get_log_filter()
+            self._cancel_task()
+            self._generation += 1
+            self._source = None
+            self.log_model.reset_rows()
+            self._column_widths.reset_samples()
+            # 인덱스 준비/갱신 + 조건 조회 + 첫 페이지 읽기까지 작업 스레드에서
+            self._start_task(HistoryPageTask(self._generation, log_filter=log_filter))
+            logger.debug("LogDialog filter applied: generation=%d %s", self._generation, log_filter)
         except:
             logger.exception("LogDialog render failed")
             raise
 
+    def _request_next_page(self):
+        """스크롤이 끝에 닿음 → 같은 조회 결과의 다음 페이지 요청"""
+        if self._source is None:
+            return
+        self._start_task(HistoryPageTask(self._generation, source=self._source))
+
+    def _start_task(self, task):
+        task.signals.progress.connect(self._on_progress)
+        task.signals.pageLoaded.connect(self._on_page_loaded)
+        task.signals.failed.connect(self._on_failed)
+        self._task = task
+        self._set_loading(True)
+        QThreadPool.globalInstance().start(task)
+
+    def _cancel_task(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def cancel_loading(self):
+        """[취소] 진행 중인 로딩 중단 (이미 받은 행은 유지)"""
+        logger.info("LogDialog loading canceled: generation=%d rows=%d",
+                    self._generation, self.log_model.rowCount())
+        self._cancel_task()
+        self._generation += 1   # 이미 보낸 결과가 도착해도 무시
+        self._source = None
+        self.log_model.stop_loading()
+        self._set_loading(False)
+
     # -------------------------------------------------
-    # 테이블 아이템 생성 도우미
+    # 작업 스레드 결과 수신 (GUI 스레드)
     # -------------------------------------------------
-    def _item(self, text):
-        item = QTableWidgetItem(str(text))
-        item.setTextAlignment(132)  # 가운데 정렬
-        return item
+    def _on_progress(self, generation, value, maximum):
+        if generation != self._generation:
+            return
+        self.ui.progressLogs.setRange(0, maximum)
+        self.ui.progressLogs.setValue(value)
+
+    def _on_page_loaded(self, generation, source, rows, has_more):
+        if generation != self._generation:
+            return
+        self._task = None
+        self._source = source if has_more else None
+        first_row = self.log_model.rowCount()
+        self.log_model.append_rows(rows, has_more)
+        self._update_column_widths(first_row)
+        self._set_loading(False)
+
+    def _on_failed(self, generation, message):
+        if generation != self._generation:
+            return
+        self._task = None
+        self._source = None
+        self.log_model.stop_loading()
+        self._set_loading(False)
+        show_warning(self, "로그 조회 오류", f"로그를 읽는 중 오류가 발생했습니다: {message}")
+
+    def _update_column_widths(self, first_row):
+        """새로 붙은 페이지 기준으로 번호/지급 사유 컬럼 너비 갱신 (바뀐 경우만 조정)"""
+        widths = self._column_widths
+        widths.apply_digits(NUMBER_COLUMN, self.log_model.rowCount())
+        widths.apply_sample(REASON_COLUMN, first_row)
+
+    def _set_loading(self, loading):
+        """로딩 중에만 진행 표시줄/취소 버튼 표시"""
+        if loading:
+            self.ui.progressLogs.setRange(0, 0)   # 진행률을 알기 전에는 busy 표시
+        self.ui.progressLogs.setVisible(loading)
+        self.ui.btnLogCancel.setVisible(loading)
+
+    def done(self, result):
+        # 창을 닫으면 진행 중인 로딩도 중단
+        self._cancel_task()
+        super().done(result)
@@ -0,0 +1,148 @@
+# ui/log_table_model.py
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from modules.calculator import format_phone
+
+# 컬럼 순서: 번호 / 날짜·시간 / 전화번호 / 포인트 / 처리 내역 / 지급 사유
+HEADERS = ["번호", "날짜 / 시간", "전화번호", "포인트", "처리 내역", "지급 사유"]
+# 스크롤이 끝에 닿을 때마다 가져올 기록 수
+PAGE_SIZE = 200
+
+
+def to_log_row(log):
+    """로그 기록 1건을 테이블 표시용 값 튜플로 변환 (번호 제외)"""
+    entry_type = log.get("type", "reward")
+    if entry_type == "reward_batch":
+        return (
+            log.get("date", ""), "", "",
+            f"선택 {log.get('selected', 0)} / 대상 {log.get('eligible', 0)}",
+            f"일괄 지급: 성공 {log.get('success', 0)}건, 오류 {log.get('errors', 0)}건",
+        )
+    if entry_type == "delete_users":
+        return (
+            log.get("date", ""), "", "", "",
+            f"사용자 {log.get('deleted_count', 0)}명 삭제",
+        )
+
+    if entry_type == "usage":
+        return (
+            log.get("date", ""),
+            format_phone(log.get("phone", "")),
+            "",
+            f"활동 A +{log.get('activity_1', 0)} / 활동 B +{log.get('activity_2', 0)}",
+            "신규 등록" if log.get("new_user") else "이용 추가",
+        )
+
+    if entry_type == "points_adjust":
+        before = log.get("points_before", 0)
+        after = log.get("points_after", 0)
+        return (
+            log.get("date", ""),
+            format_phone(log.get("phone", "")),
+            f"{after - before:+}",
+            f"포인트 보정: {before} → {after}",
+            log.get("reason", ""),
+        )
+
+    count_before = log.get("count_before", "")
+    count_after = log.get("count_after", "")
+
+    if count_before is None or count_after is None:
+        transition = ""
+    else:
+        transition = f"{count_before} → {count_after}"
+
+    return (
+        log.get("date", ""),
+        format_phone(log.get("phone", "")),
+        str(log.get("points", "")),
+        transition,
+        log.get("reason", ""),
+    )
+
+
+class LogTableModel(QAbstractTableModel):
+    """
+    로그 테이블 모델 (스크롤에 맞춰 PAGE_SIZE씩 받아 붙이는 lazy 모델)
+
+    - 모델은 기록을 직접 읽지 않는다: 뷰가 끝에 닿으면 pageRequested를 보내고,
+      작업 스레드가 읽은 행을 append_rows로 받는다 (GUI 스레드에서 파일을 읽지 않음)
+    - 한 번에 한 페이지만 요청 (응답이 올 때까지 canFetchMore는 False)
+    """
+
+    pageRequested = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._has_more = False
+        self._loading = False
+
+    def reset_rows(self):
+        """조회 조건 변경: 행을 비우고 첫 페이지를 기다리는 상태로"""
+        self.beginResetModel()
+        self._rows = []
+        self._has_more = True
+        self._loading = True   # 첫 페이지는 호출한 쪽이 직접 요청
+        self.endResetModel()
+
+    def append_rows(self, rows, has_more):
+        """작업 스레드가 읽은 한 페이지를 붙인다."""
+        self._loading = False
+        self._has_more = has_more
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def stop_loading(self):
+        """취소/오류: 지금까지 받은 행만 유지하고 더 요청하지 않음"""
+        self._loading = False
+        self._has_more = False
+
+    def is_loading(self):
+        return self._loading
+
+    # ---------------------------------------------------------
+    # lazy fetch
+    # ---------------------------------------------------------
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._loading = True
+        self.pageRequested.emit()
+
+    def memory_structures(self):
+        """메모리 진단용: 이름 → 모델이 보관 중인 데이터"""
+        return {"log_table.rows": self._rows}
+
+    # ---------------------------------------------------------
+    # QAbstractTableModel 구현
+    # ---------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return str(index.row() + 1)
+            return self._rows[index.row()][column - 1]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
@@ -1,11 +1,24 @@
 # ui/mainwindow_view.py
 
-from PySide6.QtWidgets import QMainWindow, QTableWidgetItem, QHeaderView
-from PySide6.QtGui import Qt, QColor
+from PySide6.QtWidgets import QMainWindow, QHeaderView, QMenu, QAbstractItemView, QProgressDialog, QPushButton
+from PySide6.QtGui import Qt, QAction, QKeySequence
+from PySide6.QtCore import QTimer
 from .ui_main_window import Ui_MainWindow
-from modules.message_utils import show_information, show_warning, ask_confirmation
-from modules.calculator import normalize_phone, format_phone
+from .user_table_model import UserTableModel, CHECK_COLUMN
+from .column_widths import ColumnWidthEstimator
+from modules.message_utils import show_information, show_warning, ask_confirmation, show_report
+from modules import perf
 
+# 입력 중 검색: 마지막 입력 후 이 시간(ms)이 지나면 검색 실행
+SEARCH_DEBOUNCE_MS = 150
+# 누적 횟수 최댓값 자릿수로 너비를 정하는 컬럼: 활동 A / 활동 B / 합계
+COUNT_COLUMNS = (2, 3, 4)
+REMAINING_COLUMN = 6
+# 필터 콤보박스 항목 순서: 전체 사용자 / 지급 필요 / 남은 횟수 2회 이하
+FILTER_NEEDS_REWARD = 1
+FILTER_REMAINING_LE_2 = 2
+# 메뉴에 보이지 않는 진단 기능 단축키
+MEMORY_REPORT_SHORTCUT = "Ctrl+Shift+M"
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -14,14 +27,30 @@ class MainWindow(QMainWindow):
         # UI 로드
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
-        # 행 번호 숨기기
-        self.ui.tableWidget.verticalHeader().setVisible(False)
+        # 사용자 테이블 모델 연결 (보이는 셀만 요청 시 계산)
+        self.user_model = UserTableModel(self)
+        table = self.ui.tableUsers
+        table.setModel(self.user_model)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # 행 번호 숨기기 + 행 높이 고정 (행마다 높이 계산 X)
+        table.verticalHeader().setVisible(False)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         # 창 크기 고정
         self.setFixedSize(1173, 700)
+        # 컬럼 너비는 셀을 측정하지 않고 값의 최대 자릿수로 계산 (update_column_widths)
+        self._column_widths = ColumnWidthEstimator(table)
         self.apply_column_ratio()
         # 창 제목 설정
         self.setWindowTitle("사용자 포인트 관리 프로그램")
         
+        # 입력 중 검색용 debounce 타이머 (타이핑이 멈추면 한 번만 검색)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        
+        # 백그라운드 작업 진행 창 (start_progress ~ finish_progress)
+        self._progress = None
+        
     # =========================================================
     # Controller가 명령하는 메서드
     # =========================================================
@@ -32,75 +61,171 @@ class MainWindow(QMainWindow):
         self.ui.btnOpenLog.clicked.connect(controller_instance.open_log_dialog)
         self.ui.btnGivePoints.clicked.connect(controller_instance.handle_reward_click)
         self.ui.btnSearch.clicked.connect(controller_instance.filter_table)
+        self.ui.btnSearch.clicked.connect(self._search_timer.stop)
+        self.ui.searchInput.textChanged.connect(self._on_search_text_changed)
+        self._search_timer.timeout.connect(controller_instance.filter_table)
         self.ui.btnRefresh.clicked.connect(controller_instance.update_dashboard_command)
         self.ui.btnDeleteCustomer.clicked.connect(controller_instance.handle_delete_click)
+        # 필터 / 정렬 (perf.timed로 감싼 슬롯은 인자 수를 알 수 없으므로 시그널 값(int)을 버리고 호출)
+        self.ui.comboFilter.currentIndexChanged.connect(lambda *_: controller_instance.handle_filter_change())
+        self.ui.spinPointsOver.valueChanged.connect(lambda *_: controller_instance.handle_filter_change())
+        header = self.ui.tableUsers.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.sectionClicked.connect(controller_instance.sort_by_column)
+        # 선택: 체크박스 변경은 Controller의 선택 집합에 바로 반영, 일괄 선택은 우클릭 메뉴
+        table = self.ui.tableUsers
+        self.user_model.checkToggled.connect(controller_instance.set_user_selected)
+        table.setContextMenuPolicy(Qt.CustomContextMenu)
+        table.customContextMenuRequested.connect(
+            lambda pos: self._show_selection_menu(controller_instance, pos))
+        # 진단: 메모리 사용량 보고 (숨은 메뉴 동작, 단축키로만 실행)
+        memory_action = QAction("메모리 사용량", self)
+        memory_action.setShortcut(QKeySequence(MEMORY_REPORT_SHORTCUT))
+        memory_action.triggered.connect(controller_instance.show_memory_report)
+        self.addAction(memory_action)
         
     def clear_search_input(self):
         """
         [View의 책임] Controller의 명령을 받아 검색 입력 필드를 초기화
         """
         # self.ui를 통해 검색 입력 위젯에 접근하고 clear() 메서드를 호출
+        # (입력 중 검색이 다시 실행되지 않도록 시그널을 막고 대기 중인 검색도 취소)
+        self._search_timer.stop()
+        self.ui.searchInput.blockSignals(True)
         self.ui.searchInput.clear()
+        self.ui.searchInput.blockSignals(False)
         
-    def get_selected_phones(self):
-        """[View의 책임] 체크된 row의 전화번호 목록을 Controller에게 반환"""
-        table = self.ui.tableWidget
-        selected_phones = []
-        # 테이블을 *직접 조작*하여 데이터를 추출 (View의 책임)
-        for row in range(table.rowCount()):
-            item = table.item(row, 0)
-            if item and item.checkState() == Qt.Checked:
-                phone_display = table.item(row, 1).text()
-                selected_phones.append(normalize_phone(phone_display))
-        return selected_phones
+    def _show_selection_menu(self, controller_instance, pos):
+        """테이블 우클릭 시 일괄 선택 메뉴 표시"""
+        menu = QMenu(self)
+        menu.addAction("검색 결과 전체 선택", controller_instance.select_all_filtered)
+        menu.addAction("지급 대상 전체 선택", controller_instance.select_all_eligible)
+        menu.addAction("선택 반전", controller_instance.invert_selection)
+        menu.addSeparator()
+        menu.addAction("선택 해제", controller_instance.clear_selection)
+        menu.exec(self.ui.tableUsers.viewport().mapToGlobal(pos))
+
+    def set_rows_checked(self, phones, checked):
+        """[Controller 명령 실행] 해당 사용자 행의 체크 상태만 다시 그림 (상태는 Controller 선택 집합)"""
+        self.user_model.refresh_phones(phones, columns=(CHECK_COLUMN, CHECK_COLUMN))
+
+    def show_selection_count(self, count):
+        """[Controller 명령 실행] 상태 표시줄에 선택 인원 표시"""
+        self.ui.statusbar.showMessage(f"선택: {count}명" if count else "")
     
+    def show_stats(self, members, summary):
+        """
+        [Controller 명령 실행] 통계 패널 표시
+
+        Args:
+        members (int): 현재 회원 수
+        summary (dict): HistoryStats.summary() 결과 ({"total"/"today"/"month": 항목별 집계})
+        """
+        total, today, month = summary["total"], summary["today"], summary["month"]
+        self.ui.labelStats.setText(
+            f"회원 {members:,}명  |  누적 이용 {total['visits']:,}회  |  "
+            f"오늘 지급 {today['points']:,}P ({today['rewards']:,}건)  |  "
+            f"이번 달 지급 {month['points']:,}P ({month['rewards']:,}건)  |  "
+            f"오늘 이용 {today['visits']:,}회 · 신규 {today['new_members']:,}명"
+        )
+
+    def set_data_loading(self, loading):
+        """
+        [Controller 명령 실행] 사용자 데이터를 불러오는 동안 데이터가 필요한 조작을 막음
+        (창은 먼저 표시하고 데이터는 작업 스레드에서 읽음)
+        """
+        ui = self.ui
+        for widget in (ui.btnAddCustomer, ui.btnAddUsage, ui.btnGivePoints, ui.btnDeleteCustomer,
+                       ui.btnSearch, ui.btnRefresh, ui.searchInput, ui.comboFilter, ui.spinPointsOver,
+                       ui.tableUsers):
+            widget.setEnabled(not loading)
+        ui.statusbar.showMessage("사용자 데이터를 불러오는 중..." if loading else "")
+
+    def _on_search_text_changed(self, _text):
+        """입력이 바뀔 때마다 debounce 타이머를 다시 시작 (타이핑이 멈추면 검색)"""
+        self._search_timer.start()
+
     def get_search_keyword(self):
         """[View의 책임] 검색 입력창(QLineEdit)의 텍스트를 읽어와 반환"""
         search_input = self.ui.searchInput 
         
         return search_input.text().strip()
         
-    def render_user_list(self, data_list):
-        """
-        [Controller 명령 실행] Controller가 준비한 데이터를 받아 테이블에 표시
-        (Controller가 이 함수를 호출할 때, 테이블 조작 로직이 시작됨)
+    def get_filter_options(self):
+        """[View의 책임] 필터 위젯 상태를 Controller가 쓰는 조건 딕셔너리로 반환"""
+        combo_index = self.ui.comboFilter.currentIndex()
+        points_over = self.ui.spinPointsOver.value()
+        return {
+            "needs_reward": combo_index == FILTER_NEEDS_REWARD,
+            "max_remaining": 2 if combo_index == FILTER_REMAINING_LE_2 else None,
+            # 최소값(-1)은 "포인트 조건 없음"
+            "points_over": points_over if points_over >= 0 else None,
+        }
+
+    def set_sort_indicator(self, column, descending):
+        """[Controller 명령 실행] 헤더에 정렬 방향 표시"""
+        header = self.ui.tableUsers.horizontalHeader()
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(column, Qt.DescendingOrder if descending else Qt.AscendingOrder)
         
-        Args:
-        data_list (List[Dict]): 고객 정보가 담긴 딕셔너리 리스트.
-            각 딕셔너리는 다음 키를 반드시 포함해야 합니다:
+    def set_row_provider(self, row_provider):
+        """
+        [Controller 연결] 전화번호 → 표시용 행 딕셔너리 함수를 테이블 모델에 연결
+
+        row_provider(phone)가 반환하는 딕셔너리는 다음 키를 포함해야 합니다:
             - 'phone': 전화번호 (str)
+            - 'selected': 선택(체크) 여부 (bool)
             - 'activity_1', 'activity_2': 작업 완료 횟수 (int)
             - 'total_counts': 총 횟수 (int)
             - 'reward_needed': 보상 필요 여부 (bool)
             - 'remaining': 잔여 횟수 (int)
             - 'total_points': 총 포인트 (int)
+        """
+        self.user_model.set_row_provider(row_provider)
+
+    @perf.timed("view.update_column_widths")
+    def update_column_widths(self, maxima):
+        """
+        [Controller 명령 실행] 숫자 컬럼 너비를 값의 최댓값 자릿수에 맞춤
+        (계산한 너비는 캐시되어 자릿수가 바뀐 컬럼만 실제로 조정됨)
+        
+        Args:
+        maxima (dict): {"total_counts": 최대 누적 횟수, "remaining": 최대 남은 횟수}
+        """
+        widths = self._column_widths
+        for column in COUNT_COLUMNS:
+            widths.apply_digits(column, maxima["total_counts"])
+        widths.apply_digits(REMAINING_COLUMN, maxima["remaining"])
+
+    @perf.timed("view.render_user_list")
+    def render_user_list(self, phones):
+        """
+        [Controller 명령 실행] Controller가 조회한 사용자 목록을 테이블에 표시
+        
+        Args:
+        phones (List[str]): 표시 순서대로 정렬된 전화번호 목록.
+            셀 값은 화면에 보이는 행만 row_provider로 그때그때 계산됩니다.
     
         Note:
-        테이블을 렌더링하기 전 기존 행(row)은 모두 초기화됩니다.
+        기존 목록은 모두 교체됩니다. (행 수와 무관하게 일정한 비용)
         """
-        table = self.ui.tableWidget
-        table.setRowCount(0) # 기존 행 제거
-        
-        # 1. Controller로부터 받은 데이터를 테이블에 채우는 순수한 View 로직
-        for row_data in data_list:
-            row = table.rowCount()
-            table.insertRow(row)
-            
-            # [View의 책임] QTableWidgetItem 생성 및 스타일링
-            chk_item = QTableWidgetItem()
-            chk_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            chk_item.setCheckState(Qt.Unchecked)
-            
-            reward_item = self._create_styled_item(row_data['reward_needed'])
-
-            table.setItem(row, 0, chk_item) # 체크박스
-            table.setItem(row, 1, self._item(str(format_phone(row_data['phone']))))
-            table.setItem(row, 2, self._item(str(row_data['activity_1'])))
-            table.setItem(row, 3, self._item(str(row_data['activity_2'])))
-            table.setItem(row, 4, self._item(str(row_data['total_counts'])))
-            table.setItem(row, 5, reward_item)
-            table.setItem(row, 6, self._item(str(row_data['remaining'])))
-            table.setItem(row, 7, self._item(str(row_data['total_points'])))
+        self.user_model.set_phones(phones)
+
+    @perf.timed("view.apply_row_changes")
+    def apply_row_changes(self, added=(), updated=(), removed=()):
+        """
+        [Controller 명령 실행] 변경된 사용자 행만 테이블에 반영 (전체 재렌더링 X)
+        스크롤 위치와 다른 행의 체크 상태는 그대로 유지됩니다.
+
+        Args:
+        added (List[str]): 맨 아래에 새로 표시할 전화번호
+        updated (List[str]): 값이 바뀐 전화번호 (화면에 없는 사용자는 무시)
+        removed (Iterable[str]): 테이블에서 제거할 전화번호
+        """
+        model = self.user_model
+        model.refresh_phones(updated)
+        model.remove_phones(removed)
+        model.append_phones(list(added))
             
     def set_reward_button_enabled(self, enabled: bool):
         """
@@ -109,6 +234,52 @@ class MainWindow(QMainWindow):
         """
         self.ui.btnGivePoints.setEnabled(enabled)
         
+    # -------------------------------------------
+    # 백그라운드 작업 진행 창
+    # -------------------------------------------
+    def start_progress(self, title, label, maximum, on_cancel):
+        """
+        [Controller 명령 실행] 작업 진행 창 표시 (modal: 작업 중 메인 창 조작 차단)
+        
+        on_cancel: [취소] 버튼을 누르면 호출할 함수
+        """
+        self.finish_progress()
+        dialog = QProgressDialog(label, "취소", 0, max(1, maximum), self)
+        dialog.setWindowTitle(title)
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(on_cancel)
+        dialog.canceled.connect(lambda: dialog.setLabelText("취소하는 중..."))
+        dialog.setValue(0)
+        dialog.show()
+        self._progress = dialog
+        
+    def update_progress(self, value, maximum):
+        """[Controller 명령 실행] 진행률 갱신"""
+        if self._progress is not None:
+            self._progress.setMaximum(max(1, maximum))
+            self._progress.setValue(value)
+            
+    def set_progress_label(self, label, cancellable=True):
+        """[Controller 명령 실행] 진행 단계 표시 (저장 단계처럼 취소할 수 없으면 취소 버튼 비활성)"""
+        if self._progress is None:
+            return
+        self._progress.setLabelText(label)
+        button = self._progress.findChild(QPushButton)
+        if button is not None:
+            button.setEnabled(cancellable)
+            
+    def finish_progress(self):
+        """[Controller 명령 실행] 진행 창 닫기"""
+        if self._progress is not None:
+            # close()도 canceled를 보내므로 먼저 연결 해제
+            self._progress.canceled.disconnect()
+            self._progress.close()
+            self._progress.deleteLater()
+            self._progress = None
+        
     # -------------------------------------------
     # 메시지 팝업 실행 (view의 책임을 message_utils에 위임)
     # -------------------------------------------
@@ -123,17 +294,25 @@ class MainWindow(QMainWindow):
     def ask_confirmation(self, title, question):
         """확인 질문을 띄우고 응답을 반환"""
         return ask_confirmation(self, title, question)
+
+    def show_report(self, title, text):
+        """표 형식 보고서 팝업 실행 (고정폭 글꼴)"""
+        show_report(self, title, text)
+
+    def memory_structures(self):
+        """메모리 진단용: 이름 → View가 보관 중인 데이터 (테이블 모델)"""
+        return self.user_model.memory_structures()
     
     # ---------------------------------------------------------
     # UI 내부 Helper 메서드 (테이블 스타일링 및 비율 계산)
     # ---------------------------------------------------------  
     def apply_column_ratio(self):
-        table = self.ui.tableWidget
+        table = self.ui.tableUsers
         header = table.horizontalHeader()
         
-        # 모든 컬럼을 내용물 크기에 딱 맞게 줄이기
-        # ResizeToContents를 쓰면 글자 수만큼만 공간을 차지함.
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        # 숫자 컬럼은 값의 최대 자릿수로 계산한 고정 너비 (ResizeToContents처럼 셀마다 측정 X)
+        self._column_widths.set_fixed(COUNT_COLUMNS + (REMAINING_COLUMN,))
+        self.update_column_widths({"total_counts": 0, "remaining": 0})
 
         # 넓게 보여주고 싶은 핵심 컬럼만 Stretch(남은 공간 꽉 채우기)로 설정
         
@@ -147,21 +326,3 @@ class MainWindow(QMainWindow):
         # 체크박스(0번)는 너무 작아지지 않게 약간의 고정폭 주기
         header.setSectionResizeMode(0, QHeaderView.Fixed)
         table.setColumnWidth(0, 40)
-    
-    def _create_styled_item(self, reward_needed):
-        """지급 필요 셀 스타일링 로직 (View의 책임)"""
-        
-        reward_text = "필요" if reward_needed else ""
-        reward_item = self._item(reward_text)
-        
-        if reward_needed:
-            reward_item.setBackground(QColor("#1721D4"))
-            reward_item.setForeground(QColor("#FAF9F7"))
-        return reward_item
-    
-    def _item(self, text):
-        """가운데 정렬 아이템 생성 및 편집 불가능 설정"""
-        item = QTableWidgetItem(text)
-        item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item.setTextAlignment(Qt.AlignCenter)
-        return item
\ No newline at end of file
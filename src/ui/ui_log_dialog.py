@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 ################################################################################
-## Form generated from reading UI file 'log_dialogeAieuT.ui'
+## Form generated from reading UI file 'log_dialog.ui'
 ##
 ## Created by: Qt User Interface Compiler version 6.10.1
 ##
@@ -15,9 +15,10 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QDialog, QHeaderView, QLabel,
-    QPushButton, QSizePolicy, QTableWidget, QTableWidgetItem,
-    QWidget)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDateEdit,
+    QDialog, QHeaderView, QLabel, QLineEdit,
+    QProgressBar, QPushButton, QSizePolicy, QTableView,
+    QTableWidget, QTableWidgetItem, QWidget)
 
 class Ui_LogDialog(object):
     def setupUi(self, LogDialog):
@@ -45,29 +46,98 @@ class Ui_LogDialog(object):
         font1.setPointSize(14)
         font1.setBold(True)
         self.label_5.setFont(font1)
-        self.tableLogs = QTableWidget(LogDialog)
-        if (self.tableLogs.columnCount() < 6):
-            self.tableLogs.setColumnCount(6)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.tableLogs.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.tableLogs.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.tableLogs.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.tableLogs.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.tableLogs.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.tableLogs.setHorizontalHeaderItem(5, __qtablewidgetitem5)
-        self.tableLogs.setObjectName(u"tableLogs")
-        self.tableLogs.setGeometry(QRect(20, 50, 821, 291))
+        self.lineLogPhone = QLineEdit(LogDialog)
+        self.lineLogPhone.setObjectName(u"lineLogPhone")
+        self.lineLogPhone.setGeometry(QRect(20, 50, 171, 31))
         font2 = QFont()
         font2.setFamilies([u"Noto Sans KR"])
-        font2.setPointSize(11)
-        font2.setBold(False)
-        self.tableLogs.setFont(font2)
-        self.tableLogs.setStyleSheet(u"QTableWidget {\n"
+        font2.setPointSize(10)
+        self.lineLogPhone.setFont(font2)
+        self.lineLogPhone.setStyleSheet(u"QLineEdit {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdde1;\n"
+"    border-radius: 6px;\n"
+"    padding: 4px 6px;\n"
+"}\n"
+"\n"
+"QLineEdit:focus {\n"
+"    border: 1px solid #4b7bec;\n"
+"}\n"
+"")
+        self.comboLogType = QComboBox(LogDialog)
+        self.comboLogType.addItem("")
+        self.comboLogType.addItem("")
+        self.comboLogType.addItem("")
+        self.comboLogType.addItem("")
+        self.comboLogType.addItem("")
+        self.comboLogType.addItem("")
+        self.comboLogType.setObjectName(u"comboLogType")
+        self.comboLogType.setGeometry(QRect(200, 50, 151, 31))
+        self.comboLogType.setFont(font2)
+        self.comboLogType.setStyleSheet(u"QComboBox {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdde1;\n"
+"    border-radius: 6px;\n"
+"    padding: 4px 6px;\n"
+"}")
+        self.checkLogDate = QCheckBox(LogDialog)
+        self.checkLogDate.setObjectName(u"checkLogDate")
+        self.checkLogDate.setGeometry(QRect(362, 50, 61, 31))
+        self.checkLogDate.setFont(font2)
+        self.dateLogFrom = QDateEdit(LogDialog)
+        self.dateLogFrom.setObjectName(u"dateLogFrom")
+        self.dateLogFrom.setGeometry(QRect(425, 50, 131, 31))
+        self.dateLogFrom.setFont(font2)
+        self.dateLogFrom.setStyleSheet(u"QDateEdit {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdde1;\n"
+"    border-radius: 6px;\n"
+"    padding: 4px 6px;\n"
+"}")
+        self.dateLogFrom.setCalendarPopup(True)
+        self.dateLogTo = QDateEdit(LogDialog)
+        self.dateLogTo.setObjectName(u"dateLogTo")
+        self.dateLogTo.setGeometry(QRect(565, 50, 131, 31))
+        self.dateLogTo.setFont(font2)
+        self.dateLogTo.setStyleSheet(u"QDateEdit {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdde1;\n"
+"    border-radius: 6px;\n"
+"    padding: 4px 6px;\n"
+"}")
+        self.dateLogTo.setCalendarPopup(True)
+        self.btnLogSearch = QPushButton(LogDialog)
+        self.btnLogSearch.setObjectName(u"btnLogSearch")
+        self.btnLogSearch.setGeometry(QRect(705, 50, 136, 31))
+        font3 = QFont()
+        font3.setFamilies([u"Noto Sans KR"])
+        font3.setPointSize(10)
+        font3.setBold(True)
+        self.btnLogSearch.setFont(font3)
+        self.btnLogSearch.setStyleSheet(u"QPushButton {\n"
+"    background-color: #4b7bec;\n"
+"    color: white;\n"
+"    border-radius: 6px;\n"
+"    padding: 4px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background-color: #3867d6;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: #2d5dc0;\n"
+"}\n"
+"")
+        self.tableLogs = QTableView(LogDialog)
+        self.tableLogs.setObjectName(u"tableLogs")
+        self.tableLogs.setGeometry(QRect(20, 90, 821, 251))
+        font4 = QFont()
+        font4.setFamilies([u"Noto Sans KR"])
+        font4.setPointSize(11)
+        font4.setBold(False)
+        self.tableLogs.setFont(font4)
+        self.tableLogs.setStyleSheet(u"QTableView {\n"
 "    background: white;\n"
 "    border: 1px solid #E0E0E0;\n"
 "    gridline-color: #E0E0E0;\n"
@@ -87,24 +157,45 @@ class Ui_LogDialog(object):
 "    color: #444;\n"
 "}\n"
 "\n"
-"QTableWidget::item {\n"
+"QTableView::item {\n"
 "    padding: 4px;\n"
 "}\n"
 "\n"
 "QWidget#centralwidget {\n"
 "    background-color: #F2F2F2;\n"
 "}")
-        self.tableLogs.setColumnCount(6)
         self.tableLogs.horizontalHeader().setDefaultSectionSize(134)
         self.tableLogs.horizontalHeader().setProperty(u"showSortIndicator", False)
+        self.progressLogs = QProgressBar(LogDialog)
+        self.progressLogs.setObjectName(u"progressLogs")
+        self.progressLogs.setGeometry(QRect(20, 350, 571, 31))
+        self.progressLogs.setFont(font2)
+        self.progressLogs.setValue(0)
+        self.progressLogs.setTextVisible(False)
+        self.btnLogCancel = QPushButton(LogDialog)
+        self.btnLogCancel.setObjectName(u"btnLogCancel")
+        self.btnLogCancel.setGeometry(QRect(600, 350, 111, 31))
+        self.btnLogCancel.setFont(font4)
+        self.btnLogCancel.setStyleSheet(u"QPushButton {\n"
+"    background-color: white;\n"
+"    color: #2f3640;\n"
+"    border: 1px solid #dcdde1;\n"
+"    border-radius: 8px;\n"
+"    padding: 6px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background-color: #f1f2f6;\n"
+"}\n"
+"")
         self.btnClose = QPushButton(LogDialog)
         self.btnClose.setObjectName(u"btnClose")
-        self.btnClose.setGeometry(QRect(20, 350, 821, 31))
-        font3 = QFont()
-        font3.setFamilies([u"Noto Sans KR"])
-        font3.setPointSize(11)
-        font3.setBold(True)
-        self.btnClose.setFont(font3)
+        self.btnClose.setGeometry(QRect(720, 350, 121, 31))
+        font5 = QFont()
+        font5.setFamilies([u"Noto Sans KR"])
+        font5.setPointSize(11)
+        font5.setBold(True)
+        self.btnClose.setFont(font5)
         self.btnClose.setStyleSheet(u"QPushButton {\n"
 "    background-color: #4b7bec;\n"
 "    color: white;\n"
@@ -130,18 +221,19 @@ class Ui_LogDialog(object):
     def retranslateUi(self, LogDialog):
         LogDialog.setWindowTitle(QCoreApplication.translate("LogDialog", u"Dialog", None))
         self.label_5.setText(QCoreApplication.translate("LogDialog", u"\ud3ec\uc778\ud2b8 \uc9c0\uae09 \ub0b4\uc5ed", None))
-        ___qtablewidgetitem = self.tableLogs.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("LogDialog", u"\ubc88\ud638", None));
-        ___qtablewidgetitem1 = self.tableLogs.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("LogDialog", u"\ub0a0\uc9dc / \uc2dc\uac04", None));
-        ___qtablewidgetitem2 = self.tableLogs.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("LogDialog", u"\uc804\ud654\ubc88\ud638", None));
-        ___qtablewidgetitem3 = self.tableLogs.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("LogDialog", u"\ud3ec\uc778\ud2b8", None));
-        ___qtablewidgetitem4 = self.tableLogs.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("LogDialog", u"\ucc98\ub9ac \ub0b4\uc5ed", None));
-        ___qtablewidgetitem5 = self.tableLogs.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("LogDialog", u"\uc9c0\uae09 \uc0ac\uc720", None));
+        self.lineLogPhone.setPlaceholderText(QCoreApplication.translate("LogDialog", u"\uc804\ud654\ubc88\ud638", None))
+        self.comboLogType.setItemText(0, QCoreApplication.translate("LogDialog", u"\uc804\uccb4 \uae30\ub85d", None))
+        self.comboLogType.setItemText(1, QCoreApplication.translate("LogDialog", u"\ud3ec\uc778\ud2b8 \uc9c0\uae09", None))
+        self.comboLogType.setItemText(2, QCoreApplication.translate("LogDialog", u"\uc77c\uad04 \uc9c0\uae09 \uc694\uc57d", None))
+        self.comboLogType.setItemText(3, QCoreApplication.translate("LogDialog", u"\uc0ac\uc6a9\uc790 \uc0ad\uc81c", None))
+        self.comboLogType.setItemText(4, QCoreApplication.translate("LogDialog", u"\uc774\uc6a9 \ucd94\uac00", None))
+        self.comboLogType.setItemText(5, QCoreApplication.translate("LogDialog", u"\ud3ec\uc778\ud2b8 \ubcf4\uc815", None))
+
+        self.checkLogDate.setText(QCoreApplication.translate("LogDialog", u"\uae30\uac04", None))
+        self.dateLogFrom.setDisplayFormat(QCoreApplication.translate("LogDialog", u"yyyy-MM-dd", None))
+        self.dateLogTo.setDisplayFormat(QCoreApplication.translate("LogDialog", u"yyyy-MM-dd", None))
+        self.btnLogSearch.setText(QCoreApplication.translate("LogDialog", u"\uc870\ud68c", None))
+        self.btnLogCancel.setText(QCoreApplication.translate("LogDialog", u"\ucde8\uc18c", None))
         self.btnClose.setText(QCoreApplication.translate("LogDialog", u"\ub2eb\uae30", None))
     # retranslateUi
 
@@ -15,9 +15,10 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QHeaderView, QLabel, QLineEdit,
-    QMainWindow, QMenuBar, QPushButton, QSizePolicy,
-    QStatusBar, QTableWidget, QTableWidgetItem, QWidget)
+from PySide6.QtWidgets import (QApplication, QComboBox, QHeaderView, QLabel,
+    QLineEdit, QMainWindow, QMenuBar, QPushButton,
+    QSizePolicy, QSpinBox, QStatusBar, QTableView,
+    QTableWidget, QTableWidgetItem, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -114,29 +115,41 @@ class Ui_MainWindow(object):
 "    border: 1px solid #4b7bec;\n"
 "}\n"
 "")
-        self.tableWidget = QTableWidget(self.centralwidget)
-        if (self.tableWidget.columnCount() < 8):
-            self.tableWidget.setColumnCount(8)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem5)
-        __qtablewidgetitem6 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem6)
-        __qtablewidgetitem7 = QTableWidgetItem()
-        self.tableWidget.setHorizontalHeaderItem(7, __qtablewidgetitem7)
-        self.tableWidget.setObjectName(u"tableWidget")
-        self.tableWidget.setGeometry(QRect(30, 90, 1121, 471))
-        self.tableWidget.setFont(font2)
-        self.tableWidget.setStyleSheet(u"QTableWidget#tableWidget {\n"
+        self.comboFilter = QComboBox(self.centralwidget)
+        self.comboFilter.addItem("")
+        self.comboFilter.addItem("")
+        self.comboFilter.addItem("")
+        self.comboFilter.setObjectName(u"comboFilter")
+        self.comboFilter.setGeometry(QRect(30, 10, 171, 31))
+        font5 = QFont()
+        font5.setFamilies([u"Noto Sans KR"])
+        font5.setPointSize(10)
+        self.comboFilter.setFont(font5)
+        self.comboFilter.setStyleSheet(u"QComboBox {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdde1;\n"
+"    border-radius: 6px;\n"
+"    padding: 4px 6px;\n"
+"}")
+        self.spinPointsOver = QSpinBox(self.centralwidget)
+        self.spinPointsOver.setObjectName(u"spinPointsOver")
+        self.spinPointsOver.setGeometry(QRect(210, 10, 201, 31))
+        self.spinPointsOver.setFont(font5)
+        self.spinPointsOver.setStyleSheet(u"QSpinBox {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdde1;\n"
+"    border-radius: 6px;\n"
+"    padding: 4px 6px;\n"
+"}")
+        self.spinPointsOver.setMinimum(-1)
+        self.spinPointsOver.setMaximum(100000000)
+        self.spinPointsOver.setSingleStep(1000)
+        self.spinPointsOver.setValue(-1)
+        self.tableUsers = QTableView(self.centralwidget)
+        self.tableUsers.setObjectName(u"tableUsers")
+        self.tableUsers.setGeometry(QRect(30, 90, 1121, 471))
+        self.tableUsers.setFont(font2)
+        self.tableUsers.setStyleSheet(u"QTableView#tableUsers {\n"
 "    background: white;\n"
 "    border: 1px solid #E0E0E0;\n"
 "    gridline-color: #E0E0E0;\n"
@@ -155,20 +168,19 @@ class Ui_MainWindow(object):
 "    color: #444;\n"
 "}\n"
 "\n"
-"QTableWidget::item {\n"
+"QTableView::item {\n"
 "    padding: 4px;\n"
 "}\n"
 "\n"
 "/* \ud3ec\ucee4\uc2a4 \ud14c\ub450\ub9ac \uc81c\uac70 */\n"
-"QTableWidget::item:focus {\n"
+"QTableView::item:focus {\n"
 "    outline: none;\n"
 "    border: none;\n"
 "}")
-        self.tableWidget.setColumnCount(8)
-        self.tableWidget.horizontalHeader().setCascadingSectionResizes(False)
-        self.tableWidget.horizontalHeader().setDefaultSectionSize(138)
-        self.tableWidget.horizontalHeader().setProperty(u"showSortIndicator", False)
-        self.tableWidget.verticalHeader().setVisible(True)
+        self.tableUsers.horizontalHeader().setCascadingSectionResizes(False)
+        self.tableUsers.horizontalHeader().setDefaultSectionSize(138)
+        self.tableUsers.horizontalHeader().setProperty(u"showSortIndicator", False)
+        self.tableUsers.verticalHeader().setVisible(True)
         self.btnGivePoints = QPushButton(self.centralwidget)
         self.btnGivePoints.setObjectName(u"btnGivePoints")
         self.btnGivePoints.setGeometry(QRect(30, 570, 561, 31))
@@ -211,11 +223,11 @@ class Ui_MainWindow(object):
         self.btnRefresh = QPushButton(self.centralwidget)
         self.btnRefresh.setObjectName(u"btnRefresh")
         self.btnRefresh.setGeometry(QRect(1060, 10, 91, 31))
-        font5 = QFont()
-        font5.setFamilies([u"Noto Sans KR"])
-        font5.setPointSize(10)
-        font5.setBold(False)
-        self.btnRefresh.setFont(font5)
+        font6 = QFont()
+        font6.setFamilies([u"Noto Sans KR"])
+        font6.setPointSize(10)
+        font6.setBold(False)
+        self.btnRefresh.setFont(font6)
         self.btnRefresh.setStyleSheet(u"QPushButton#btnRefresh {\n"
 "    background-color: #F5F5F5;\n"
 "    color: #333333;\n"
@@ -249,6 +261,17 @@ class Ui_MainWindow(object):
 "QPushButton:pressed {\n"
 "    background-color: #2d5dc0;\n"
 "}\n"
+"")
+        self.labelStats = QLabel(self.centralwidget)
+        self.labelStats.setObjectName(u"labelStats")
+        self.labelStats.setGeometry(QRect(30, 610, 961, 31))
+        self.labelStats.setFont(font5)
+        self.labelStats.setStyleSheet(u"QLabel {\n"
+"    color: #333333;\n"
+"    background-color: #F1F3F8;\n"
+"    border-radius: 8px;\n"
+"    padding: 0px 12px;\n"
+"}\n"
 "")
         self.btnDeleteCustomer = QPushButton(self.centralwidget)
         self.btnDeleteCustomer.setObjectName(u"btnDeleteCustomer")
@@ -289,26 +312,17 @@ class Ui_MainWindow(object):
         self.btnOpenLog.setText(QCoreApplication.translate("MainWindow", u"\ub85c\uadf8 \ubcf4\uae30", None))
         self.label.setText(QCoreApplication.translate("MainWindow", u"\uc0ac\uc6a9\uc790 \ud3ec\uc778\ud2b8 \uad00\ub9ac \ud504\ub85c\uadf8\ub7a8", None))
         self.searchInput.setPlaceholderText(QCoreApplication.translate("MainWindow", u"\uc804\ud654\ubc88\ud638\ub97c \uc785\ub825\ud574\uc8fc\uc138\uc694", None))
-        ___qtablewidgetitem = self.tableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"\uc120\ud0dd", None));
-        ___qtablewidgetitem1 = self.tableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"\uc804\ud654\ubc88\ud638", None));
-        ___qtablewidgetitem2 = self.tableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"\ud65c\ub3d9 A", None));
-        ___qtablewidgetitem3 = self.tableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"\ud65c\ub3d9 B", None));
-        ___qtablewidgetitem4 = self.tableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"\ud569\uacc4", None));
-        ___qtablewidgetitem5 = self.tableWidget.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"\ud3ec\uc778\ud2b8 \uc9c0\uae09 \ud544\uc694", None));
-        ___qtablewidgetitem6 = self.tableWidget.horizontalHeaderItem(6)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"\ub0a8\uc740 \ud69f\uc218", None));
-        ___qtablewidgetitem7 = self.tableWidget.horizontalHeaderItem(7)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("MainWindow", u"\ucd1d \ud3ec\uc778\ud2b8", None));
+        self.comboFilter.setItemText(0, QCoreApplication.translate("MainWindow", u"\uc804\uccb4 \uc0ac\uc6a9\uc790", None))
+        self.comboFilter.setItemText(1, QCoreApplication.translate("MainWindow", u"\uc9c0\uae09 \ud544\uc694", None))
+        self.comboFilter.setItemText(2, QCoreApplication.translate("MainWindow", u"\ub0a8\uc740 \ud69f\uc218 2\ud68c \uc774\ud558", None))
+
+        self.spinPointsOver.setSpecialValueText(QCoreApplication.translate("MainWindow", u"\ud3ec\uc778\ud2b8 \uc870\uac74 \uc5c6\uc74c", None))
+        self.spinPointsOver.setPrefix(QCoreApplication.translate("MainWindow", u"\ud3ec\uc778\ud2b8 > ", None))
         self.btnGivePoints.setText(QCoreApplication.translate("MainWindow", u"\ud3ec\uc778\ud2b8 \uc9c0\uae09", None))
         self.btnSearch.setText(QCoreApplication.translate("MainWindow", u"\uac80\uc0c9", None))
         self.btnRefresh.setText(QCoreApplication.translate("MainWindow", u"\uc0c8\ub85c \uace0\uce68", None))
         self.btnAddUsage.setText(QCoreApplication.translate("MainWindow", u"\ud65c\ub3d9 \ud69f\uc218 \ucd94\uac00", None))
+        self.labelStats.setText("")
         self.btnDeleteCustomer.setText(QCoreApplication.translate("MainWindow", u"\uc0ac\uc6a9\uc790 \uc0ad\uc81c", None))
     # retranslateUi
 
@@ -17,6 +17,11 @@ class UsageDialog(QDialog):
         self.ui.btnSubmit.clicked.connect(self.handle_submit)
         self.ui.btnCancel.clicked.connect(self.reject)
         
+    def reset(self):
+        """재사용 전 입력값 초기화 (Controller가 인스턴스를 캐시해 다시 엶)"""
+        self.ui.spinLaundry.setValue(0)
+        self.ui.spinDry.setValue(0)
+        self.ui.spinLaundry.setFocus()
     
     def handle_submit(self):
         """
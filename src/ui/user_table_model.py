@@ -0,0 +1,189 @@
+# ui/user_table_model.py
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QColor
+from modules.calculator import format_phone
+
+# 컬럼 순서: 선택 / 전화번호 / 활동 A / 활동 B / 합계 / 포인트 지급 필요 / 남은 횟수 / 총 포인트
+HEADERS = ["선택", "전화번호", "활동 A", "활동 B", "합계", "포인트 지급 필요", "남은 횟수", "총 포인트"]
+VALUE_KEYS = [None, "phone", "activity_1", "activity_2", "total_counts", "reward_needed", "remaining", "total_points"]
+CHECK_COLUMN = 0
+REWARD_COLUMN = 5
+
+REWARD_BACKGROUND = QColor("#1721D4")
+REWARD_FOREGROUND = QColor("#FAF9F7")
+
+
+class UserTableModel(QAbstractTableModel):
+    """
+    메인 사용자 테이블 모델 (화면에 보이는 셀만 요청 시 계산)
+
+    - 모델은 표시할 전화번호 목록만 보관하고, 셀 값은 row_provider(phone)로 그때그때 만든다
+    - 체크 상태/지급 필요 스타일은 data role로 제공 (QTableWidgetItem 생성 X)
+    - 체크박스 변경은 checkToggled(phone, checked) 시그널로 Controller에 전달
+    """
+
+    checkToggled = Signal(str, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._phones = []
+        self._owns_phones = True     # False면 호출한 쪽 목록을 그대로 보는 중 (바꾸기 전에 복사)
+        self._row_of = None          # 전화번호 → 행 번호 (행 단위 갱신 시에만 생성)
+        self._row_provider = None
+        self._cached = (None, None)  # (phone, row_data) 같은 행의 여러 셀 요청용
+
+    # ---------------------------------------------------------
+    # Controller 데이터 연결 및 갱신
+    # ---------------------------------------------------------
+    def set_row_provider(self, row_provider):
+        """전화번호 → 표시용 행 딕셔너리 함수 연결 (Controller._build_display_row)"""
+        self._row_provider = row_provider
+        self._cached = (None, None)
+
+    def set_phones(self, phones):
+        """
+        표시할 전화번호 목록 전체 교체 (O(1): 행 데이터는 만들지 않음)
+        받은 목록은 검색 결과 캐시 등과 공유될 수 있으므로 행 추가/삭제 전에 복사한다.
+        """
+        self.beginResetModel()
+        if isinstance(phones, list):
+            self._phones, self._owns_phones = phones, False
+        else:
+            self._phones, self._owns_phones = list(phones), True
+        self._row_of = None
+        self._cached = (None, None)
+        self.endResetModel()
+
+    def phones(self):
+        return self._phones
+
+    def _own_phones(self):
+        """행 추가/삭제 전: 공유 중인 목록이면 복사본으로 바꿈 (처음 한 번만)"""
+        if not self._owns_phones:
+            self._phones = list(self._phones)
+            self._owns_phones = True
+
+    def _rows_by_phone(self):
+        if self._row_of is None:
+            self._row_of = {phone: row for row, phone in enumerate(self._phones)}
+        return self._row_of
+
+    def refresh_phones(self, phones, columns=None):
+        """해당 사용자 행(또는 지정 컬럼)만 다시 그리도록 알림"""
+        row_of = self._rows_by_phone()
+        rows = [row_of[phone] for phone in phones if phone in row_of]
+        if not rows:
+            return
+        self._cached = (None, None)
+        first_col, last_col = columns if columns else (0, len(HEADERS) - 1)
+        # 연속 구간이 아니어도 한 번의 dataChanged로 묶음 (뷰는 보이는 셀만 다시 그림)
+        self.dataChanged.emit(self.index(min(rows), first_col), self.index(max(rows), last_col))
+
+    def append_phones(self, phones):
+        if not phones:
+            return
+        self._own_phones()
+        start = len(self._phones)
+        self.beginInsertRows(QModelIndex(), start, start + len(phones) - 1)
+        self._phones.extend(phones)
+        if self._row_of is not None:
+            for offset, phone in enumerate(phones):
+                self._row_of[phone] = start + offset
+        self.endInsertRows()
+
+    def remove_phones(self, phones):
+        """
+        해당 사용자 행 제거 (연속 구간마다 한 번씩 알림)
+
+        - 모델을 리셋하지 않으므로 스크롤 위치 / 현재 행 / 선택 상태가 유지됨
+        - 아래 구간부터 지워야 위쪽 행 번호가 유지됨
+        """
+        row_of = self._rows_by_phone()
+        rows = sorted((row_of[phone] for phone in phones if phone in row_of), reverse=True)
+        if not rows:
+            return
+        self._own_phones()
+        self._cached = (None, None)
+        last = first = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == first - 1:
+                first = row
+                continue
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._phones[first:last + 1]
+            self.endRemoveRows()
+            if row is not None:
+                last = first = row
+        self._row_of = None
+
+    def memory_structures(self):
+        """메모리 진단용: 이름 → 모델이 보관 중인 데이터"""
+        return {"user_table.phones": self._phones, "user_table.row_of": self._row_of}
+
+    # ---------------------------------------------------------
+    # QAbstractTableModel 구현
+    # ---------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._phones)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == CHECK_COLUMN:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def _row_data(self, row):
+        phone = self._phones[row]
+        cached_phone, cached = self._cached
+        if cached_phone != phone:
+            cached = self._row_provider(phone)
+            self._cached = (phone, cached)
+        return cached
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        row_data = self._row_data(index.row())
+
+        if role == Qt.DisplayRole:
+            if column == CHECK_COLUMN:
+                return None
+            if column == 1:
+                return format_phone(row_data["phone"])
+            if column == REWARD_COLUMN:
+                return "필요" if row_data["reward_needed"] else ""
+            return str(row_data[VALUE_KEYS[column]])
+        if role == Qt.CheckStateRole and column == CHECK_COLUMN:
+            return Qt.Checked if row_data.get("selected") else Qt.Unchecked
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if column == REWARD_COLUMN and row_data["reward_needed"]:
+            if role == Qt.BackgroundRole:
+                return REWARD_BACKGROUND
+            if role == Qt.ForegroundRole:
+                return REWARD_FOREGROUND
+        if role == Qt.UserRole:
+            return row_data["phone"]   # 원본 전화번호
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or index.column() != CHECK_COLUMN:
+            return False
+        phone = self._phones[index.row()]
+        checked = Qt.CheckState(value) == Qt.Checked
+        # 선택 집합은 Controller가 보관 → 갱신 후 행 데이터를 다시 읽도록 캐시 무효화
+        self.checkToggled.emit(phone, checked)
+        self._cached = (None, None)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
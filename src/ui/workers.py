@@ -0,0 +1,200 @@
+# ui/workers.py
+"""
+GUI 스레드를 막지 않기 위한 백그라운드 작업(QRunnable)을 모아 둔다.
+결과는 시그널로 GUI 스레드에 전달되며, 작업마다 threading.Event로 취소할 수 있다.
+"""
+
+import logging
+import threading
+from itertools import islice
+from PySide6.QtCore import QObject, QRunnable, Signal
+from modules.history_index import get_history_index
+from modules.projection import get_user_projection
+from modules.rewards import compute_reward_batch, commit_reward_batch
+from modules.search_index import PhoneSearchIndex
+from modules.snapshot import load_snapshot, write_snapshot
+from modules.stats import get_history_stats
+from modules.user_query import UserIndexes
+from .log_table_model import PAGE_SIZE, to_log_row
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryPageSignals(QObject):
+    """HistoryPageTask → GUI 스레드 시그널 (generation으로 이전 조회 결과를 구분)"""
+    # generation, 현재 값, 최대 값 (최대 값 0이면 진행률을 알 수 없음)
+    progress = Signal(int, int, int)
+    # generation, source iterator, 표시용 행 목록, 더 읽을 기록이 있는지
+    pageLoaded = Signal(int, object, list, bool)
+    # generation, 오류 메시지
+    failed = Signal(int, str)
+
+
+class HistoryPageTask(QRunnable):
+    """
+    로그 한 페이지를 작업 스레드에서 읽는다.
+
+    - source가 없으면 히스토리 인덱스를 불러오고/따라잡은 뒤 조회 조건으로 source를 만든다
+    - source에서 PAGE_SIZE건을 읽어 표시용 행으로 변환한 뒤 pageLoaded로 전달
+    - cancel()되면 결과를 보내지 않고 끝낸다 (인덱스는 그때까지 반영한 부분 유지)
+    """
+
+    def __init__(self, generation, log_filter=None, source=None, page_size=PAGE_SIZE):
+        super().__init__()
+        self.generation = generation
+        self.log_filter = log_filter
+        self.source = source
+        self.page_size = page_size
+        self.signals = HistoryPageSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def _report_progress(self, done, total):
+        self.signals.progress.emit(self.generation, done // 1024, max(1, total // 1024))
+
+    def run(self):
+        try:
+            source = self.source
+            if source is None:
+                index = get_history_index(self._report_progress, self._cancel)
+                source = index.query(self.log_filter, self._report_progress, self._cancel)
+                # 인덱스 준비 이후 조건에 맞는 기록을 찾는 동안은 진행률을 알 수 없음
+                self.signals.progress.emit(self.generation, 0, 0)
+            if self._cancel.is_set():
+                return
+
+            rows = []
+            for _, log in islice(source, self.page_size):
+                if self._cancel.is_set():
+                    return
+                rows.append(to_log_row(log))
+            self.signals.pageLoaded.emit(self.generation, source, rows, len(rows) == self.page_size)
+        except Exception as e:
+            logger.exception("History page load failed: generation=%d", self.generation)
+            self.signals.failed.emit(self.generation, str(e))
+
+
+class RewardBatchSignals(QObject):
+    """RewardBatchTask → GUI 스레드 시그널"""
+    # 처리한 사용자 수, 전체 사용자 수
+    progress = Signal(int, int)
+    # 계산이 끝나고 저장을 시작함 (이후에는 취소 불가)
+    committing = Signal()
+    # RewardBatchResult (저장 완료), 새로 만든 정렬 인덱스 (index_factory가 없으면 None)
+    finished = Signal(object, object)
+    # RewardBatchResult (계산 도중 취소, 아무것도 저장하지 않음)
+    cancelled = Signal(object)
+    # 오류 메시지 (기록 실패 시 아무것도 기록되지 않음)
+    failed = Signal(str)
+
+
+class RewardBatchTask(QRunnable):
+    """
+    포인트 일괄 지급을 작업 스레드에서 실행한다.
+
+    - 계산은 사용자 데이터 복사본으로 (cancel()되면 다음 사용자 전에 중단, 변경 없음)
+    - 저장은 지급 이벤트를 로그에 한 번에 추가 (modules.rewards.commit_reward_batch),
+      기록에 성공하면 지급 결과가 공유 사용자 상태(= Controller.users)에 바로 반영됨
+    - 실행 중에는 호출한 쪽이 users를 바꾸지 않아야 한다 (진행 창을 modal로 띄움)
+    - index_factory가 있으면 저장된 전체 데이터로 정렬 인덱스도 작업 스레드에서 새로 만든다
+      (대량 지급 후 GUI 스레드에서 사용자마다 인덱스를 갱신하지 않도록)
+    """
+
+    def __init__(self, users, phones, batch_entry, points, counts_for_reward, index_factory=None):
+        super().__init__()
+        self.users = users
+        self.phones = phones
+        self.batch_entry = batch_entry
+        self.points = points
+        self.counts_for_reward = counts_for_reward
+        self.index_factory = index_factory
+        self.signals = RewardBatchSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        try:
+            result = compute_reward_batch(
+                self.users, self.phones,
+                points=self.points,
+                counts_for_reward=self.counts_for_reward,
+                progress=self.signals.progress.emit,
+                cancel=self._cancel,
+            )
+            if result.cancelled:
+                logger.info("Reward batch canceled: computed=%d/%d", len(result.updated), len(self.phones))
+                self.signals.cancelled.emit(result)
+                return
+            self.signals.committing.emit()
+            users = commit_reward_batch(result, self.batch_entry)
+            # 지급 로그를 통계 집계에 미리 반영 (GUI 스레드에서 대량 로그를 읽지 않도록)
+            get_history_stats().refresh()
+            indexes = self.index_factory(users) if self.index_factory is not None else None
+            self.signals.finished.emit(result, indexes)
+        except Exception as e:
+            logger.exception("Reward batch failed: phones=%d", len(self.phones))
+            self.signals.failed.emit(str(e))
+
+
+class DataLoadSignals(QObject):
+    """DataLoadTask → GUI 스레드 시그널"""
+    # DashboardSnapshot (유효한 스냅샷이 있을 때만, 실제 데이터보다 먼저)
+    snapshotLoaded = Signal(object)
+    # 사용자 데이터, PhoneSearchIndex, UserIndexes,
+    # 스냅샷과 값이 다른 전화번호 목록 (스냅샷이 없거나 표시 순서가 다르면 None)
+    loaded = Signal(object, object, object, object)
+    # 오류 메시지
+    failed = Signal(str)
+
+
+class DataLoadTask(QRunnable):
+    """
+    앱 시작 시 사용자 데이터 준비를 작업 스레드에서 실행한다. (창을 먼저 띄우기 위해)
+
+    - prepare: 파일 생성/마이그레이션 등 로드 전에 할 일 (없으면 생략)
+    - use_snapshot이면 대시보드 스냅샷을 먼저 읽어 snapshotLoaded로 전달 (읽기 전용 첫 화면)
+    - 사용자 상태 로드(체크포인트 + 이후 이벤트 재생) + 통계 집계 준비 + 검색/정렬 인덱스 생성 + 스냅샷과의 차이 계산까지 끝낸 뒤 loaded로 전달
+    """
+
+    def __init__(self, prepare=None, use_snapshot=True):
+        super().__init__()
+        self.prepare = prepare
+        self.use_snapshot = use_snapshot
+        self.signals = DataLoadSignals()
+
+    def run(self):
+        try:
+            if self.prepare is not None:
+                self.prepare()
+            snapshot = load_snapshot() if self.use_snapshot else None
+            if snapshot is not None:
+                self.signals.snapshotLoaded.emit(snapshot)
+            users = get_user_projection().users
+            get_history_stats()   # 통계 집계 불러오기/따라잡기 (없으면 로그 전체에서 생성)
+            search_index = PhoneSearchIndex(users)
+            user_indexes = UserIndexes(users)
+            changed = snapshot.changed_phones(users) if snapshot is not None else None
+            self.signals.loaded.emit(users, search_index, user_indexes, changed)
+        except Exception as e:
+            logger.exception("User data load failed")
+            self.signals.failed.emit(str(e))
+
+
+class SnapshotWriteTask(QRunnable):
+    """대시보드 스냅샷 행 계산 + 파일 쓰기 (원시 값은 GUI 스레드에서 미리 뽑아 전달)"""
+
+    def __init__(self, values, source):
+        super().__init__()
+        self.values = values
+        self.source = source
+
+    def run(self):
+        try:
+            write_snapshot(self.values, self.source)
+        except Exception:
+            # 보조 파일이므로 실패해도 다음 기회에 다시 씀
+            logger.exception("Dashboard snapshot write failed")
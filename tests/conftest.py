@@ -0,0 +1,35 @@
+# tests/conftest.py
+"""
+테스트 공통 설정
+
+- 앱 모듈은 import 시점에 데이터 경로를 정하므로 먼저 임시 폴더(CPM_DATA_DIR)로 지정
+- 테스트마다 data 폴더를 비우고 공유 사용자 상태(get_user_projection)를 초기화
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_BASE = Path(tempfile.mkdtemp(prefix="cpm-test-"))
+os.environ["CPM_DATA_DIR"] = str(_BASE)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from modules import projection, storage  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def data_dir():
+    shutil.rmtree(storage.DATA_DIR, ignore_errors=True)
+    storage.init_dirs()
+    storage.ensure_files_exist()
+    projection._user_projection = None
+    yield storage.DATA_DIR
+    projection._user_projection = None
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_BASE, ignore_errors=True)
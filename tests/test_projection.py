@@ -0,0 +1,169 @@
+# tests/test_projection.py
+"""사용자 상태 = 체크포인트 + 이후 이벤트 재생 (modules.projection)"""
+
+import json
+
+import pytest
+
+from modules import projection, storage
+from modules.calculator import add_usage
+from modules.projection import CHECKPOINT_FILE, UserProjection, apply_event
+from modules.rewards import compute_reward_batch
+
+A, B, C = "01011112222", "01033334444", "01055556666"
+
+
+def _loaded(checkpoint_every=10 ** 6) -> UserProjection:
+    p = UserProjection(checkpoint_every=checkpoint_every)
+    p.load()
+    return p
+
+
+def _usage(p, phone, a1=1, a2=0):
+    is_new = phone not in p.users
+    single = {} if is_new else {phone: dict(p.users[phone])}
+    add_usage(single, phone, a1, a2)
+    p.append([{"type": "usage", "phone": phone, "activity_1": a1, "activity_2": a2, "new_user": is_new}],
+             changed=single)
+
+
+def _reward(p, phone):
+    result = compute_reward_batch(p.users, [phone])
+    assert result.updated
+    p.append(result.entries, changed=result.updated)
+
+
+def _delete(p, phones):
+    p.append([{"type": "delete_users", "deleted_count": len(phones), "phones": phones}], removed=phones)
+
+
+def _checkpoint_upto() -> int:
+    return json.loads(CHECKPOINT_FILE.read_text(encoding="utf-8"))["indexed_upto"]
+
+
+# ---------------------------------------------------------
+# 이벤트 반영
+# ---------------------------------------------------------
+def test_apply_event_points_adjust_and_skips():
+    users = {A: {"activity_1": 0, "activity_2": 0, "total_points": 6000}}
+    assert apply_event(users, {"type": "points_adjust", "phone": A, "points_before": 6000, "points_after": 2000})
+    assert users[A]["total_points"] == 2000
+    # 전화번호 없는 이전 형식 삭제 / 없는 사용자 지급 / 요약 기록은 상태를 바꾸지 않음
+    assert not apply_event(users, {"type": "delete_users", "deleted_count": 1})
+    assert not apply_event(users, {"type": "reward", "phone": B, "points": 2000})
+    assert not apply_event(users, {"type": "reward_batch", "selected": 1})
+    assert users == {A: {"activity_1": 0, "activity_2": 0, "total_points": 2000}}
+
+
+# ---------------------------------------------------------
+# 체크포인트 이후 재생
+# ---------------------------------------------------------
+def test_replay_after_checkpoint_matches_live_state():
+    p = _loaded()
+    for phone in (A, B, C):
+        _usage(p, phone, a1=7, a2=4)
+    _reward(p, A)
+    p.save()
+    upto = p.indexed_upto
+    assert _checkpoint_upto() == upto
+
+    # 체크포인트 이후: 지급 / 삭제 / 삭제한 번호 재등록
+    _reward(p, C)
+    _delete(p, [B])
+    _usage(p, B, a1=2)
+    _usage(p, A)
+
+    q = _loaded()
+    assert q.users == p.users
+    assert list(q.users) == list(p.users)
+    assert q.replayed == 4              # 체크포인트 이후 이벤트만 재생
+    assert q.indexed_upto == p.indexed_upto > upto
+    assert q.users[B] == {"activity_1": 2, "activity_2": 0, "total_points": 0}
+
+
+def test_checkpoint_every_events_updates_users_json():
+    p = _loaded(checkpoint_every=3)
+    _usage(p, A)
+    _usage(p, B)
+    assert _checkpoint_upto() == 0
+    _usage(p, C)
+    assert _checkpoint_upto() == p.indexed_upto
+    assert p.pending == 0
+    assert storage.load_users() == p.users
+
+
+def test_failed_append_leaves_state_unchanged(monkeypatch):
+    p = _loaded()
+    _usage(p, A, a1=3)
+    before, upto = {k: dict(v) for k, v in p.users.items()}, p.indexed_upto
+
+    def fail(entries):
+        raise OSError("disk full")
+    monkeypatch.setattr(projection, "append_history_span", fail)
+    with pytest.raises(OSError):
+        _usage(p, A)
+    with pytest.raises(OSError):
+        _delete(p, [A])
+    assert p.users == before
+    assert p.indexed_upto == upto
+
+
+def test_shared_dict_survives_reset():
+    p = _loaded()
+    shared = p.users
+    _usage(p, A)
+    p.reset({B: {"activity_1": 1, "activity_2": 0, "total_points": 0}})
+    assert p.users is shared
+    assert list(shared) == [B]
+
+
+# ---------------------------------------------------------
+# 다른 곳에서 로그 추가 (stale)
+# ---------------------------------------------------------
+def test_other_writer_marks_stale_and_next_load_replays_both():
+    first, second = _loaded(), _loaded()
+    _usage(first, A)
+    _usage(second, B)
+
+    assert not first.stale
+    assert second.stale
+    assert B in second.users            # 이번 실행의 메모리에는 반영
+    second.save()
+    assert _checkpoint_upto() == 0      # stale이면 체크포인트를 쓰지 않음
+
+    q = _loaded()
+    assert set(q.users) == {A, B}
+    assert q.replayed == 2
+
+
+# ---------------------------------------------------------
+# 로그 교체 / 축소 후 다시 시작
+# ---------------------------------------------------------
+@pytest.mark.parametrize("change", ["shortened", "replaced"])
+def test_restart_from_users_json_after_history_rewritten(change):
+    p = _loaded()
+    for phone in (A, B, C):
+        _usage(p, phone, a1=5)
+    p.save()
+
+    lines = storage.HISTORY_FILE.read_bytes().splitlines(keepends=True)
+    if change == "shortened":
+        storage.HISTORY_FILE.write_bytes(lines[0])
+    else:
+        other = [json.dumps({"type": "usage", "phone": "01077778888", "activity_1": i + 1, "activity_2": 0,
+                             "new_user": i == 0}).encode() + b"\n" for i in range(len(lines) + 2)]
+        storage.HISTORY_FILE.write_bytes(b"".join(other))
+    expected = {"01099990000": {"activity_1": 4, "activity_2": 0, "total_points": 2000}}
+    storage.save_users(expected)
+
+    q = _loaded()
+    assert q.users == expected
+    assert q.replayed == 0
+    assert q.indexed_upto == storage.HISTORY_FILE.stat().st_size
+    assert _checkpoint_upto() == q.indexed_upto
+
+    # 새 시작점 이후 기록은 다음 시작 때 재생
+    _usage(q, A)
+    r = _loaded()
+    assert r.users == q.users
+    assert r.replayed == 1
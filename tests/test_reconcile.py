@@ -0,0 +1,114 @@
+# tests/test_reconcile.py
+"""로그 지급 합계: 구간을 나눠 합친 결과 = 처음부터 순서대로 읽은 결과 (modules.reconcile)"""
+
+import json
+import random
+
+import pytest
+
+from modules import reconcile
+from modules.reconcile import _merge, history_point_sums, scan_range, split_ranges
+
+PHONES = [f"010{n:08d}" for n in range(12)]
+
+
+def _write_history(path, seed=7, count=3000):
+    """지급 / 삭제(전화번호 포함·이전 형식) / 보정 / 이용 / 손상 줄이 섞인 로그"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.45:
+            entry = {"type": "reward", "phone": rng.choice(PHONES), "points": rng.choice((1000, 2000)),
+                     "count_before": 10, "count_after": 0}
+        elif roll < 0.5:
+            entry = {"phone": rng.choice(PHONES), "points": 2000}     # type 없는 이전 지급 기록
+        elif roll < 0.55:
+            entry = {"type": "delete_users", "deleted_count": 2, "phones": rng.sample(PHONES, 2)}
+        elif roll < 0.57:
+            entry = {"type": "delete_users", "deleted_count": 1}
+        elif roll < 0.62:
+            entry = {"type": "points_adjust", "phone": rng.choice(PHONES),
+                     "points_before": 0, "points_after": rng.randrange(0, 10000, 1000)}
+        elif roll < 0.63:
+            lines.append('{"type": "reward", "points": 20')           # 기록 중 끊긴 줄
+            continue
+        else:
+            entry = {"type": "usage", "phone": rng.choice(PHONES), "activity_1": 1, "activity_2": 0}
+        lines.append(json.dumps(entry, ensure_ascii=False))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _sequential_sums(path):
+    """비교 기준: 한 줄씩 순서대로 적용 (바이트 검사 / 구간 나누기 없이)"""
+    sums = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        entry_type = entry.get("type", "reward")
+        if entry_type == "reward" and entry.get("phone"):
+            points, count = sums.get(entry["phone"], (0, 0))
+            sums[entry["phone"]] = [points + entry["points"], count + 1]
+        elif entry_type == "delete_users":
+            for phone in entry.get("phones") or ():
+                sums[phone] = [0, 0]
+        elif entry_type == "points_adjust":
+            sums[entry["phone"]] = [entry["points_after"], 0]
+    return sums
+
+
+@pytest.fixture
+def history(tmp_path):
+    return _write_history(tmp_path / "history.jsonl")
+
+
+def test_split_ranges_are_contiguous_and_line_aligned(history):
+    data = history.read_bytes()
+    for parts in (1, 2, 3, 7, 16, 1000):
+        ranges = split_ranges(history, len(data), parts)
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        assert all(prev[1] == cur[0] for prev, cur in zip(ranges, ranges[1:]))
+        assert all(data[start - 1:start] == b"\n" for start, _ in ranges[1:])
+        assert len(ranges) <= parts
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 5, 16, 64])
+def test_split_merge_matches_sequential_pass(history, parts):
+    end = history.stat().st_size
+    total = {}
+    for start, stop in split_ranges(history, end, parts):
+        _merge(total, scan_range(str(history), start, stop)[0])
+    assert total == _sequential_sums(history)
+
+
+def test_history_point_sums_counts_match_single_pass(history, monkeypatch):
+    end = history.stat().st_size
+    single = reconcile.ReconcileResult()
+    expected = history_point_sums(history, end, workers=1, result=single)
+    assert expected == _sequential_sums(history)
+    assert single.corrupt_lines > 0 and single.legacy_deletes > 0
+
+    monkeypatch.setattr(reconcile, "PARALLEL_MIN_BYTES", 0)
+    pooled = reconcile.ReconcileResult()
+    assert history_point_sums(history, end, workers=3, result=pooled) == expected
+    assert pooled.workers == 3
+    for name in ("history_lines", "corrupt_lines", "reward_entries", "legacy_deletes"):
+        assert getattr(pooled, name) == getattr(single, name)
+
+
+def test_reconcile_points_reports_mismatch(history):
+    expected = _sequential_sums(history)
+    users = {phone: {"activity_1": 0, "activity_2": 0, "total_points": points}
+             for phone, (points, _) in expected.items()}
+    wrong = next(iter(users))
+    users[wrong]["total_points"] += 1000
+
+    result = reconcile.reconcile_points(users, history, history.stat().st_size, workers=1)
+    assert [(item.phone, item.diff) for item in result.mismatches] == [(wrong, 1000)]
+    changed, entries = reconcile.adjustment_entries(users, result, "test", "test")
+    assert changed[wrong]["total_points"] == expected[wrong][0]
+    assert users[wrong]["total_points"] == expected[wrong][0] + 1000     # 원본은 그대로
+    assert entries[0]["points_after"] == expected[wrong][0]